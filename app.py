@@ -1,158 +1,37 @@
 # -*- coding: utf-8 -*-
 import os
-import base64
-from pathlib import Path
+import time
 
 import pandas as pd
 import streamlit as st
-import json
 from dotenv import load_dotenv
 
 # visualization
 import altair as alt
 import streamlit as st
-from streamlit_folium import st_folium
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
 # components
-from components.channel_cards import render_channel_comparison_sections
 from components.extra_panel import render_extra_panel
-from components.region_map import render_selected_item_region_map
 from components.season_selector import render_season_selector
+from components.main_page import render_main_page
 from components.eco_panel import render_eco_page
-
-# price
-from components.price_cards import render_price_drop_cards, render_price_rise_cards
-from components.price_graph import render_price_region_donut
-
-# season
-from components.season_cards import (
-    render_region_price_comparison,
-    render_region_all_items_chart,
-)
-from components.season_map import create_season_price_map
+from components.dist_page import render_dist_page
+from components.page_style import load_css
+from components.perf_panel import render_perf_page
 
 # data & queries
-from data.queries.channel_queries import get_channel_comparison_query
+from data.cache_warmer import start_cache_warmer
 from data.connection import get_database_connection
-from data.queries.meta_queries import get_update_status_query
-from data.queries.price_queries import (
-    get_country_list,
-    get_price_drop_top3_query,
-    get_price_rise_top3_query,
-    get_price_region_rate_query,
-)
-from data.queries.season_queries import (
-    get_season,
-    get_season_item_list,
-    get_season_region_price_query,
-    get_region_all_items_price_query,
-)
-
-
-def load_css():
-    def get_base64_of_bin_file(bin_file):
-        with open(bin_file, 'rb') as f:
-            data = f.read()
-        return base64.b64encode(data).decode()
-    
-    font_files = {
-        "PureunJeonnam": "assets/fonts/PureunJeonnam.ttf",
-        "PureunJeonnam-Medium": "assets/fonts/PureunJeonnam-Medium.ttf",
-        "PureunJeonnam-Bold": "assets/fonts/PureunJeonnam-Bold.ttf",
-        "ChangwonDangam": "assets/fonts/ChangwonDangamRound.ttf", 
-        "ChangwonDangam-OTF": "assets/fonts/ChangwonDangamRound.otf",
-        "ChangwonDangamAsac": "assets/fonts/ChangwonDangamAsac-Bold.ttf",
-        "BusanFont": "assets/fonts/BusanFont_Provisional.ttf"
-    }
-
-    try:
-        font_css = f"""
-        <style>
-        /* === 폰트 정의 (Base64) === */
-        
-        /* 1. 푸른전남 정의 */
-        @font-face {{
-            font-family: 'PureunJeonnam';
-            src: url(data:font/ttf;charset=utf-8;base64,{get_base64_of_bin_file(font_files['PureunJeonnam'])}) format('truetype');
-            font-weight: 400;
-        }}
-        @font-face {{
-            font-family: 'PureunJeonnam';
-            src: url(data:font/ttf;charset=utf-8;base64,{get_base64_of_bin_file(font_files['PureunJeonnam-Medium'])}) format('truetype');
-            font-weight: 500;
-        }}
-        @font-face {{
-            font-family: 'PureunJeonnam';
-            src: url(data:font/ttf;charset=utf-8;base64,{get_base64_of_bin_file(font_files['PureunJeonnam-Bold'])}) format('truetype');
-            font-weight: 700;
-        }}
-
-        /* 2. 창원단감 정의 (TTF 우선 사용) */
-        @font-face {{
-            font-family: 'ChangwonDangam';
-            src: url(data:font/ttf;charset=utf-8;base64,{get_base64_of_bin_file(font_files['ChangwonDangam'])}) format('truetype');
-            font-weight: 500;
-        }}
-        
-        /* 2-1. 창원단감 OTF 정의 (필요시 'ChangwonDangamOTF'로 사용 가능) */
-        @font-face {{
-            font-family: 'ChangwonDangamOTF';
-            src: url(data:font/opentype;charset=utf-8;base64,{get_base64_of_bin_file(font_files['ChangwonDangam-OTF'])}) format('opentype');
-            font-weight: 500;
-        }}
-
-        /* 3. 창원단감 아삭 정의 */
-        @font-face {{
-            font-family: 'ChangwonDangamAsac';
-            src: url(data:font/ttf;charset=utf-8;base64,{get_base64_of_bin_file(font_files['ChangwonDangamAsac'])}) format('truetype');
-            font-weight: 500;
-        }}
-
-        /* 4. 부산체 정의 */
-        @font-face {{
-            font-family: 'BusanFont';
-            src: url(data:font/ttf;charset=utf-8;base64,{get_base64_of_bin_file(font_files['BusanFont'])}) format('truetype');
-            font-weight: 400;
-        }}
-
-        /* === 폰트 적용 규칙 === */
-        
-        /* 전체 본문: 푸른전남 */
-        html, body, [data-testid="stAppViewContainer"] {{
-            font-family: 'PureunJeonnam', sans-serif !important;
-        }}
-
-        /* 제목 (H1~H3): 창원단감 */
-        h1, h2, h3 {{
-            font-family: 'ChangwonDangam', sans-serif !important;
-        }}
-
-        /* 숫자/강조: 창원단감 아삭 */
-        div[data-testid="stMetricValue"], .callout-title {{
-            font-family: 'ChangwonDangamAsac', sans-serif !important;
-        }}
-        
-        /* 콜아웃 박스 본문 */
-        .callout {{
-            font-family: 'PureunJeonnam', sans-serif !important;
-        }}
-        </style>
-        """
-        # 생성된 폰트 CSS 주입
-        st.markdown(font_css, unsafe_allow_html=True)
-
-    except FileNotFoundError as e:
-        st.error(f"폰트 파일을 찾을 수 없습니다. 경로를 확인해주세요: {e}")
-
-    base_path = Path(__file__).parent
-    with open(base_path / "styles.css", encoding="utf-8") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+from data.telemetry import start_metrics_server, telemetry
 
 
 # 초기 설정
+# 페이지 렌더링(스크립트 실행) 시간 측정 시작
+render_start = time.perf_counter()
+
 st.set_page_config(page_title="농산물 가격 대시보드", layout="wide")
 load_css()
 
@@ -170,14 +49,17 @@ popular_items = []
 if "page" not in st.session_state:
     st.session_state.page = "main"
 
+# Prometheus 메트릭 서버 (METRICS_PORT 설정 시, 프로세스당 한 번만 시작)
+start_metrics_server()
+
 connection = os.getenv("DB_CONNECTION", "athena")
 conn = get_database_connection(
-    connection
+    connection,
+    use_cache=os.getenv("QUERY_CACHE_ENABLED", "true").lower() == "true",
 )  # 여기서 rds와 athena 중 하나를 선택할 수 있도록 해야함
 
-# 메타 정보 조회
-status_df = conn.execute_query(get_update_status_query(conn=conn))
-update_status = status_df.iloc[0]
+# 새 데이터 버전이 게시되면 화면 쿼리 결과를 미리 캐시에 채움 (프로세스당 한 번만 시작)
+start_cache_warmer(conn)
 
 # 세션 상태 초기화
 if "show_region_map" not in st.session_state:
@@ -202,6 +84,9 @@ with st.sidebar:
     if st.button("🏪 유통업체별 정보", use_container_width=True):
         st.session_state.page = "dist"
 
+    if st.button("⚙️ 성능 진단", use_container_width=True):
+        st.session_state.page = "perf"
+
     # st.divider()
 
     # st.caption("필터 영역 (추후 추가)")
@@ -209,233 +94,9 @@ with st.sidebar:
 # -------------------------
 # 메인 콘텐츠
 # -------------------------
+# 페이지는 헤더/패널/지도 단위 fragment로 나뉘어 있어, 위젯 조작 시 해당 구역만 다시 실행됨
 if st.session_state.page == "main":
-    # -------------------------
-    # header
-    # -------------------------
-    header_container = st.container()
-    with header_container:
-        header_left, header_right = st.columns([3, 2])
-        with header_left:
-            st.title("오늘의 지역별 농산물 가격 동향 한눈에 보기")
-        with header_right:
-            m1, m2, m3 = st.columns(3)
-            m1.metric(label="📅 최신 업데이트", value=str(update_status["latest_date"]))
-            m2.metric(
-                label="📦 업데이트 품목 수",
-                value=f"{int(update_status['row_count']):,}",
-            )
-            m3.metric(
-                label="🌍 업데이트 지역 수", value=int(update_status["country_count"])
-            )
-    st.divider()
-
-    # -------------------------
-    # [part 1: price] sub-title
-    # -------------------------
-    st.subheader("🌱 오늘 눈여겨볼 만한 식재료들")
-    st.markdown(
-        """
-    <div class="callout">
-        <div class="callout-title">💡 어떻게 보면 좋을까요?</div>
-        지역을 선택하면 <b>전일 대비 가격 변동이 가장 큰</b> 농수산물 TOP 3를 확인할 수 있어요.<br>
-        이를 통해 오늘 해당 지역의 <b>이상 가격 징후</b>가 있는 품목을 빠르게 파악할 수 있습니다.<br>
-        해당 지역에서 전체 품목 중 <b>상승·하락·유지 비율</b>을 도넛 차트를 통해 한눈에 볼 수 있습니다.
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
-
-    # -------------------------
-    # [part 1: price] 지역 선택
-    # -------------------------
-    country_list_df = get_country_list(conn)
-    country_list = (
-        country_list_df["country_nm"].drop_duplicates().sort_values().tolist()
-    )
-
-    if "country" not in st.session_state:
-        if "서울" in country_list:
-            st.session_state.country = "서울"
-        else:
-            st.session_state.country = country_list[0]
-
-    country = st.selectbox("지역 선택", country_list, key="country")
-    # st.markdown(f"선택된 지역: **{country}**")  # 선택 확인용
-
-    c1, c2, c3 = st.columns(3)
-
-    # -------------------------
-    # [part 1: price] charts
-    # -------------------------
-    with c1:
-        st.subheader("📉 전일 대비 가격 하락 TOP 3")
-        drop_query = get_price_drop_top3_query(country_filter=country, conn=conn)
-        print(drop_query)  # debug
-        cheep_df = conn.execute_query(drop_query)
-        render_price_drop_cards(cheep_df)
-
-    with c2:
-        st.subheader("📈 전일 대비 가격 상승 TOP 3")
-        rise_query = get_price_rise_top3_query(
-            country_filter=country, conn=conn
-        )  # , limit=3)
-        rise_df = conn.execute_query(rise_query)
-        render_price_rise_cards(rise_df)
-
-    with c3:
-        st.subheader("📊 상승/하락/유지 품목 비율")
-        summary_query = get_price_region_rate_query(country_filter=country, conn=conn)
-        summary_df = conn.execute_query(summary_query)
-        render_price_region_donut(summary_df, country)
-
-    st.divider()
-
-    # --------------------------
-    # [PART 2: season] sub-title
-    # --------------------------
-    season_nm_query = get_season(conn=conn)
-    season_nm = conn.execute_query(season_nm_query)
-
-    season = season_nm["season"].iloc[0]
-    st.markdown(
-        f"""
-        <h3>❄️ <span style="color:#1f77b4">{season}</span> 제철 식자재 가격 지도 톺아보기</h3>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    st.markdown(
-        """
-        <div class="callout">
-            <div class="callout-title">🧭 이렇게 활용해보세요</div>
-            💡 제철 식자재 가격을 지역별로 살펴보세요.<br><br>
-            <b>현재 월을 기준</b>으로 해당 제철의 식자재 리스트를 확인할 수 있습니다<br>
-            제철 농수산물을 선택하면 <b>지역별 가격 수준</b>을 색상으로 확인할 수 있어요.<br><br>
-            특정 지역을 클릭하면
-            <ul>
-                <li>해당 지역의 <b>전년 동일 대비 가격 변화</b>를 확인할 수 있어요.</li>
-                <li>해당 지역의 <b>다른 제철 농수산물 가격</b> 현황도 함께 확인할 수 있어요.</li>
-            </ul>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    # -----------------------------
-    # [PART 2: season] select item
-    # -----------------------------
-    item_query = get_season_item_list(conn=conn)
-    item_df = conn.execute_query(item_query)
-    item_list = item_df["item_kind"].dropna().tolist()
-
-    if not item_list:
-        st.warning("선택 가능한 제철 품목이 없습니다.")
-        st.stop()
-
-    if "selected_item" not in st.session_state:
-        st.session_state.selected_item = item_list[0]
-
-    bottom_left, bottom_right = st.columns([1, 1])
-
-    with bottom_left:
-        #        st.subheader("🔎 필터")
-        selected_item_kind = st.selectbox(
-            f"{season} 제철 농수산물 선택",
-            item_list,
-            index=item_list.index(st.session_state.selected_item),
-            key="selected_item",
-        )
-
-    # -----------------------------
-    # [PART 2: season] query to df
-    # -----------------------------
-    season_query = get_season_region_price_query(
-        item_kind_filter=selected_item_kind, conn=conn
-    )
-    season_df = conn.execute_query(season_query)
-
-    # 디버깅용 저장
-    season_df.to_csv("season_df_debug.csv", index=False, encoding="utf-8-sig")
-
-    if season_df.empty:
-        st.error("제철 데이터가 없습니다.")
-        st.stop()
-
-    # 결측치 처리
-    season_df["prev_1y_pr"] = season_df["prev_1y_pr"].fillna(0)
-    season_df["base_pr"] = season_df["base_pr"].fillna(0)
-
-    # ---------------------------
-    # [PART 2: season] geo json
-    # ---------------------------
-    @st.cache_resource
-    def load_geojson():
-        path = Path("assets/retail_regions.json")
-        with path.open(encoding="utf-8") as f:
-            return json.load(f)
-
-    merged_geojson = load_geojson()
-    season_map = create_season_price_map(
-        merged_geojson, season_df, season_df, selected_item_kind
-    )
-
-    with bottom_left:
-        unit = None
-        if "product_cls_unit" in season_df.columns:
-            unit_row = season_df.loc[
-                season_df["item_kind"] == selected_item_kind, "product_cls_unit"
-            ]
-            if not unit_row.empty:
-                unit = unit_row.iloc[0]
-
-        if unit:
-            st.markdown(
-                f"<h4>🗺️ <span style='color:#0095fa'>{selected_item_kind}({unit})</span> 지역별 가격 분포</h4>",
-                unsafe_allow_html=True,
-            )
-        else:
-            st.markdown(
-                f"<h4>🗺️ <span style='color:#0095fa'>{selected_item_kind}</span> 지역별 가격 분포</h4>",
-                unsafe_allow_html=True,
-            )
-
-        _map_state = st_folium(
-            season_map,
-            width=1000,
-            height=650,
-            key="season_map",
-            returned_objects=["last_active_drawing"],
-        )
-
-    # ----------------------------
-    # [PART 2: season] bar charts
-    # ----------------------------
-    clicked_region = None
-    if _map_state and _map_state.get("last_active_drawing"):
-        clicked_region = _map_state["last_active_drawing"]["properties"]["CITY_AB_NM"]
-
-    # 기본값 설정
-    if not clicked_region:
-        clicked_region = "서울"
-
-    with bottom_right:
-        if clicked_region:
-            region_df = season_df[season_df["country_nm"] == clicked_region]
-            render_region_price_comparison(
-                region_df, clicked_region, selected_item_kind
-            )
-
-        region_all_query = get_region_all_items_price_query(clicked_region, conn=conn)
-        region_all_df = conn.execute_query(region_all_query)
-        render_region_all_items_chart(region_all_df, clicked_region)
-
-    # -------------------------
-    # 우측 영역 (추가 기능)
-    # -------------------------
-    # with right:
-    #     render_extra_panel()
-
+    render_main_page(conn)
 
 # =================================================
 # 친환경 페이지
@@ -447,191 +108,13 @@ elif st.session_state.page == "eco":
 # 유통업체 페이지
 # =================================================
 elif st.session_state.page == "dist":
-    # -------------------------
-    # header
-    # -------------------------
-    header_container = st.container()
-    with header_container:
-        header_left, header_right = st.columns([3, 2])
-        with header_left:
-            st.title("유통업체별 농수산물 가격 비교 한눈에 보기")
-        with header_right:
-            # 유통업체 데이터를 먼저 조회하여 메타 정보 표시
-            try:
-                # 전체 카테고리로 최신 데이터 조회
-                temp_query = get_channel_comparison_query(
-                    category_filter="전체",
-                    limit=None,
-                    conn=conn,
-                )
-                df_temp = conn.execute_query(temp_query)
-
-                if len(df_temp) > 0:
-                    latest_date = (
-                        df_temp["조회일자"].iloc[0]
-                        if "조회일자" in df_temp.columns
-                        else "N/A"
-                    )
-                    unique_items = (
-                        df_temp["item_nm"].nunique()
-                        if "item_nm" in df_temp.columns
-                        else 0
-                    )
-                    total_comparisons = len(df_temp)
-                else:
-                    latest_date = "N/A"
-                    unique_items = 0
-                    total_comparisons = 0
-            except Exception:
-                latest_date = "N/A"
-                unique_items = 0
-                total_comparisons = 0
-
-            m1, m2, m3 = st.columns(3)
-            m1.metric(label="📅 최신 데이터", value=str(latest_date))
-            m2.metric(
-                label="📦 비교 품목 수",
-                value=f"{unique_items:,}개",
-            )
-            m3.metric(label="🔍 비교 항목 수", value=f"{total_comparisons:,}개")
-    st.divider()
-
-    # -------------------------
-    # [part 1: channel comparison] sub-title
-    # -------------------------
-    st.subheader("🏪 유통 vs 전통시장 가격 비교")
-    st.markdown(
-        """
-        <div class="callout">
-            <div class="callout-title">💡 어떻게 보면 좋을까요?</div>
-            <b>유통</b>과 <b>전통시장</b>의 가격을 비교해보세요.<br>
-            카테고리를 선택하면 해당 카테고리의 <b>유통 vs 전통 가격 비교</b>를 확인할 수 있어요.<br>
-            요약 통계를 통해 <b>평균 가격 차이</b>를 한눈에 파악할 수 있습니다.<br><br>
-            각 품목별로
-            <ul>
-                <li><b>유통과 전통의 가격 차이</b>를 확인하여 어디서 구매하는 것이 유리한지 비교해보세요.</li>
-                <li>특정 품목을 선택하면 <b>지역별 가격 지도</b>를 통해 지역별 가격 분포를 확인할 수 있어요.</li>
-            </ul>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    try:
-        # 카테고리 필터
-        category_filter = st.selectbox(
-            "카테고리 선택",
-            [
-                "전체",
-                "식량작물",
-                "채소류",
-                "특용작물",
-                "과일류",
-                "축산물",
-                "수산물",
-            ],
-            key="dist_category",
-        )
-
-        # 유통 vs 전통 비교 쿼리 생성
-        comparison_query = get_channel_comparison_query(
-            category_filter=category_filter,
-            limit=None,
-            conn=conn,
-        )
-
-        # 카테고리 필터가 변경되었거나 세션 상태에 데이터가 없으면 쿼리 실행
-        should_query = (
-            "df_comparison" not in st.session_state
-            or st.session_state.get("query_category_filter") != category_filter
-        )
-
-        if should_query:
-            with st.spinner("데이터를 불러오는 중..."):
-                try:
-                    df_comparison = conn.execute_query(comparison_query)
-
-                    if len(df_comparison) > 0:
-                        # 세션 상태에 쿼리 결과 저장
-                        st.session_state.df_comparison = df_comparison
-                        st.session_state.query_category_filter = category_filter
+    render_dist_page(conn)
 
-                        # 요약 통계
-                        st.subheader("📈 요약 통계")
-                        summary_col1, summary_col2, summary_col3 = st.columns(3)
-
-                        with summary_col1:
-                            avg_yutong = df_comparison["유통_평균가격"].mean()
-                            st.metric("유통 평균 가격", f"{avg_yutong:,.0f}원")
-
-                        with summary_col2:
-                            avg_jeontong = df_comparison["전통_평균가격"].mean()
-                            st.metric("전통 평균 가격", f"{avg_jeontong:,.0f}원")
-
-                        with summary_col3:
-                            avg_diff = df_comparison["가격차이"].mean()
-                            st.metric("평균 가격 차이", f"{avg_diff:,.0f}원")
-
-                        st.divider()
-
-                        render_channel_comparison_sections(df_comparison)
-
-                        # 선택된 품목이 있으면 지역별 지도 표시
-                        render_selected_item_region_map(
-                            conn=conn,
-                            date_filter=st.session_state.get("query_date_filter"),
-                            category_filter=st.session_state.get(
-                                "query_category_filter"
-                            ),
-                        )
-                    else:
-                        st.info("조회된 데이터가 없습니다.")
-
-                except Exception as e:
-                    st.error(f"데이터 조회 중 오류 발생: {str(e)}")
-                    st.info("💡 Athena 연결 설정을 확인하세요.")
-        else:
-            # 이전에 조회한 데이터가 있고 필터가 변경되지 않은 경우
-            df_comparison = st.session_state.df_comparison
-
-            # 요약 통계
-            st.subheader("📈 요약 통계")
-            summary_col1, summary_col2, summary_col3 = st.columns(3)
-
-            with summary_col1:
-                avg_yutong = df_comparison["유통_평균가격"].mean()
-                st.metric("유통 평균 가격", f"{avg_yutong:,.0f}원")
-
-            with summary_col2:
-                avg_jeontong = df_comparison["전통_평균가격"].mean()
-                st.metric("전통 평균 가격", f"{avg_jeontong:,.0f}원")
-
-            with summary_col3:
-                avg_diff = df_comparison["가격차이"].mean()
-                st.metric("평균 가격 차이", f"{avg_diff:,.0f}원")
-
-            st.divider()
-
-            render_channel_comparison_sections(df_comparison)
-
-            # 선택된 품목이 있으면 지역별 지도 표시
-            render_selected_item_region_map(
-                conn=conn,
-                date_filter=st.session_state.get("query_date_filter"),
-                category_filter=st.session_state.get("query_category_filter"),
-            )
-
-    except Exception as e:
-        st.error(f"연결 오류: {str(e)}")
-
-# # 사이드바 하단에 연결 정보 표시
-# with st.sidebar:
-#     st.markdown("---")
-#     st.markdown("### 연결 정보")
+# =================================================
+# 성능 진단 페이지
+# =================================================
+elif st.session_state.page == "perf":
+    render_perf_page(conn)
 
-#     # 현재 페이지에 따라 다른 연결 정보 표시
-#     st.info(f"""
-#     **{conn.__class__.__name__} 설정:**
-#     - Database: {conn.get_config()[0]}
-#     - WorkGroup: {conn.get_config()[1]}
-#     """)
+# 페이지 렌더링 시간 기록 (성능 진단 페이지 / Prometheus)
+telemetry.record_page(st.session_state.page, time.perf_counter() - render_start)
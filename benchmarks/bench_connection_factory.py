@@ -0,0 +1,74 @@
+"""재실행(rerun)당 연결 생성 비용 벤치마크
+
+기존처럼 재실행마다 연결 객체를 새로 만드는 경우(boto3 클라이언트 / SQLAlchemy 엔진 생성)와
+get_database_connection이 프로세스 전역 공유 객체를 돌려주는 경우를 비교합니다.
+네트워크 호출 없이 객체 생성 비용만 측정합니다.
+
+실행:
+    uv run python -m benchmarks.bench_connection_factory
+"""
+
+import os
+import time
+
+from data.athena_connection import AthenaConnection
+from data.connection import get_database_connection
+from data.rds_connection import RDSConnection
+
+RERUNS = 20
+
+
+def fresh_athena():
+    """기존 방식: 재실행마다 새 AthenaConnection + boto3 클라이언트"""
+    AthenaConnection()._get_client()
+
+
+def fresh_rds():
+    """기존 방식: 재실행마다 새 RDSConnection + SQLAlchemy 엔진"""
+    RDSConnection()._get_engine()
+
+
+def shared(db_type: str):
+    """새 방식: 프로세스 전역 공유 연결 객체"""
+    conn = get_database_connection(db_type)
+    if db_type == "athena":
+        conn._get_client()
+    else:
+        conn._get_engine()
+
+
+def per_rerun_ms(func) -> float:
+    """RERUNS회 호출했을 때 1회 평균 시간(ms)을 반환합니다."""
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        func()
+    return (time.perf_counter() - start) / RERUNS * 1000
+
+
+def main():
+    # 자격 증명 조회로 인한 네트워크 지연을 피하기 위한 더미 값
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+    os.environ.setdefault("RDS_HOST", "localhost")
+
+    print(f"{'backend':>8} | {'fresh (ms/rerun)':>16} | {'shared (ms/rerun)':>17} | {'saved':>8}")
+    print("-" * 60)
+    cases = [("athena", fresh_athena)]
+    try:
+        import psycopg2  # noqa: F401
+
+        cases.append(("rds", fresh_rds))
+    except ImportError:
+        print("(psycopg2 미설치: rds 측정 생략)")
+
+    for db_type, fresh in cases:
+        fresh_ms = per_rerun_ms(fresh)
+        shared_ms = per_rerun_ms(lambda: shared(db_type))
+        print(
+            f"{db_type:>8} | {fresh_ms:>16.2f} | {shared_ms:>17.3f} | "
+            f"{fresh_ms - shared_ms:>6.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Athena 결과 타입 디코딩 마이크로 벤치마크
+
+기존 행 단위 try/except 변환 루프와 ColumnInfo 기반 컬럼 단위 디코더를
+합성 결과 페이지(1만/10만 행)에 대해 비교합니다.
+
+실행:
+    uv run python -m benchmarks.bench_result_decoding
+"""
+
+import random
+import time
+
+import pandas as pd
+
+from data.result_decoder import decode_result_rows
+
+COLUMN_INFO = [
+    {"Name": "country_nm", "Type": "varchar"},
+    {"Name": "item_nm", "Type": "varchar"},
+    {"Name": "base_dt", "Type": "date"},
+    {"Name": "base_pr", "Type": "decimal"},
+    {"Name": "prev_1y_pr", "Type": "double"},
+    {"Name": "record_count", "Type": "bigint"},
+]
+
+
+def make_rows(n_rows: int, null_ratio: float = 0.05, seed: int = 42) -> list[dict]:
+    """get_query_results 형식의 합성 행을 생성합니다 (헤더 행 제외)."""
+    rng = random.Random(seed)
+    regions = ["서울", "부산", "대구", "광주", "대전", "울산", "수원", "청주"]
+    items = ["사과", "배", "배추", "무", "양파", "대파", "감자", "고구마"]
+
+    def cell(value):
+        return {} if rng.random() < null_ratio else {"VarCharValue": value}
+
+    return [
+        {
+            "Data": [
+                {"VarCharValue": rng.choice(regions)},
+                {"VarCharValue": rng.choice(items)},
+                {"VarCharValue": f"2025-01-{rng.randint(1, 28):02d}"},
+                cell(f"{rng.uniform(500, 50000):.2f}"),
+                cell(f"{rng.uniform(500, 50000):.1f}"),
+                cell(str(rng.randint(1, 500))),
+            ]
+        }
+        for _ in range(n_rows)
+    ]
+
+
+def legacy_decode(column_info: list[dict], rows: list[dict]) -> pd.DataFrame:
+    """기존 AthenaConnection의 셀 단위 타입 추정 루프"""
+    columns = [col["Name"] for col in column_info]
+    parsed = []
+    for row in rows:
+        row_data = []
+        for col in row["Data"]:
+            value = col.get("VarCharValue", "")
+            try:
+                if "." in value:
+                    row_data.append(float(value))
+                else:
+                    row_data.append(int(value))
+            except (ValueError, TypeError):
+                row_data.append(value)
+        parsed.append(row_data)
+    return pd.DataFrame(parsed, columns=columns)
+
+
+def best_of(func, repeat: int = 5) -> float:
+    """repeat번 실행한 중 가장 빠른 시간(초)을 반환합니다."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print(f"{'rows':>8} | {'legacy (ms)':>12} | {'decoder (ms)':>12} | {'speedup':>7}")
+    print("-" * 50)
+    for n_rows in (10_000, 100_000):
+        rows = make_rows(n_rows)
+        legacy = best_of(lambda: legacy_decode(COLUMN_INFO, rows))
+        decoder = best_of(lambda: decode_result_rows(COLUMN_INFO, rows))
+        print(
+            f"{n_rows:>8,} | {legacy * 1000:>12.1f} | {decoder * 1000:>12.1f} | "
+            f"{legacy / decoder:>6.1f}x"
+        )
+
+    sample = decode_result_rows(COLUMN_INFO, make_rows(5))
+    print("\n디코더 결과 dtype:")
+    print(sample.dtypes.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 import streamlit as st
 import pandas as pd
 
+from components.page_fragment import rerun_fragment
+
 
 def render_channel_comparison_header(title: str, gradient_colors: str):
     """채널 비교 섹션 헤더를 렌더링합니다.
@@ -104,7 +106,8 @@ def render_price_comparison_card(
         st.session_state.selected_item_nm = item_nm
         st.session_state.selected_kind_nm = kind_nm
         st.session_state.show_region_map = True
-        st.rerun()
+        # 카드는 유통 페이지의 채널 비교 fragment 안에 있으므로 그 구역만 다시 실행
+        rerun_fragment()
 
 
 def render_yutong_cheaper_section(df_comparison: pd.DataFrame):
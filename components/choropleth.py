@@ -0,0 +1,277 @@
+"""권역별 단계구분도(choropleth) 컴포넌트
+
+권역 geometry는 scripts/simplify_geometry.py가 확대 수준(zoom)별로 미리 단순화해 둔
+파일 중 지도의 최대 확대 수준에 맞는 것을 골라, 프로세스당 한 번만 읽고
+모든 지도가 읽기 전용으로 공유합니다.
+지도를 만들 때는 geometry를 복사하지 않고 그대로 참조하는 새 Feature 목록에
+지역별 값(툴팁에 표시할 속성 테이블)만 붙여, 하나의 GeoJson 레이어와
+그 속성에 연결된 GeoJsonTooltip으로 그립니다.
+"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import branca.colormap as cm
+import folium
+import pandas as pd
+import streamlit as st
+from folium import Element
+from folium.features import GeoJsonTooltip
+
+BASE_PATH = Path(__file__).resolve().parent.parent
+REGION_GEOJSON = BASE_PATH / "assets" / "retail_regions.json"
+# scripts/simplify_geometry.py가 생성하는 확대 수준별 단순화 geometry
+GEOMETRY_DIR = BASE_PATH / "assets" / "geometry"
+LOD_ZOOMS = (6, 7, 8)
+
+# 권역 이름 속성 (st_folium 클릭 결과에서도 이 속성으로 지역을 찾음)
+REGION_KEY = "CITY_AB_NM"
+REGION_ALIAS = "지역"
+MISSING_TEXT = "데이터 없음"
+
+# 낮은 가격 → 높은 가격 (Blue→Red)
+COLORS = ["#2c7bb6", "#abd9e9", "#fdae61", "#d7191c"]
+
+MAP_OPTIONS = {
+    "location": [35.5, 129.5],
+    "zoom_start": 7,
+    "min_zoom": 7,
+    "max_zoom": 8,
+    "tiles": "Esri.WorldGrayCanvas",
+}
+
+# 단순화 파일이 없을 때 원본 좌표의 소수점 자릿수
+# (0.001° ≈ 110m, 최대 확대(zoom 8)에서 1픽셀 ≈ 500m보다 충분히 작음)
+COORDINATE_PRECISION = 3
+
+EMPTY_STYLE = {
+    "fillColor": "#eeeeee",
+    "color": "#cccccc",
+    "weight": 0.5,
+    "fillOpacity": 0.3,
+}
+
+
+def _round_ring(ring: list) -> list:
+    """링 좌표를 반올림하고 반올림 후 겹치는 연속 점을 제거합니다."""
+    rounded = [
+        [round(x, COORDINATE_PRECISION), round(y, COORDINATE_PRECISION)] for x, y, *_ in ring
+    ]
+    deduped = [point for i, point in enumerate(rounded) if i == 0 or point != rounded[i - 1]]
+    # 닫힌 링은 최소 4개 점이 필요
+    return deduped if len(deduped) >= 4 else rounded
+
+
+def _round_geometry(geometry: dict) -> dict:
+    """Polygon/MultiPolygon 좌표를 COORDINATE_PRECISION 자리로 반올림합니다."""
+    if geometry["type"] == "Polygon":
+        coordinates = [_round_ring(ring) for ring in geometry["coordinates"]]
+    elif geometry["type"] == "MultiPolygon":
+        coordinates = [
+            [_round_ring(ring) for ring in polygon] for polygon in geometry["coordinates"]
+        ]
+    else:
+        return geometry
+    return {"type": geometry["type"], "coordinates": coordinates}
+
+
+def lod_path(zoom: int) -> Path:
+    """zoom 수준용 단순화 geometry 파일 경로"""
+    return GEOMETRY_DIR / f"retail_regions.z{zoom}.geojson"
+
+
+def select_lod(max_zoom: int) -> Optional[int]:
+    """최대 확대 수준에서도 단순화가 보이지 않는 가장 거친 LOD를 고릅니다.
+
+    Args:
+        max_zoom: 지도의 최대 확대 수준
+
+    Returns:
+        Optional[int]: 사용할 LOD zoom (max_zoom 이상인 LOD 파일이 없으면 None = 원본 사용)
+    """
+    for zoom in sorted(LOD_ZOOMS):
+        if zoom >= max_zoom and lod_path(zoom).exists():
+            return zoom
+    return None
+
+
+def map_lod() -> Optional[int]:
+    """단계구분도가 사용하는 LOD (MAP_OPTIONS의 최대 확대 수준 기준, 렌더링 캐시 키에 포함)"""
+    return select_lod(MAP_OPTIONS["max_zoom"])
+
+
+@st.cache_resource
+def load_region_geojson(lod: Optional[int] = None) -> dict:
+    """권역 GeoJSON을 읽습니다.
+
+    프로세스당 LOD별로 한 번만 실행되며 결과는 모든 세션이 공유하므로 수정하지 마세요.
+    lod가 None이면 원본을 읽어 좌표를 COORDINATE_PRECISION 자리로 반올림합니다.
+
+    Args:
+        lod: 단순화 geometry의 zoom 수준 (select_lod 결과)
+
+    Returns:
+        dict: 권역 GeoJSON (FeatureCollection)
+    """
+    if lod is not None:
+        with lod_path(lod).open(encoding="utf-8") as f:
+            return json.load(f)
+
+    with REGION_GEOJSON.open(encoding="utf-8") as f:
+        geojson = json.load(f)
+    for feature in geojson["features"]:
+        feature["geometry"] = _round_geometry(feature["geometry"])
+    return geojson
+
+
+def _legend(title: str, vmin: float, vmax: float) -> Element:
+    """지도 오른쪽 아래에 표시할 세로 컬러바 범례를 생성합니다."""
+    return Element(f"""
+    <div style="
+        position: fixed;
+        bottom: 20px;
+        right: 20px;
+        z-index: 9999;
+        background: rgba(255,255,255,0.9);
+        padding: 10px 14px;
+        border-radius: 6px;
+        box-shadow: 0 2px 6px rgba(0,0,0,0.2);
+        font-size: 12px;
+    ">
+
+        <!-- 제목 -->
+        <div style="
+            text-align:right;
+            margin-bottom:6px;
+            color: #000;
+        ">
+            <b>{title}</br>가격 (원)</b>
+        </div>
+
+        <!-- 범례 본체 -->
+        <div style="position: relative; height: 160px;">
+
+            <!-- max 값 (왼쪽) -->
+            <div style="
+                position: absolute;
+                top: -2px;
+                right: 26px;
+                white-space: nowrap;
+                color: {COLORS[-1]};
+            ">
+                {vmax:,.0f}
+            </div>
+
+            <!-- min 값 (왼쪽) -->
+            <div style="
+                position: absolute;
+                bottom: -2px;
+                right: 26px;
+                white-space: nowrap;
+                color: {COLORS[0]};
+            ">
+                {vmin:,.0f}
+            </div>
+
+            <!-- 컬러바 -->
+            <div style="
+                position: absolute;
+                right: 0;
+                width: 18px;
+                height: 160px;
+                background: linear-gradient(
+                    to top,
+                    {", ".join(COLORS)}
+                );
+            "></div>
+
+        </div>
+    </div>
+    """)
+
+
+def format_price(value) -> str:
+    """가격을 "1,234원" 형식으로 변환합니다 (결측이면 "데이터 없음")."""
+    if value is None or pd.isna(value):
+        return MISSING_TEXT
+    return f"{int(value):,}원"
+
+
+def build_choropleth(
+    values: pd.Series,
+    tooltip_table: pd.DataFrame,
+    legend_title: Optional[str] = None,
+) -> folium.Map:
+    """지역별 값을 색으로 표시한 단계구분도를 생성합니다.
+
+    geometry는 지도의 최대 확대 수준(MAP_OPTIONS["max_zoom"])에 맞는 LOD를 캐시에서
+    그대로 참조하고 (복사/수정하지 않음), Feature마다 지역 이름과 tooltip_table의
+    해당 행만 속성으로 붙입니다. 값이 없는 지역은 회색으로 그리고 툴팁에는
+    "데이터 없음"을 표시합니다.
+
+    Args:
+        values: 지역 이름을 인덱스로 하는 색상 기준 값
+        tooltip_table: 지역 이름을 인덱스로 하는 툴팁 표 (컬럼명이 툴팁 항목명, 값은 표시 문자열)
+        legend_title: 범례 제목 (없으면 "가격")
+
+    Returns:
+        folium.Map: 지도 객체
+    """
+    m = folium.Map(**MAP_OPTIONS)
+    geojson_data = load_region_geojson(map_lod())
+
+    # 키 정규화: 문자열/공백 통일
+    values = values.dropna()
+    values.index = values.index.astype(str).str.strip()
+    values = values.groupby(level=0).first()
+    if values.empty:
+        return m
+
+    tooltip_table = tooltip_table.copy()
+    tooltip_table.index = tooltip_table.index.astype(str).str.strip()
+    tooltip_table = tooltip_table[~tooltip_table.index.duplicated()]
+    rows = tooltip_table.to_dict("index")
+    fields = list(tooltip_table.columns)
+
+    vmin = values.min()
+    vmax = values.max()
+    colormap = cm.LinearColormap(colors=COLORS, vmin=vmin, vmax=vmax)
+    fill_colors = {region: colormap(value) for region, value in values.items()}
+
+    m.get_root().html.add_child(_legend(legend_title or "가격", vmin, vmax))
+
+    features = []
+    for feat in geojson_data["features"]:
+        region = str(feat["properties"].get(REGION_KEY, "")).strip()
+        row = rows.get(region) if region in fill_colors else None
+        properties = {REGION_KEY: region}
+        properties.update(row or dict.fromkeys(fields, MISSING_TEXT))
+        features.append({
+            "type": "Feature",
+            "geometry": feat["geometry"],
+            "properties": properties,
+        })
+
+    def style_function(feature):
+        region = feature["properties"][REGION_KEY]
+        if region not in fill_colors:
+            return EMPTY_STYLE
+        return {
+            "fillColor": fill_colors[region],
+            "color": "#ECBA82",
+            "weight": 1.2,
+            "fillOpacity": 0.8,
+        }
+
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        style_function=style_function,
+        tooltip=GeoJsonTooltip(
+            fields=[REGION_KEY, *fields],
+            aliases=[REGION_ALIAS, *fields],
+            sticky=False,
+        ),
+    ).add_to(m)
+
+    return m
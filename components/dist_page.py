@@ -0,0 +1,185 @@
+"""유통업체별 정보 페이지 컴포넌트
+
+헤더, 카테고리별 채널 비교 카드, 선택 품목의 지역별 지도를 각각 fragment로 렌더링합니다.
+카테고리를 바꾸거나 카드를 클릭하면 채널 비교 구역만 다시 실행됩니다.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from components.channel_cards import render_channel_comparison_sections
+from components.page_fragment import page_fragment
+from components.region_map import render_selected_item_region_map
+from data.connection import DatabaseConnection
+from data.queries.channel_queries import DIST_CATEGORIES, get_channel_comparison_query
+from data.query_cache import is_refreshing
+
+
+@page_fragment("dist/header")
+def render_dist_header(conn: DatabaseConnection):
+    """유통업체 페이지 헤더 (제목 + 비교 데이터 현황)를 렌더링합니다."""
+    header_container = st.container()
+    with header_container:
+        header_left, header_right = st.columns([3, 2])
+        with header_left:
+            st.title("유통업체별 농수산물 가격 비교 한눈에 보기")
+        with header_right:
+            # 유통업체 데이터를 먼저 조회하여 메타 정보 표시
+            try:
+                # 전체 카테고리로 최신 데이터 조회
+                temp_query = get_channel_comparison_query(
+                    category_filter="전체",
+                    limit=None,
+                    conn=conn,
+                )
+                df_temp = conn.execute_query(temp_query)
+
+                if len(df_temp) > 0:
+                    latest_date = (
+                        df_temp["조회일자"].iloc[0]
+                        if "조회일자" in df_temp.columns
+                        else "N/A"
+                    )
+                    unique_items = (
+                        df_temp["item_nm"].nunique()
+                        if "item_nm" in df_temp.columns
+                        else 0
+                    )
+                    total_comparisons = len(df_temp)
+                else:
+                    latest_date = "N/A"
+                    unique_items = 0
+                    total_comparisons = 0
+                refreshing = is_refreshing(df_temp)
+            except Exception:
+                latest_date = "N/A"
+                unique_items = 0
+                total_comparisons = 0
+                refreshing = False
+
+            m1, m2, m3 = st.columns(3)
+            m1.metric(
+                label="📅 최신 데이터",
+                value=str(latest_date),
+                delta="데이터 갱신 중" if refreshing else None,
+                delta_color="off",
+            )
+            m2.metric(
+                label="📦 비교 품목 수",
+                value=f"{unique_items:,}개",
+            )
+            m3.metric(label="🔍 비교 항목 수", value=f"{total_comparisons:,}개")
+    st.divider()
+
+
+def render_comparison_summary(df_comparison: pd.DataFrame):
+    """유통/전통 평균 가격과 평균 가격 차이 요약 통계를 렌더링합니다."""
+    st.subheader("📈 요약 통계")
+    summary_col1, summary_col2, summary_col3 = st.columns(3)
+
+    with summary_col1:
+        avg_yutong = df_comparison["유통_평균가격"].mean()
+        st.metric("유통 평균 가격", f"{avg_yutong:,.0f}원")
+
+    with summary_col2:
+        avg_jeontong = df_comparison["전통_평균가격"].mean()
+        st.metric("전통 평균 가격", f"{avg_jeontong:,.0f}원")
+
+    with summary_col3:
+        avg_diff = df_comparison["가격차이"].mean()
+        st.metric("평균 가격 차이", f"{avg_diff:,.0f}원")
+
+
+@page_fragment("dist/channel")
+def render_channel_section(conn: DatabaseConnection):
+    """카테고리 선택과 유통 vs 전통 비교 카드를 렌더링합니다."""
+    try:
+        # 카테고리 필터
+        category_filter = st.selectbox(
+            "카테고리 선택",
+            list(DIST_CATEGORIES),
+            key="dist_category",
+        )
+
+        # 카테고리 필터가 변경되었거나 세션 상태에 데이터가 없으면 쿼리 실행
+        should_query = (
+            "df_comparison" not in st.session_state
+            or st.session_state.get("query_category_filter") != category_filter
+        )
+
+        if should_query:
+            # 유통 vs 전통 비교 쿼리 생성
+            comparison_query = get_channel_comparison_query(
+                category_filter=category_filter,
+                limit=None,
+                conn=conn,
+            )
+
+            with st.spinner("데이터를 불러오는 중..."):
+                try:
+                    df_comparison = conn.execute_query(comparison_query)
+                except Exception as e:
+                    st.error(f"데이터 조회 중 오류 발생: {str(e)}")
+                    st.info("💡 Athena 연결 설정을 확인하세요.")
+                    return
+
+            if len(df_comparison) == 0:
+                st.info("조회된 데이터가 없습니다.")
+                return
+
+            # 세션 상태에 쿼리 결과 저장
+            st.session_state.df_comparison = df_comparison
+            st.session_state.query_category_filter = category_filter
+        else:
+            # 이전에 조회한 데이터가 있고 필터가 변경되지 않은 경우
+            df_comparison = st.session_state.df_comparison
+
+        render_comparison_summary(df_comparison)
+
+        st.divider()
+
+        render_channel_comparison_sections(df_comparison)
+
+        # 선택된 품목이 있으면 지역별 지도 표시
+        render_region_map_section(conn)
+
+    except Exception as e:
+        st.error(f"연결 오류: {str(e)}")
+
+
+@page_fragment("dist/region_map")
+def render_region_map_section(conn: DatabaseConnection):
+    """카드에서 선택한 품목의 지역별 가격 지도를 렌더링합니다."""
+    render_selected_item_region_map(
+        conn=conn,
+        date_filter=st.session_state.get("query_date_filter"),
+        category_filter=st.session_state.get("query_category_filter"),
+    )
+
+
+def render_dist_page(conn: DatabaseConnection):
+    """유통업체 페이지 전체를 렌더링합니다."""
+    render_dist_header(conn)
+
+    # -------------------------
+    # [part 1: channel comparison] sub-title
+    # -------------------------
+    st.subheader("🏪 유통 vs 전통시장 가격 비교")
+    st.markdown(
+        """
+        <div class="callout">
+            <div class="callout-title">💡 어떻게 보면 좋을까요?</div>
+            <b>유통</b>과 <b>전통시장</b>의 가격을 비교해보세요.<br>
+            카테고리를 선택하면 해당 카테고리의 <b>유통 vs 전통 가격 비교</b>를 확인할 수 있어요.<br>
+            요약 통계를 통해 <b>평균 가격 차이</b>를 한눈에 파악할 수 있습니다.<br><br>
+            각 품목별로
+            <ul>
+                <li><b>유통과 전통의 가격 차이</b>를 확인하여 어디서 구매하는 것이 유리한지 비교해보세요.</li>
+                <li>특정 품목을 선택하면 <b>지역별 가격 지도</b>를 통해 지역별 가격 분포를 확인할 수 있어요.</li>
+            </ul>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    render_channel_section(conn)
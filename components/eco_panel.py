@@ -3,7 +3,9 @@
 import streamlit as st
 import pandas as pd
 import altair as alt
+from components.page_fragment import page_fragment
 from data.connection import DatabaseConnection
+from data.queries.eco_channel_queries import get_latest_price_statistics_query
 
 
 def render_market_price_card(
@@ -306,11 +308,9 @@ def render_price_comparison_pivot(df_data: pd.DataFrame):
         st.dataframe(df_data, use_container_width=True)
 
 
-def render_eco_page(conn: DatabaseConnection):
-    """친환경 페이지 전체를 렌더링합니다."""
-    # -------------------------
-    # header
-    # -------------------------
+@page_fragment("eco/header")
+def render_eco_header(conn: DatabaseConnection):
+    """친환경 페이지 헤더 (제목 + 최신 데이터 현황)를 렌더링합니다."""
     header_container = st.container()
     with header_container:
         header_left, header_right = st.columns([3, 2])
@@ -318,10 +318,6 @@ def render_eco_page(conn: DatabaseConnection):
             st.title("친환경 농수산물 비교 한눈에 보기")
         with header_right:
             # 최신 데이터를 먼저 조회하여 메타 정보 표시
-            from data.queries.eco_channel_queries import (
-                get_latest_price_statistics_query,
-            )
-
             try:
                 latest_data_query = get_latest_price_statistics_query(conn=conn)
                 df_temp = conn.execute_query(latest_data_query)
@@ -360,6 +356,11 @@ def render_eco_page(conn: DatabaseConnection):
             m3.metric(label="🏪 비교 마트 수", value=f"{unique_markets:,}개")
     st.divider()
 
+
+def render_eco_page(conn: DatabaseConnection):
+    """친환경 페이지 전체를 렌더링합니다."""
+    render_eco_header(conn)
+
     # -------------------------
     # [part 1: price comparison] sub-title
     # -------------------------
@@ -381,6 +382,13 @@ def render_eco_page(conn: DatabaseConnection):
         """,
         unsafe_allow_html=True,
     )
+
+    render_eco_content(conn)
+
+
+@page_fragment("eco/content")
+def render_eco_content(conn: DatabaseConnection):
+    """요약 통계, 마트별 평균 가격 그래프, 가격차이 상위 품목 카드를 렌더링합니다."""
     try:
         # 최신 데이터 쿼리 가져오기
         latest_data_query = get_latest_price_statistics_query(conn=conn)
@@ -0,0 +1,277 @@
+"""오늘의 식재료(메인) 페이지 컴포넌트
+
+헤더, 가격 패널, 제철 지도를 각각 fragment로 렌더링합니다. 지역을 바꾸면 가격 패널만,
+제철 품목을 바꾸거나 지도를 클릭하면 제철 구역만 다시 실행되며, 위쪽 구역은
+아래쪽 쿼리를 기다리지 않고 자기 데이터가 준비되는 대로 먼저 표시됩니다.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from components.choropleth import map_lod
+from components.map_cache import st_cached_folium
+from components.page_fragment import page_fragment
+from components.price_cards import render_price_drop_cards, render_price_rise_cards
+from components.price_graph import render_price_region_donut
+from components.season_cards import (
+    render_region_all_items_chart,
+    render_region_price_comparison,
+)
+from components.season_map import create_season_price_map
+from data.connection import DatabaseConnection
+from data.data_version import get_data_version
+from data.price_bundle import load_price_bundle
+from data.queries.meta_queries import get_update_status_query
+from data.queries.season_queries import (
+    get_region_all_items_price_query,
+    get_season,
+    get_season_item_list,
+    get_season_region_price_query,
+)
+from data.query_cache import is_refreshing
+
+
+@page_fragment("main/header")
+def render_main_header(conn: DatabaseConnection):
+    """메인 페이지 헤더 (제목 + 데이터 업데이트 현황)를 렌더링합니다."""
+    header_container = st.container()
+    with header_container:
+        header_left, header_right = st.columns([3, 2])
+        with header_left:
+            st.title("오늘의 지역별 농산물 가격 동향 한눈에 보기")
+        with header_right:
+            # 메타 정보 조회
+            status_df = conn.execute_query(get_update_status_query(conn=conn))
+            update_status = status_df.iloc[0]
+
+            m1, m2, m3 = st.columns(3)
+            m1.metric(
+                label="📅 최신 업데이트",
+                value=str(update_status["latest_date"]),
+                delta="데이터 갱신 중" if is_refreshing(status_df) else None,
+                delta_color="off",
+            )
+            m2.metric(
+                label="📦 업데이트 품목 수",
+                value=f"{int(update_status['row_count']):,}",
+            )
+            m3.metric(
+                label="🌍 업데이트 지역 수", value=int(update_status["country_count"])
+            )
+    st.divider()
+
+
+@page_fragment("main/price")
+def render_price_panels(conn: DatabaseConnection):
+    """지역 선택과 가격 하락/상승 TOP 3, 상승/하락/유지 비율 패널을 렌더링합니다."""
+    # -------------------------
+    # [part 1: price] sub-title
+    # -------------------------
+    st.subheader("🌱 오늘 눈여겨볼 만한 식재료들")
+    st.markdown(
+        """
+    <div class="callout">
+        <div class="callout-title">💡 어떻게 보면 좋을까요?</div>
+        지역을 선택하면 <b>전일 대비 가격 변동이 가장 큰</b> 농수산물 TOP 3를 확인할 수 있어요.<br>
+        이를 통해 오늘 해당 지역의 <b>이상 가격 징후</b>가 있는 품목을 빠르게 파악할 수 있습니다.<br>
+        해당 지역에서 전체 품목 중 <b>상승·하락·유지 비율</b>을 도넛 차트를 통해 한눈에 볼 수 있습니다.
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+
+    # -------------------------
+    # [part 1: price] 지역 선택
+    # -------------------------
+    # 세 가격 마트는 데이터 버전당 한 번만 전체 조회하고, 지역 변경 시 로컬에서 잘라 사용
+    price_bundle = load_price_bundle(conn)
+    country_list = price_bundle.countries
+
+    if "country" not in st.session_state:
+        if "서울" in country_list:
+            st.session_state.country = "서울"
+        else:
+            st.session_state.country = country_list[0]
+
+    country = st.selectbox("지역 선택", country_list, key="country")
+
+    cheep_df = price_bundle.drop_top3(country)
+    rise_df = price_bundle.rise_top3(country)
+    summary_df = price_bundle.region_rate(country)
+
+    c1, c2, c3 = st.columns(3)
+
+    # -------------------------
+    # [part 1: price] charts
+    # -------------------------
+    with c1:
+        st.subheader("📉 전일 대비 가격 하락 TOP 3")
+        render_price_drop_cards(cheep_df)
+
+    with c2:
+        st.subheader("📈 전일 대비 가격 상승 TOP 3")
+        render_price_rise_cards(rise_df)
+
+    with c3:
+        st.subheader("📊 상승/하락/유지 품목 비율")
+        render_price_region_donut(summary_df, country)
+
+    st.divider()
+
+
+@page_fragment("main/season")
+def render_season_section(conn: DatabaseConnection):
+    """제철 품목 선택, 지역별 가격 지도, 클릭한 지역의 차트를 렌더링합니다.
+
+    지도 클릭은 이 구역만 다시 실행하며, 헤더와 가격 패널은 다시 그리지 않습니다.
+    """
+    # 서로 독립적인 쿼리는 한 번에 제출하여 가장 느린 쿼리 시간만큼만 대기
+    season_nm, item_df = conn.execute_many([
+        get_season(conn=conn),
+        get_season_item_list(conn=conn),
+    ])
+
+    # --------------------------
+    # [PART 2: season] sub-title
+    # --------------------------
+    season = season_nm["season"].iloc[0]
+    st.markdown(
+        f"""
+        <h3>❄️ <span style="color:#1f77b4">{season}</span> 제철 식자재 가격 지도 톺아보기</h3>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    st.markdown(
+        """
+        <div class="callout">
+            <div class="callout-title">🧭 이렇게 활용해보세요</div>
+            💡 제철 식자재 가격을 지역별로 살펴보세요.<br><br>
+            <b>현재 월을 기준</b>으로 해당 제철의 식자재 리스트를 확인할 수 있습니다<br>
+            제철 농수산물을 선택하면 <b>지역별 가격 수준</b>을 색상으로 확인할 수 있어요.<br><br>
+            특정 지역을 클릭하면
+            <ul>
+                <li>해당 지역의 <b>전년 동일 대비 가격 변화</b>를 확인할 수 있어요.</li>
+                <li>해당 지역의 <b>다른 제철 농수산물 가격</b> 현황도 함께 확인할 수 있어요.</li>
+            </ul>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # -----------------------------
+    # [PART 2: season] select item
+    # -----------------------------
+    item_list = item_df["item_kind"].dropna().tolist()
+
+    if not item_list:
+        st.warning("선택 가능한 제철 품목이 없습니다.")
+        return
+
+    if st.session_state.get("selected_item") not in item_list:
+        st.session_state.selected_item = item_list[0]
+
+    bottom_left, bottom_right = st.columns([1, 1])
+
+    with bottom_left:
+        selected_item_kind = st.selectbox(
+            f"{season} 제철 농수산물 선택",
+            item_list,
+            key="selected_item",
+        )
+
+    # -----------------------------
+    # [PART 2: season] query to df
+    # -----------------------------
+    season_query = get_season_region_price_query(
+        item_kind_filter=selected_item_kind, conn=conn
+    )
+    season_df = conn.execute_query(season_query)
+
+    if season_df.empty:
+        st.error("제철 데이터가 없습니다.")
+        return
+
+    # 결측치 처리
+    season_df["prev_1y_pr"] = season_df["prev_1y_pr"].fillna(0)
+    season_df["base_pr"] = season_df["base_pr"].fillna(0)
+
+    # ---------------------------
+    # [PART 2: season] geo json
+    # ---------------------------
+    # 같은 품목/데이터 버전/LOD의 지도는 렌더링 결과를 재사용 (갱신 중인 이전 버전 결과는 캐시하지 않음)
+    map_cache_key = (
+        None
+        if is_refreshing(season_df)
+        else (
+            "season",
+            selected_item_kind,
+            season_df.attrs.get("data_version") or get_data_version(conn),
+            map_lod(),
+        )
+    )
+
+    with bottom_left:
+        unit = None
+        if "product_cls_unit" in season_df.columns:
+            unit_row = season_df.loc[
+                season_df["item_kind"] == selected_item_kind, "product_cls_unit"
+            ]
+            if not unit_row.empty:
+                unit = unit_row.iloc[0]
+
+        if unit:
+            st.markdown(
+                f"<h4>🗺️ <span style='color:#0095fa'>{selected_item_kind}({unit})</span> 지역별 가격 분포</h4>",
+                unsafe_allow_html=True,
+            )
+        else:
+            st.markdown(
+                f"<h4>🗺️ <span style='color:#0095fa'>{selected_item_kind}</span> 지역별 가격 분포</h4>",
+                unsafe_allow_html=True,
+            )
+
+        _map_state = st_cached_folium(
+            lambda: create_season_price_map(season_df, selected_item_kind),
+            cache_key=map_cache_key,
+            width=1000,
+            height=650,
+            key="season_map",
+            returned_objects=["last_active_drawing"],
+        )
+
+    # ----------------------------
+    # [PART 2: season] bar charts
+    # ----------------------------
+    clicked_region = None
+    if _map_state and _map_state.get("last_active_drawing"):
+        clicked_region = _map_state["last_active_drawing"]["properties"]["CITY_AB_NM"]
+
+    # 기본값 설정
+    if not clicked_region:
+        clicked_region = "서울"
+
+    with bottom_right:
+        render_region_charts(conn, season_df, clicked_region, selected_item_kind)
+
+
+def render_region_charts(
+    conn: DatabaseConnection,
+    season_df: pd.DataFrame,
+    clicked_region: str,
+    selected_item_kind: str,
+):
+    """클릭한 지역의 전년 대비 가격 차트와 전체 제철 품목 차트를 렌더링합니다."""
+    region_df = season_df[season_df["country_nm"] == clicked_region]
+    render_region_price_comparison(region_df, clicked_region, selected_item_kind)
+
+    region_all_query = get_region_all_items_price_query(clicked_region, conn=conn)
+    region_all_df = conn.execute_query(region_all_query)
+    render_region_all_items_chart(region_all_df, clicked_region)
+
+
+def render_main_page(conn: DatabaseConnection):
+    """메인 페이지 전체를 렌더링합니다."""
+    render_main_header(conn)
+    render_price_panels(conn)
+    render_season_section(conn)
@@ -0,0 +1,341 @@
+"""렌더링된 지도 캐시 컴포넌트
+
+st_folium은 매 실행마다 folium 객체 그래프 전체를 렌더링하고 Leaflet 스크립트로
+직렬화합니다. 같은 품목/데이터 버전/geometry LOD의 지도는 모든 사용자에게 동일하므로,
+st_folium이 프런트엔드 컴포넌트에 넘기는 렌더링 결과(스크립트, HTML, CSS/JS 링크)를
+프로세스 전역에 크기 제한 LRU로 보관하고, 적중하면 folium 객체를 만들지 않고
+컴포넌트를 바로 표시합니다.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from typing import Callable, Iterable, Optional
+
+import folium
+import folium.elements
+import streamlit as st
+from streamlit_folium import st_folium
+
+from data.logger import setup_logger
+from data.telemetry import format_metric, telemetry
+
+logger = setup_logger("map_cache")
+
+# st_folium 내부 함수와 컴포넌트 인자는 이 버전 기준으로 재현함 (pyproject에서도 고정)
+SUPPORTED_STREAMLIT_FOLIUM = "0.25."
+
+
+def _import_component():
+    """streamlit_folium 내부 함수를 지연 import합니다.
+
+    렌더링 결과를 재사용하려면 st_folium이 내부에서 쓰는 직렬화 함수와 컴포넌트를
+    직접 호출해야 합니다. 지원하는 버전(0.25.x)이 아니거나 함수가 없으면 None을 반환하고
+    캐시 없이 st_folium을 사용합니다.
+    """
+    try:
+        installed = version("streamlit-folium")
+    except PackageNotFoundError:
+        installed = None
+    if installed is None or not installed.startswith(SUPPORTED_STREAMLIT_FOLIUM):
+        logger.warning(
+            f"streamlit-folium {installed} 은(는) 지도 캐시가 지원하지 않는 버전이므로 "
+            f"({SUPPORTED_STREAMLIT_FOLIUM}x 필요) 캐시 없이 st_folium을 사용합니다."
+        )
+        return None
+
+    try:
+        import branca.colormap
+        import streamlit_folium as sf
+
+        return (
+            branca,
+            sf._component_func,
+            sf._get_header,
+            sf._get_html,
+            sf._get_map_string,
+            sf.generate_js_hash,
+            sf.get_full_id,
+        )
+    except (ImportError, AttributeError) as e:
+        logger.warning(f"streamlit_folium 내부 함수를 찾을 수 없어 지도 캐시를 사용하지 않음: {e!s}")
+        return None
+
+
+@dataclass
+class RenderedMap:
+    """st_folium 컴포넌트에 넘기는 지도 렌더링 결과"""
+
+    script: str
+    header: str
+    html: str
+    map_id: str
+    bounds: list
+    zoom: Optional[int]
+    css_links: tuple
+    js_links: tuple
+    # 위젯 키별 컴포넌트 키 (스크립트 해시, 계산 비용이 있어 한 번만 계산)
+    _component_keys: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def nbytes(self) -> int:
+        """보관 크기 추정치 (문자열 UTF-8 바이트 합)"""
+        return sum(
+            len(text.encode("utf-8"))
+            for text in (self.script, self.header, self.html, *self.css_links, *self.js_links)
+        )
+
+
+def render_folium_map(folium_map: folium.Map, component) -> RenderedMap:
+    """folium 지도를 st_folium과 같은 방식으로 렌더링합니다."""
+    branca, _, get_header, get_html, get_map_string, _, get_full_id = component
+
+    folium_map.get_root().render()
+    folium_map.render()
+    # st_folium과 같은 순서: _get_map_string이 folium 구조를 바꾸므로 HTML/헤더를 먼저 생성
+    html = get_html(folium_map)
+    header = get_header(folium_map)
+    script = get_map_string(folium_map)
+
+    def walk(element):
+        if isinstance(element, branca.colormap.ColorMap):
+            yield element
+        if isinstance(element, folium.elements.JSCSSMixin):
+            yield element
+        for child in getattr(element, "_children", {}).values():
+            yield from walk(child)
+
+    css_links, js_links = [], []
+    for element in walk(folium_map):
+        if isinstance(element, branca.colormap.ColorMap):
+            js_links.insert(0, "https://cdnjs.cloudflare.com/ajax/libs/d3/3.5.5/d3.min.js")
+            js_links.insert(0, "https://d3js.org/d3.v4.min.js")
+        css_links.extend(href for _, href in getattr(element, "default_css", []))
+        js_links.extend(src for _, src in getattr(element, "default_js", []))
+
+    return RenderedMap(
+        script=script,
+        header=header,
+        html=html,
+        map_id=get_full_id(folium_map),
+        bounds=folium_map.get_bounds(),
+        zoom=folium_map.options.get("zoom"),
+        css_links=tuple(dict.fromkeys(css_links)),
+        js_links=tuple(dict.fromkeys(js_links)),
+    )
+
+
+class RenderedMapCache:
+    """(지도 종류, 품목, 데이터 버전, LOD 등) 키별 렌더링 결과 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: 보관할 렌더링 결과의 최대 총 크기 (바이트)
+        """
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[RenderedMap, int]] = OrderedDict()
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: tuple) -> Optional[RenderedMap]:
+        """캐시된 렌더링 결과를 반환합니다 (없으면 None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[0]
+
+    def put(self, key: tuple, rendered: RenderedMap):
+        """렌더링 결과를 저장하고 크기 제한을 넘으면 오래 사용되지 않은 결과부터 제거합니다."""
+        size = rendered.nbytes
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (rendered, size)
+            self._bytes += size
+
+            while self._bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats["evictions"] += 1
+
+    def stats(self) -> dict:
+        """적중/미스/제거 횟수와 보관 현황을 반환합니다."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["memory_bytes"] = self._bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def metric_lines(self) -> list[str]:
+        """캐시 통계를 Prometheus 텍스트 형식의 줄 목록으로 반환합니다."""
+        stats = self.stats()
+        return [
+            "# HELP threelacha_map_cache_lookups_total Rendered map cache lookups by result",
+            "# TYPE threelacha_map_cache_lookups_total counter",
+            format_metric("threelacha_map_cache_lookups_total", stats["hits"], {"result": "hit"}),
+            format_metric("threelacha_map_cache_lookups_total", stats["misses"], {"result": "miss"}),
+            "# TYPE threelacha_map_cache_evictions_total counter",
+            format_metric("threelacha_map_cache_evictions_total", stats["evictions"]),
+            "# TYPE threelacha_map_cache_entries gauge",
+            format_metric("threelacha_map_cache_entries", stats["entries"]),
+            "# TYPE threelacha_map_cache_memory_bytes gauge",
+            format_metric("threelacha_map_cache_memory_bytes", stats["memory_bytes"]),
+        ]
+
+
+_map_cache: Optional[RenderedMapCache] = None
+_map_cache_lock = threading.Lock()
+_component = None
+_component_loaded = False
+
+
+def get_map_cache() -> Optional[RenderedMapCache]:
+    """프로세스 전역에서 공유되는 지도 캐시를 반환합니다.
+
+    - MAP_CACHE_MAX_MB: 보관할 렌더링 결과의 최대 크기 MB (기본값 64, 0이면 캐시 사용 안 함)
+
+    Returns:
+        Optional[RenderedMapCache]: 지도 캐시 (비활성화되었거나 사용할 수 없으면 None)
+    """
+    global _map_cache, _component, _component_loaded
+    with _map_cache_lock:
+        if not _component_loaded:
+            _component = _import_component()
+            _component_loaded = True
+            max_mb = float(os.getenv("MAP_CACHE_MAX_MB", "64"))
+            if _component is not None and max_mb > 0:
+                _map_cache = RenderedMapCache(max_bytes=int(max_mb * 1024 * 1024))
+                telemetry.register_collector(_map_cache.metric_lines)
+        return _map_cache
+
+
+def _mount(
+    rendered: RenderedMap,
+    key: Optional[str],
+    width: Optional[int],
+    height: int,
+    returned_objects: Optional[Iterable[str]],
+) -> dict:
+    """렌더링 결과로 st_folium 컴포넌트를 표시합니다 (st_folium과 같은 인자/반환값)."""
+    component_func, generate_js_hash = _component[1], _component[5]
+
+    southwest, northeast = rendered.bounds
+    defaults = {
+        "last_clicked": None,
+        "last_object_clicked": None,
+        "last_object_clicked_tooltip": None,
+        "last_object_clicked_popup": None,
+        "all_drawings": None,
+        "last_active_drawing": None,
+        "bounds": {
+            "_southWest": {"lat": southwest[0], "lng": southwest[1]},
+            "_northEast": {"lat": northeast[0], "lng": northeast[1]},
+        },
+        "zoom": rendered.zoom,
+        "last_circle_radius": None,
+        "last_circle_polygon": None,
+        "selected_layers": None,
+    }
+    if returned_objects is not None:
+        defaults = {k: v for k, v in defaults.items() if k in returned_objects}
+
+    component_key = rendered._component_keys.get(key)
+    if component_key is None:
+        component_key = generate_js_hash(rendered.script, key, False)
+        rendered._component_keys[key] = component_key
+
+    def _on_change():
+        if key is not None:
+            st.session_state[key] = st.session_state.get(component_key, {})
+
+    return component_func(
+        script=rendered.script,
+        header=rendered.header,
+        html=rendered.html,
+        id=rendered.map_id,
+        key=component_key,
+        height=height,
+        width=width,
+        returned_objects=returned_objects,
+        default=defaults,
+        zoom=None,
+        center=None,
+        feature_group=None,
+        return_on_hover=False,
+        layer_control=None,
+        pixelated=False,
+        css_links=list(rendered.css_links),
+        js_links=list(rendered.js_links),
+        on_change=_on_change,
+    )
+
+
+def _disable_component(error: Exception):
+    """streamlit_folium 내부 호출이 실패하면 지도 캐시를 끄고 캐시된 결과를 버립니다."""
+    global _component, _map_cache
+    logger.warning(f"streamlit_folium 내부 호출 실패, 캐시 없이 st_folium 사용: {error!s}")
+    with _map_cache_lock:
+        _component = None
+        _map_cache = None
+
+
+def st_cached_folium(
+    build_map: Callable[[], folium.Map],
+    cache_key: Optional[tuple] = None,
+    key: Optional[str] = None,
+    width: Optional[int] = 500,
+    height: int = 700,
+    returned_objects: Optional[Iterable[str]] = None,
+) -> dict:
+    """캐시된 렌더링 결과로 지도를 표시합니다 (st_folium 대체).
+
+    cache_key가 적중하면 build_map을 호출하지 않고 저장된 렌더링 결과를 그대로 사용합니다.
+
+    Args:
+        build_map: 지도를 생성하는 함수 (캐시 미스일 때만 호출)
+        cache_key: 지도를 식별하는 키 (지도 종류, 품목, 데이터 버전, LOD 등).
+            None이면 캐시하지 않습니다 (예: 갱신 중인 이전 버전 데이터)
+        key: st_folium 위젯 키
+        width: 지도 너비 (픽셀)
+        height: 지도 높이 (픽셀)
+        returned_objects: 상호작용 시 반환할 항목 (st_folium과 동일)
+
+    Returns:
+        dict: 지도 상호작용 결과 (st_folium 반환값과 동일)
+    """
+    cache = get_map_cache()
+
+    def fallback() -> dict:
+        return st_folium(
+            build_map(), key=key, width=width, height=height, returned_objects=returned_objects
+        )
+
+    if _component is None:
+        return fallback()
+
+    rendered = cache.get(cache_key) if cache is not None and cache_key is not None else None
+    folium_map = build_map() if rendered is None else None
+    try:
+        if folium_map is not None:
+            rendered = render_folium_map(folium_map, _component)
+            if cache is not None and cache_key is not None:
+                cache.put(cache_key, rendered)
+        return _mount(rendered, key, width, height, returned_objects)
+    except (TypeError, AttributeError, ValueError) as e:
+        # 내부 함수의 시그니처/반환값이 재현한 것과 다름 → 이후로는 캐시 없이 st_folium 사용
+        _disable_component(e)
+        return fallback()
@@ -0,0 +1,52 @@
+"""페이지 구역(fragment) 컴포넌트
+
+페이지를 헤더, 패널, 지도처럼 독립적으로 다시 실행되는 구역으로 나눕니다.
+구역 안의 위젯을 조작하면 app.py 전체가 아니라 그 구역만 다시 실행되고,
+구역마다 렌더링 시간을 "페이지/구역" 이름으로 텔레메트리에 기록합니다.
+"""
+
+import functools
+import time
+from typing import Callable
+
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+
+from data.telemetry import telemetry
+
+
+def page_fragment(name: str) -> Callable:
+    """함수를 st.fragment로 감싸고 실행 시간을 기록하는 데코레이터
+
+    Args:
+        name: 성능 진단 페이지에 표시할 구역 이름 (예: "main/season")
+
+    Returns:
+        Callable: 데코레이터
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @st.fragment
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                telemetry.record_page(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def rerun_fragment():
+    """현재 fragment만 다시 실행합니다.
+
+    fragment가 전체 앱 실행의 일부로 실행 중이면 (다른 위젯 변경과 함께 처리된 경우 등)
+    fragment 범위 재실행이 허용되지 않으므로 전체 앱을 다시 실행합니다.
+    """
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
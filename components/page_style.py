@@ -0,0 +1,151 @@
+"""페이지 폰트/스타일시트 컴포넌트
+
+폰트 파일은 Streamlit 정적 파일 서빙(server.enableStaticServing)으로 static/fonts에서
+제공하고, @font-face CSS와 styles.css는 프로세스당 한 번만 만들어 매 실행마다 재사용합니다.
+폰트 URL에는 파일 해시를 ?v=로 붙여 브라우저가 한 번 받은 폰트를 장기간 캐시하게 합니다
+(Tornado 정적 파일 핸들러는 v 인자가 있으면 Cache-Control: max-age를 10년으로 설정).
+
+scripts/subset_fonts.py로 만든 WOFF2 서브셋이 있으면 원본 대신 서브셋을 사용합니다.
+"""
+
+import functools
+import hashlib
+import json
+from pathlib import Path
+
+import streamlit as st
+
+from data.logger import setup_logger
+
+logger = setup_logger("page_style")
+
+BASE_PATH = Path(__file__).resolve().parent.parent
+FONT_DIR = BASE_PATH / "static" / "fonts"
+# 정적 파일 서빙 경로 (페이지 기준 상대 경로)
+FONT_URL = "app/static/fonts"
+# scripts/subset_fonts.py가 기록하는 원본 폰트 -> WOFF2 서브셋 매니페스트
+SUBSET_MANIFEST = FONT_DIR / "subsets.json"
+
+# (font-family, 파일 이름, font-weight)
+FONT_FACES = (
+    ("PureunJeonnam", "PureunJeonnam.ttf", 400),
+    ("PureunJeonnam", "PureunJeonnam-Medium.ttf", 500),
+    ("PureunJeonnam", "PureunJeonnam-Bold.ttf", 700),
+    ("ChangwonDangam", "ChangwonDangamRound.ttf", 500),
+    ("ChangwonDangamOTF", "ChangwonDangamRound.otf", 500),
+    ("ChangwonDangamAsac", "ChangwonDangamAsac-Bold.ttf", 500),
+    ("BusanFont", "BusanFont_Provisional.ttf", 400),
+)
+
+FONT_FORMATS = {
+    ".ttf": "truetype",
+    ".otf": "opentype",
+    ".woff": "woff",
+    ".woff2": "woff2",
+}
+
+FONT_RULES = """
+/* === 폰트 적용 규칙 === */
+
+/* 전체 본문: 푸른전남 */
+html, body, [data-testid="stAppViewContainer"] {
+    font-family: 'PureunJeonnam', sans-serif !important;
+}
+
+/* 제목 (H1~H3): 창원단감 */
+h1, h2, h3 {
+    font-family: 'ChangwonDangam', sans-serif !important;
+}
+
+/* 숫자/강조: 창원단감 아삭 */
+div[data-testid="stMetricValue"], .callout-title {
+    font-family: 'ChangwonDangamAsac', sans-serif !important;
+}
+
+/* 콜아웃 박스 본문 */
+.callout {
+    font-family: 'PureunJeonnam', sans-serif !important;
+}
+"""
+
+
+def _file_version(path: Path) -> str:
+    """파일 내용 해시 (폰트가 바뀌면 URL도 바뀌어 브라우저 캐시가 갱신됨)"""
+    return hashlib.sha1(path.read_bytes()).hexdigest()[:10]
+
+
+def _font_face(family: str, path: Path, weight: int, unicode_range: str = "") -> str:
+    """@font-face 규칙 하나를 생성합니다."""
+    lines = [
+        "@font-face {",
+        f"    font-family: '{family}';",
+        f"    src: url('{FONT_URL}/{path.name}?v={_file_version(path)}') "
+        f"format('{FONT_FORMATS[path.suffix]}');",
+        f"    font-weight: {weight};",
+        "    font-display: swap;",
+    ]
+    if unicode_range:
+        lines.append(f"    unicode-range: {unicode_range};")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def _load_subset_manifest() -> dict:
+    """서브셋 매니페스트를 읽습니다 (없거나 읽을 수 없으면 빈 딕셔너리)."""
+    if not SUBSET_MANIFEST.exists():
+        return {}
+    try:
+        return json.loads(SUBSET_MANIFEST.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning(f"폰트 서브셋 매니페스트 읽기 실패, 원본 폰트 사용: {e!s}")
+        return {}
+
+
+def build_font_face_css() -> str:
+    """static/fonts에 있는 폰트로 @font-face 규칙을 생성합니다.
+
+    서브셋이 있는 폰트는 나머지 글자 보조 파일 규칙(unicode-range 없음)을 먼저,
+    서브셋 규칙을 나중에 둡니다. unicode-range가 겹치면 나중에 선언한 규칙이 먼저 쓰이므로,
+    브라우저는 서브셋에 없는 글자가 화면에 나올 때만 보조 파일을 내려받습니다. 없는 폰트는 건너뛰어
+    대체 글꼴(sans-serif)로 표시되게 합니다.
+
+    Returns:
+        str: @font-face 규칙 CSS
+    """
+    manifest = _load_subset_manifest()
+    rules = []
+    missing = []
+    for family, filename, weight in FONT_FACES:
+        parts = manifest.get(filename, {})
+        subset_paths = {part: FONT_DIR / entry["file"] for part, entry in parts.items()}
+        if parts and all(path.exists() for path in subset_paths.values()):
+            for part in ("rest", "subset"):
+                if part in parts:
+                    rules.append(_font_face(
+                        family, subset_paths[part], weight, parts[part].get("unicode_range", "")
+                    ))
+            continue
+
+        path = FONT_DIR / filename
+        if not path.exists():
+            missing.append(filename)
+            continue
+        rules.append(_font_face(family, path, weight))
+
+    if missing:
+        logger.warning(f"폰트 파일 없음 (대체 글꼴 사용): {', '.join(missing)}")
+    return "\n".join(rules)
+
+
+@functools.lru_cache(maxsize=1)
+def build_page_css() -> str:
+    """@font-face 규칙, 폰트 적용 규칙, styles.css를 합친 <style> 블록을 반환합니다 (프로세스당 1회)."""
+    styles = (BASE_PATH / "styles.css").read_text(encoding="utf-8")
+    css = f"<style>\n{build_font_face_css()}\n{FONT_RULES}\n{styles}\n</style>"
+    logger.info(f"페이지 CSS 생성: {len(css.encode('utf-8')) / 1024:.1f} KB")
+    return css
+
+
+def load_css():
+    """페이지 폰트와 스타일시트를 적용합니다."""
+    st.markdown(build_page_css(), unsafe_allow_html=True)
@@ -0,0 +1,436 @@
+"""성능 진단 페이지 컴포넌트"""
+
+import os
+from datetime import datetime
+
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from components.map_cache import get_map_cache
+from data.cache_warmer import get_cache_warmer
+from data.connection import DatabaseConnection
+from data.scan_budget import get_scan_budget
+from data.script_run import current_session_id
+from data.telemetry import telemetry
+
+PAGE_LABELS = {
+    "main": "🧺 오늘의 식재료",
+    "eco": "🌱 친환경 정보",
+    "dist": "🏪 유통업체별 정보",
+    "perf": "⚙️ 성능 진단",
+}
+
+
+@st.cache_data(max_entries=500, show_spinner=False)
+def _get_runtime_statistics(_conn, query_execution_id: str) -> dict:
+    """완료된 Athena 쿼리의 런타임 통계 (완료 후에는 바뀌지 않으므로 캐시)"""
+    return _conn.get_runtime_statistics(query_execution_id)
+
+
+def render_connection_info(conn: DatabaseConnection):
+    """연결 정보와 프로세스 전체 쿼리 수를 표시합니다."""
+    inner = getattr(conn, "inner", conn)
+    database, extra = inner.get_config()
+    templates = telemetry.template_summary()
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("🔌 연결", inner.__class__.__name__)
+    c2.metric("🗄️ Database", database)
+    c3.metric("🧮 실행 쿼리 수", f"{sum(row['count'] for row in templates):,}")
+    c4.metric("⚠️ 오류 수", f"{sum(row['errors'] for row in templates):,}")
+
+    metrics_port = os.getenv("METRICS_PORT", "0")
+    st.caption(
+        f"WorkGroup/Host: {extra} · 쿼리 템플릿 {len(templates)}개 · "
+        + (
+            f"Prometheus: `:{metrics_port}/metrics`"
+            if metrics_port != "0"
+            else "Prometheus 내보내기 비활성화 (METRICS_PORT 미설정)"
+        )
+    )
+
+    if hasattr(inner, "single_flight_stats"):
+        flight = inner.single_flight_stats()
+        st.caption(
+            f"🔗 동일 쿼리 병합: 실제 실행 {flight['executions']:,}건 · "
+            f"다른 세션 결과 공유로 절약 {flight['shared']:,}건 · 진행 중 {flight['in_flight']:,}건"
+        )
+
+
+def render_cache_stats(conn: DatabaseConnection):
+    """결과 캐시 적중률과 사용량을 표시합니다."""
+    st.subheader("🗃️ 쿼리 결과 캐시")
+
+    if not hasattr(conn, "cache_stats"):
+        st.info("결과 캐시가 비활성화되어 있습니다 (QUERY_CACHE_ENABLED=false).")
+        return
+
+    stats = conn.cache_stats()
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("적중률", f"{stats['hit_rate'] * 100:.1f}%")
+    c2.metric("메모리 / 디스크 적중", f"{stats['hits']:,} / {stats['disk_hits']:,}")
+    c3.metric("미스", f"{stats['misses']:,}")
+    c4.metric(
+        "보관 결과",
+        f"{stats['entries']:,}개",
+        f"{stats['memory_bytes'] / 1024 / 1024:.1f} MB",
+        delta_color="off",
+    )
+
+    if hasattr(conn, "data_version"):
+        st.caption(
+            f"현재 데이터 버전: {conn.data_version} · "
+            f"더 넓은 결과에서 걸러낸 적중: {stats['derived_hits']:,} · "
+            f"예산 초과/갱신 중 제공한 이전 버전 결과: {stats['stale_hits']:,} · "
+            f"백그라운드 갱신: {stats['refreshes']:,}건 (진행 중 {stats['refreshing']:,}, "
+            f"실패 {stats['refresh_failures']:,}) · "
+            f"제거된 결과: {stats['evictions']:,}개"
+        )
+
+    warmer = get_cache_warmer()
+    if warmer is not None:
+        progress = warmer.progress()
+        if progress["total"]:
+            st.progress(
+                min(progress["done"] / progress["total"], 1.0),
+                text=(
+                    f"🔥 캐시 예열 ({progress['version']}, {progress['state']}): "
+                    f"{progress['done']:,}/{progress['total']:,}건, 실패 {progress['failed']:,}건"
+                ),
+            )
+
+
+def render_map_cache_stats():
+    """지도 렌더링 캐시 적중/보관 현황을 표시합니다."""
+    map_cache = get_map_cache()
+    if map_cache is None:
+        st.caption("🗺️ 지도 렌더링 캐시 비활성화 (MAP_CACHE_MAX_MB=0 또는 지원하지 않는 streamlit-folium 버전)")
+        return
+
+    stats = map_cache.stats()
+    st.caption(
+        f"🗺️ 지도 렌더링 캐시: 적중률 {stats['hit_rate'] * 100:.1f}% "
+        f"(적중 {stats['hits']:,} / 미스 {stats['misses']:,}) · "
+        f"보관 {stats['entries']:,}개 ({stats['memory_bytes'] / 1024 / 1024:.1f} MB) · "
+        f"제거 {stats['evictions']:,}개"
+    )
+
+
+def render_page_timings():
+    """페이지별 렌더링 시간 분포를 표시합니다."""
+    st.subheader("🖥️ 페이지 렌더링 시간")
+
+    summary = telemetry.page_summary()
+    if not summary:
+        st.info("아직 기록된 페이지 렌더링이 없습니다.")
+        return
+
+    df = pd.DataFrame(summary)
+    df["page"] = df["page"].map(lambda page: PAGE_LABELS.get(page, page))
+
+    chart_df = df.melt(
+        id_vars=["page"], value_vars=["p50", "p95", "p99"], var_name="백분위", value_name="초"
+    )
+    chart = (
+        alt.Chart(chart_df)
+        .mark_bar()
+        .encode(
+            x=alt.X("초:Q", title="렌더링 시간 (초)"),
+            y=alt.Y("page:N", title=None),
+            color=alt.Color("백분위:N", sort=["p50", "p95", "p99"]),
+            yOffset="백분위:N",
+            tooltip=["page:N", "백분위:N", alt.Tooltip("초:Q", format=".3f")],
+        )
+        .properties(height=60 * len(df) + 40)
+    )
+    st.altair_chart(chart, use_container_width=True)
+
+    samples = pd.DataFrame(telemetry.page_samples())
+    samples["time"] = pd.to_datetime(samples["timestamp"], unit="s")
+    samples["page"] = samples["page"].map(lambda page: PAGE_LABELS.get(page, page))
+    timeline = (
+        alt.Chart(samples)
+        .mark_circle(size=40, opacity=0.7)
+        .encode(
+            x=alt.X("time:T", title="시각 (UTC)"),
+            y=alt.Y("render_time:Q", title="렌더링 시간 (초)"),
+            color=alt.Color("page:N", title="페이지"),
+            tooltip=["page:N", alt.Tooltip("render_time:Q", format=".3f")],
+        )
+        .properties(height=220)
+    )
+    st.altair_chart(timeline, use_container_width=True)
+
+
+def render_template_latency():
+    """쿼리 템플릿별 지연 시간 백분위수와 대기/결과 가져오기 비중을 표시합니다."""
+    st.subheader("⏱️ 쿼리 템플릿별 지연 시간")
+
+    summary = telemetry.template_summary()
+    if not summary:
+        st.info("아직 기록된 쿼리가 없습니다.")
+        return
+
+    df = pd.DataFrame(summary)
+    df = df[df["count"] > 0]
+    if df.empty:
+        st.info("성공한 쿼리가 없습니다.")
+        return
+
+    df["template"] = df["label"] + " (" + df["template_id"].str[:6] + ")"
+
+    breakdown = df.melt(
+        id_vars=["template"],
+        value_vars=["wait_mean", "fetch_mean"],
+        var_name="단계",
+        value_name="초",
+    )
+    breakdown["단계"] = breakdown["단계"].map({"wait_mean": "완료 대기", "fetch_mean": "결과 가져오기"})
+    chart = (
+        alt.Chart(breakdown)
+        .mark_bar()
+        .encode(
+            x=alt.X("sum(초):Q", title="평균 시간 (초)"),
+            y=alt.Y("template:N", title=None, sort="-x"),
+            color=alt.Color("단계:N"),
+            tooltip=["template:N", "단계:N", alt.Tooltip("초:Q", format=".3f")],
+        )
+        .properties(height=28 * len(df) + 40)
+    )
+    st.altair_chart(chart, use_container_width=True)
+
+    table = df[
+        [
+            "template",
+            "connection_type",
+            "count",
+            "errors",
+            "total_p50",
+            "total_p95",
+            "total_p99",
+            "wait_p95",
+            "fetch_p95",
+            "rows_mean",
+            "scanned_mean",
+            "scanned_total",
+        ]
+    ].assign(
+        scanned_mean=lambda d: d["scanned_mean"] / 1024 / 1024,
+        scanned_total=lambda d: d["scanned_total"] / 1024 / 1024,
+    ).rename(columns={
+        "template": "템플릿",
+        "connection_type": "연결",
+        "count": "실행 수",
+        "errors": "오류 수",
+        "total_p50": "총 p50(초)",
+        "total_p95": "총 p95(초)",
+        "total_p99": "총 p99(초)",
+        "wait_p95": "대기 p95(초)",
+        "fetch_p95": "가져오기 p95(초)",
+        "rows_mean": "평균 행 수",
+        "scanned_mean": "평균 스캔(MB)",
+        "scanned_total": "누적 스캔(MB)",
+    })
+    st.dataframe(table.round(3), use_container_width=True, hide_index=True)
+
+    recent = pd.DataFrame([r for r in telemetry.recent() if r["error"] is None])
+    if not recent.empty:
+        recent["time"] = pd.to_datetime(recent["timestamp"], unit="s")
+        timeline = (
+            alt.Chart(recent)
+            .mark_circle(size=40, opacity=0.7)
+            .encode(
+                x=alt.X("time:T", title="시각 (UTC)"),
+                y=alt.Y("total_time:Q", title="총 시간 (초)"),
+                color=alt.Color("label:N", title="테이블"),
+                tooltip=[
+                    "label:N",
+                    alt.Tooltip("total_time:Q", format=".3f"),
+                    alt.Tooltip("wait_time:Q", format=".3f"),
+                    alt.Tooltip("fetch_time:Q", format=".3f"),
+                    "row_count:Q",
+                ],
+            )
+            .properties(height=220)
+        )
+        st.altair_chart(timeline, use_container_width=True)
+
+
+def render_slowest_queries(conn: DatabaseConnection, limit: int = 10):
+    """가장 느린 쿼리와 (Athena인 경우) 대기열/계획/엔진/결과 처리 단계별 시간을 표시합니다."""
+    st.subheader("🐢 가장 느린 쿼리")
+
+    slowest = telemetry.slowest(limit)
+    if not slowest:
+        st.info("아직 기록된 쿼리가 없습니다.")
+        return
+
+    df = pd.DataFrame(slowest)
+    df["시각"] = df["timestamp"].map(lambda ts: datetime.fromtimestamp(ts).strftime("%H:%M:%S"))
+    st.dataframe(
+        df[["시각", "label", "total_time", "wait_time", "fetch_time", "row_count", "query_preview"]]
+        .rename(columns={
+            "label": "테이블",
+            "total_time": "총(초)",
+            "wait_time": "대기(초)",
+            "fetch_time": "가져오기(초)",
+            "row_count": "행 수",
+            "query_preview": "쿼리",
+        })
+        .round(3),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    inner = getattr(conn, "inner", conn)
+    execution_ids = [row["query_execution_id"] for row in slowest if row.get("query_execution_id")]
+    if not hasattr(inner, "get_runtime_statistics") or not execution_ids:
+        return
+
+    if not st.toggle("Athena 단계별 시간 보기 (get_query_runtime_statistics)", key="perf_runtime_stats"):
+        return
+
+    rows = []
+    for row in slowest:
+        query_execution_id = row.get("query_execution_id")
+        if not query_execution_id:
+            continue
+        try:
+            stats = _get_runtime_statistics(inner, query_execution_id)
+        except Exception as e:
+            st.warning(f"런타임 통계 조회 실패 ({query_execution_id}): {e!s}")
+            continue
+
+        template = f"{row['label']} ({query_execution_id[:8]})"
+        phases = {
+            "대기열": stats.get("queue_ms"),
+            "쿼리 계획": stats.get("planning_ms"),
+            "엔진 실행": stats.get("engine_ms"),
+            "서비스 처리": stats.get("service_ms"),
+            "결과 가져오기": row["fetch_time"] * 1000,
+        }
+        for phase, millis in phases.items():
+            rows.append({
+                "쿼리": template,
+                "단계": phase,
+                "ms": millis or 0,
+                "스캔(MB)": (stats.get("scanned_bytes") or 0) / 1024 / 1024,
+                "결과 재사용": stats.get("reused"),
+            })
+
+    if not rows:
+        return
+
+    chart = (
+        alt.Chart(pd.DataFrame(rows))
+        .mark_bar()
+        .encode(
+            x=alt.X("sum(ms):Q", title="시간 (ms)"),
+            y=alt.Y("쿼리:N", title=None, sort="-x"),
+            color=alt.Color(
+                "단계:N",
+                sort=["대기열", "쿼리 계획", "엔진 실행", "서비스 처리", "결과 가져오기"],
+            ),
+            tooltip=[
+                "쿼리:N",
+                "단계:N",
+                alt.Tooltip("ms:Q", format=",.0f"),
+                alt.Tooltip("스캔(MB):Q", format=".2f"),
+                "결과 재사용:N",
+            ],
+        )
+        .properties(height=32 * len({row["쿼리"] for row in rows}) + 40)
+    )
+    st.altair_chart(chart, use_container_width=True)
+
+
+def render_scan_budget():
+    """세션별 Athena 스캔량과 예산 사용률을 표시합니다."""
+    budget = get_scan_budget()
+    sessions = budget.sessions()
+    if not sessions:
+        return
+
+    st.subheader("💸 세션별 스캔량")
+    session_id = current_session_id()
+    used = budget.usage(session_id)
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("현재 세션 스캔", f"{used / 1024 / 1024:,.1f} MB")
+    c2.metric(
+        "세션 예산",
+        f"{budget.budget_bytes / 1024 / 1024:,.0f} MB" if budget.budget_bytes else "제한 없음",
+    )
+    c3.metric("예산 초과로 거절된 요청", f"{sum(row['rejections'] for row in sessions):,}")
+
+    df = pd.DataFrame(sessions)
+    df["세션"] = df["session_id"].map(
+        lambda sid: f"{sid[:8]} (현재)" if sid == session_id else sid[:8]
+    )
+    df["최근 스캔(MB)"] = df["window_bytes"] / 1024 / 1024
+    df["누적 스캔(MB)"] = df["total_bytes"] / 1024 / 1024
+    st.dataframe(
+        df[["세션", "최근 스캔(MB)", "누적 스캔(MB)", "queries", "rejections"]]
+        .rename(columns={"queries": "쿼리 수", "rejections": "거절 수"})
+        .round(2),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+def render_recent_errors(limit: int = 10):
+    """최근 실패한 쿼리를 표시합니다."""
+    errors = [record for record in telemetry.recent() if record["error"] is not None]
+    if not errors:
+        return
+
+    st.subheader("⚠️ 최근 오류")
+    df = pd.DataFrame(errors[-limit:][::-1])
+    df["시각"] = df["timestamp"].map(lambda ts: datetime.fromtimestamp(ts).strftime("%H:%M:%S"))
+    st.dataframe(
+        df[["시각", "connection_type", "label", "error", "query_preview"]].rename(columns={
+            "connection_type": "연결",
+            "label": "테이블",
+            "error": "오류",
+            "query_preview": "쿼리",
+        }),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+def render_perf_page(conn: DatabaseConnection):
+    """성능 진단 페이지를 렌더링합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+    """
+    st.title("⚙️ 성능 진단")
+    st.markdown(
+        """
+        <div class="callout">
+            <div class="callout-title">💡 어떻게 보면 좋을까요?</div>
+            이 서버 프로세스가 시작된 이후 모든 세션에서 실행된 쿼리와 페이지 렌더링 시간을 보여줍니다.<br>
+            <ul>
+                <li><b>쿼리 템플릿별 p95</b>가 갑자기 늘어난 항목이 있으면 해당 마트/쿼리를 먼저 확인하세요.</li>
+                <li>Athena 쿼리는 <b>대기열/계획/엔진 실행/결과 가져오기</b> 중 어디서 시간이 걸렸는지 확인할 수 있어요.</li>
+                <li><b>캐시 적중률</b>이 낮다면 데이터 버전이 자주 바뀌거나 캐시 크기가 부족한지 확인하세요.</li>
+            </ul>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    render_connection_info(conn)
+    st.divider()
+    render_cache_stats(conn)
+    render_map_cache_stats()
+    st.divider()
+    render_page_timings()
+    st.divider()
+    render_template_latency()
+    st.divider()
+    render_slowest_queries(conn)
+    render_scan_budget()
+    render_recent_errors()
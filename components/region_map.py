@@ -1,21 +1,19 @@
 """지역별 지도 시각화 컴포넌트"""
 
 import folium
-import branca.colormap as cm
-from folium import Element
 import pandas as pd
-import copy
 from typing import Optional
 import streamlit as st
-from streamlit_folium import st_folium
+from components.choropleth import build_choropleth, format_price, map_lod
+from components.map_cache import st_cached_folium
+from components.page_fragment import rerun_fragment
 from data.queries.region_queries import get_region_stats_query
 from data.connection import DatabaseConnection
-import json
-from pathlib import Path
+from data.data_version import get_data_version
+from data.query_cache import is_refreshing
 
 
 def create_region_map(
-    geojson_data: dict,
     region_data: pd.DataFrame,
     price_column: str = "평균가격",
     region_column: str = "country_nm",
@@ -24,7 +22,6 @@ def create_region_map(
     """지역별 가격 데이터를 지도에 표시합니다.
 
     Args:
-        geojson_data: GeoJSON 데이터
         region_data: 지역별 가격 데이터 (country_nm, 평균가격 등 포함)
         price_column: 가격 컬럼명
         region_column: 지역명 컬럼명
@@ -33,191 +30,47 @@ def create_region_map(
     Returns:
         folium.Map: 지도 객체
     """
-    m = folium.Map(
-        location=[35.5, 129.5],
-        zoom_start=7,
-        min_zoom=7,
-        max_zoom=8,
-        tiles="Esri.WorldGrayCanvas",
-    )
-
-    # 데이터가 없으면 기본 지도만 반환
-    if region_data.empty:
-        return m
-
-    # 1) 키 정규화: 문자열/공백 통일
-    region_data = region_data.copy()
-    region_data[region_column] = region_data[region_column].astype(str).str.strip()
-
-    price_map = region_data.set_index(region_column).to_dict("index")
-
-    # 2) GeoJSON 딥카피 후 주입
-    geojson_enriched = copy.deepcopy(geojson_data)
-
-    # 3) 색상 스케일
-    vmin = region_data[price_column].min()
-    vmax = region_data[price_column].max()
-    colormap = cm.LinearColormap(
-        colors=["#2c7bb6", "#abd9e9", "#fdae61", "#d7191c"],  # Blue→Red
-        vmin=vmin,
-        vmax=vmax,
-    )
-
-    # 범례 추가
-    item_display = selected_item if selected_item else "가격"
-    legend = Element(f"""
-    <div style="
-        position: fixed;
-        bottom: 20px;
-        right: 20px;
-        z-index: 9999;
-        background: rgba(255,255,255,0.9);
-        padding: 10px 14px;
-        border-radius: 6px;
-        box-shadow: 0 2px 6px rgba(0,0,0,0.2);
-        font-size: 12px;
-    ">
-
-        <!-- 제목 -->
-        <div style="
-            text-align:right;
-            margin-bottom:6px;
-            color: #000;
-        ">
-            <b>{item_display}</br>가격 (원)</b>
-        </div>
-
-        <!-- 범례 본체 -->
-        <div style="position: relative; height: 160px;">
-
-            <!-- max 값 (왼쪽) -->
-            <div style="
-                position: absolute;
-                top: -2px;
-                right: 26px;
-                white-space: nowrap;
-                color: #d7191c;
-            ">
-                {vmax:,.0f}
-            </div>
-
-            <!-- min 값 (왼쪽) -->
-            <div style="
-                position: absolute;
-                bottom: -2px;
-                right: 26px;
-                white-space: nowrap;
-                color: #2c7bb6;
-            ">
-                {vmin:,.0f}
-            </div>
-
-            <!-- 컬러바 -->
-            <div style="
-                position: absolute;
-                right: 0;
-                width: 18px;
-                height: 160px;
-                background: linear-gradient(
-                    to top,
-                    #2c7bb6,
-                    #abd9e9,
-                    #fdae61,
-                    #d7191c
-                );
-            "></div>
+    df = region_data.set_index(region_column)
 
-        </div>
-    </div>
-    """)
+    tooltip_table = pd.DataFrame(index=df.index)
+    if selected_item:
+        tooltip_table["품목"] = selected_item
+    tooltip_table["가격"] = df[price_column].map(format_price)
 
-    m.get_root().html.add_child(legend)
-
-    def style_function(feature):
-        props = feature.get("properties", {})
-        region = str(props.get("CITY_AB_NM", "")).strip()
-        if region in price_map:
-            price = price_map[region][price_column]
-            return {
-                "fillColor": colormap(price),
-                "color": "#ECBA82",
-                "weight": 1.2,
-                "fillOpacity": 0.8,
-            }
-        return {
-            "fillColor": "#eeeeee",
-            "color": "#cccccc",
-            "weight": 0.5,
-            "fillOpacity": 0.3,
-        }
-
-    for feat in geojson_enriched["features"]:
-        props = feat["properties"]
-        region = str(props.get("CITY_AB_NM", "")).strip()
-
-        if region in price_map:
-            # 값 주입
-            price_val = price_map[region][price_column]
-            props["price"] = price_val
-
-            # 안전한 포맷팅 처리
-            price_str = (
-                f"{int(price_val):,}원"
-                if price_val is not None and not pd.isna(price_val)
-                else "데이터 없음"
-            )
-            item_str = f"{selected_item}<br>" if selected_item else ""
-
-            tooltip_html = f"""
-            <b>{region}</b><br>
-            {item_str}가격: {price_str}
-            """
-
-            folium.GeoJson(
-                feat,
-                style_function=style_function,
-                tooltip=folium.Tooltip(tooltip_html, sticky=False),
-            ).add_to(m)
-        else:
-            # 데이터 없는 지역은 기본 스타일로 추가
-            folium.GeoJson(
-                feat,
-                style_function=style_function,
-            ).add_to(m)
-
-    return m
+    return build_choropleth(df[price_column], tooltip_table, legend_title=selected_item)
 
 
 def render_region_map(
-    geojson_data: dict,
     region_data: pd.DataFrame,
     price_column: str = "평균가격",
     region_column: str = "지역",
     selected_item: Optional[str] = None,
     height: int = 500,
+    cache_key: Optional[tuple] = None,
 ):
     """Streamlit에서 지역별 지도를 렌더링합니다.
 
     Args:
-        geojson_data: GeoJSON 데이터
         region_data: 지역별 가격 데이터
         price_column: 가격 컬럼명
         region_column: 지역명 컬럼명
         selected_item: 선택된 품목명
         height: 지도 높이 (픽셀)
+        cache_key: 렌더링 결과 캐시 키 (적중하면 지도를 다시 만들지 않음, None이면 캐시 안 함)
     """
     if region_data.empty:
         st.info("지도에 표시할 데이터가 없습니다.")
         return
 
-    # 지도 생성
-    m = create_region_map(
-        geojson_data, region_data, price_column, region_column, selected_item
+    # 지도 생성 후 Streamlit에 표시 (캐시 적중 시 생성 생략)
+    st_cached_folium(
+        lambda: create_region_map(region_data, price_column, region_column, selected_item),
+        cache_key=cache_key,
+        width=700,
+        height=height,
+        returned_objects=[],
     )
 
-    # Streamlit에 지도 표시
-    st_folium(m, width=700, height=height, returned_objects=[])
-
 
 def render_selected_item_region_map(
     conn: DatabaseConnection, date_filter=None, category_filter=None
@@ -240,15 +93,6 @@ def render_selected_item_region_map(
         f"🗺️ {st.session_state.selected_item_nm}({st.session_state.selected_kind_nm}) 지역별 가격 지도"
     )
 
-    # GeoJSON 로드
-    @st.cache_resource
-    def load_geojson():
-        path = Path("assets/retail_regions.json")
-        with path.open(encoding="utf-8") as f:
-            return json.load(f)
-
-    merged_geojson = load_geojson()
-
     # 지역별 데이터 조회
     region_stats_query = get_region_stats_query(
         date_filter=date_filter, category_filter=category_filter, conn=conn
@@ -273,17 +117,32 @@ def render_selected_item_region_map(
                         .reset_index()
                     )
 
+                    # 같은 품목/필터/데이터 버전/LOD의 지도는 렌더링 결과를 재사용
+                    map_cache_key = (
+                        None
+                        if is_refreshing(df_region)
+                        else (
+                            "region",
+                            st.session_state.selected_item_nm,
+                            st.session_state.selected_kind_nm,
+                            date_filter,
+                            category_filter,
+                            df_region.attrs.get("data_version") or get_data_version(conn),
+                            map_lod(),
+                        )
+                    )
+
                     col1, col2 = st.columns(2)
 
                     # 지도 표시
                     with col1:
                         render_region_map(
-                            merged_geojson,
                             df_region_agg,
                             price_column="평균가격",
                             region_column="지역",
                             selected_item=f"{st.session_state.selected_item_nm}({st.session_state.selected_kind_nm})",
                             height=650,
+                            cache_key=map_cache_key,
                         )
 
                     # 데이터 테이블도 함께 표시
@@ -298,7 +157,7 @@ def render_selected_item_region_map(
                         st.session_state.show_region_map = False
                         st.session_state.selected_item_nm = None
                         st.session_state.selected_kind_nm = None
-                        st.rerun()
+                        rerun_fragment()
                 else:
                     st.info(
                         f"{st.session_state.selected_item_nm}({st.session_state.selected_kind_nm})에 대한 지역별 데이터가 없습니다."
@@ -307,7 +166,7 @@ def render_selected_item_region_map(
                         st.session_state.show_region_map = False
                         st.session_state.selected_item_nm = None
                         st.session_state.selected_kind_nm = None
-                        st.rerun()
+                        rerun_fragment()
             else:
                 st.info("지역별 데이터가 없습니다.")
         except Exception as e:
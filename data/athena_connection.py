@@ -1,16 +1,28 @@
 """Athena 데이터베이스 연결 모듈"""
 
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from urllib.parse import urlparse
 
 import boto3
 import pandas as pd
 import streamlit as st
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from data.connection import DatabaseConnection
+from data.data_version import get_version_tracker
 from data.logger import setup_logger
+from data.queries.query_utils import PreparedQuery, normalize_sql
+from data.query_polling import PollingStrategy
+from data.result_decoder import decode_result_rows, read_result_csv
+from data.scan_budget import get_scan_budget
+from data.script_run import current_script_run, is_superseded, stop_script_run
+from data.single_flight import SingleFlight
+from data.telemetry import format_metric, query_fingerprint, telemetry
 
 logger = setup_logger("athena_connection")
 
@@ -20,16 +32,45 @@ class AthenaConnection(DatabaseConnection):
 
     def __init__(self):
         self._client = None
+        self._client_lock = threading.Lock()
         self._database = os.getenv("ATHENA_DATABASE", "team3_gold")
         self._workgroup = os.getenv("ATHENA_WORKGROUP", "team3-wg")
         self._output_location = os.getenv(
             "ATHENA_OUTPUT_LOCATION",
             "s3://team3-batch/gold/athena-results/",
         )
+        self._s3_client = None
+        self._polling = PollingStrategy.from_env()
+        # 결과 가져오기 방식: "s3"(출력 CSV 직접 읽기) 또는 "api"(get_query_results 페이징)
+        self._fetch_mode = os.getenv("ATHENA_RESULT_FETCH_MODE", "s3").lower()
+        self._s3_range_size = int(
+            os.getenv("ATHENA_S3_RANGE_SIZE", str(8 * 1024 * 1024))
+        )
+        self._s3_max_workers = int(os.getenv("ATHENA_S3_MAX_WORKERS", "8"))
+        # 결과 재사용 최대 기간 (분, 기본값: 마트 갱신 주기인 하루, 0이면 사용 안 함)
+        self._result_reuse_max_age = int(
+            os.getenv("ATHENA_RESULT_REUSE_MAX_AGE_MINUTES", "1440")
+        )
+        self._data_version_changed_at: Optional[float] = None
+        self._use_prepared = (
+            os.getenv("ATHENA_PREPARED_STATEMENTS", "true").lower() == "true"
+        )
+        self._prepared_statements: set[tuple[str, str]] = set()
+        self._prepare_lock = threading.Lock()
+        self._flight = SingleFlight("athena")
+        # 템플릿별 마지막 스캔 바이트 (취소로 절약한 스캔량 추정용)
+        self._scanned_bytes: dict[str, int] = {}
+        self._cancel_lock = threading.Lock()
+        self._cancel_stats = {"cancelled": 0, "scanned_bytes_saved": 0}
+        telemetry.register_collector(self._cancel_metric_lines)
+        self._budget = get_scan_budget()
         logger.info(
             f"AthenaConnection 초기화: database={self._database}, workgroup={self._workgroup}"
         )
 
+        # 새 데이터 버전 이전에 만들어진 결과는 재사용하지 않도록 변경 시각을 기록
+        get_version_tracker(self).add_listener(self._on_data_version_change)
+
     def get_config(self) -> tuple[str, str]:
         """Athena 설정을 반환합니다.
 
@@ -38,27 +79,69 @@ class AthenaConnection(DatabaseConnection):
         """
         return self._database, self._workgroup
 
+    @staticmethod
+    def _client_config() -> dict:
+        """boto3 클라이언트 공통 설정을 반환합니다.
+
+        - ATHENA_MAX_POOL_CONNECTIONS: 클라이언트당 HTTP 커넥션 풀 크기 (기본값 50)
+        - AWS_MAX_ATTEMPTS: adaptive 재시도 최대 시도 횟수 (기본값 5)
+        """
+        region = os.getenv("AWS_REGION", "ap-northeast-2")
+        config = {
+            "region_name": region,
+            "config": Config(
+                max_pool_connections=int(
+                    os.getenv("ATHENA_MAX_POOL_CONNECTIONS", "50")
+                ),
+                retries={
+                    "mode": "adaptive",
+                    "max_attempts": int(os.getenv("AWS_MAX_ATTEMPTS", "5")),
+                },
+            ),
+        }
+
+        access_key = os.getenv("AWS_ACCESS_KEY_ID")
+        secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+
+        if access_key and secret_key:
+            config["aws_access_key_id"] = access_key
+            config["aws_secret_access_key"] = secret_key
+
+        return config
+
     def _get_client(self):
-        """Athena 클라이언트를 생성하고 캐시합니다."""
+        """Athena 클라이언트를 생성하고 캐시합니다.
+
+        boto3 기본 세션은 스레드 안전하지 않으므로 별도 세션에서 잠금을 잡고 한 번만 생성합니다.
+        생성된 클라이언트는 스레드 안전하여 모든 세션이 공유합니다.
+        """
         if self._client is None:
-            region = os.getenv("AWS_REGION", "ap-northeast-2")
-            config = {"region_name": region}
+            with self._client_lock:
+                if self._client is None:
+                    try:
+                        self._client = boto3.session.Session().client(
+                            "athena", **self._client_config()
+                        )
+                    except (NoCredentialsError, ClientError) as e:
+                        error_msg = f"Athena 연결 실패: {e!s}"
+                        st.error(error_msg)
+                        raise
 
-            access_key = os.getenv("AWS_ACCESS_KEY_ID")
-            secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+        return self._client
 
-            if access_key and secret_key:
-                config["aws_access_key_id"] = access_key
-                config["aws_secret_access_key"] = secret_key
+    def _get_s3_client(self):
+        """결과 파일을 읽기 위한 S3 클라이언트를 생성하고 캐시합니다.
 
-            try:
-                self._client = boto3.client("athena", **config)
-            except (NoCredentialsError, ClientError) as e:
-                error_msg = f"Athena 연결 실패: {e!s}"
-                st.error(error_msg)
-                raise
+        로컬 S3 대체 서버(moto 등)를 쓰려면 AWS_ENDPOINT_URL_S3 환경 변수를 지정합니다.
+        """
+        if self._s3_client is None:
+            with self._client_lock:
+                if self._s3_client is None:
+                    self._s3_client = boto3.session.Session().client(
+                        "s3", **self._client_config()
+                    )
 
-        return self._client
+        return self._s3_client
 
     def execute_query(
         self,
@@ -66,6 +149,7 @@ class AthenaConnection(DatabaseConnection):
         database: Optional[str] = None,
         workgroup: Optional[str] = None,
         output_location: Optional[str] = None,
+        reuse_results: bool = True,
         **kwargs,
     ) -> pd.DataFrame:
         """Athena 쿼리를 실행하고 DataFrame으로 반환합니다.
@@ -75,152 +159,653 @@ class AthenaConnection(DatabaseConnection):
             database: Athena 데이터베이스 (기본값: 환경 변수 또는 team3_gold)
             workgroup: Athena WorkGroup (기본값: 환경 변수 또는 team3-wg)
             output_location: S3 출력 위치 (기본값: 환경 변수)
+            reuse_results: False이면 Athena 결과 재사용을 요청하지 않음 (항상 새로 실행)
             **kwargs: 추가 파라미터 (호환성을 위해 유지)
 
         Returns:
             pd.DataFrame: 쿼리 결과를 담은 DataFrame
         """
-        start_time = time.time()
-        connection_type = "athena"
+        return self.execute_many(
+            [query],
+            database=database,
+            workgroup=workgroup,
+            output_location=output_location,
+            reuse_results=reuse_results,
+            **kwargs,
+        )[0]
+
+    def execute_many(
+        self,
+        queries: list[str],
+        database: Optional[str] = None,
+        workgroup: Optional[str] = None,
+        output_location: Optional[str] = None,
+        timeout: Optional[float] = None,
+        reuse_results: bool = True,
+        **kwargs,
+    ) -> list[pd.DataFrame]:
+        """여러 Athena 쿼리를 한 번에 제출하고 함께 폴링합니다.
+
+        모든 쿼리를 먼저 start_query_execution으로 제출한 뒤 batch_get_query_execution으로
+        상태를 함께 확인하므로, 전체 소요 시간은 가장 느린 쿼리 하나의 시간에 가깝습니다.
+        완료된 쿼리의 결과는 나머지 쿼리가 실행 중인 동안 바로 가져옵니다.
+
+        다른 세션에서 같은 쿼리(정규화된 SQL, 같은 database/workgroup)가 이미 실행 중이면
+        새로 제출하지 않고 그 결과를 기다려 복사본을 받습니다 (single-flight).
+        요청한 세션이 스캔 예산(ATHENA_SESSION_SCAN_BUDGET_MB)을 초과했으면
+        쿼리를 제출하지 않고 QueryBudgetExceeded를 발생시킵니다.
+
+        Args:
+            queries: 실행할 SQL 쿼리 문자열 리스트
+            database: Athena 데이터베이스 (기본값: 환경 변수 또는 team3_gold)
+            workgroup: Athena WorkGroup (기본값: 환경 변수 또는 team3-wg)
+            output_location: S3 출력 위치 (기본값: 환경 변수)
+            timeout: 전체 대기 제한 시간 (초, 기본값: ATHENA_QUERY_TIMEOUT)
+            reuse_results: False이면 Athena 결과 재사용(ResultReuseConfiguration)을 요청하지 않음.
+                데이터 버전 확인이나 마트 동기화처럼 최신 결과가 필요한 쿼리에 사용합니다.
+            **kwargs: 추가 파라미터 (호환성을 위해 유지)
+
+        Returns:
+            list[pd.DataFrame]: 입력 순서와 동일한 순서의 쿼리 결과 리스트
+        """
+        if not queries:
+            return []
 
         database = database or self._database
         workgroup = workgroup or self._workgroup
         output_location = output_location or self._output_location
+        timeout = timeout if timeout is not None else self._polling.timeout
+
+        script_run = current_script_run()
+        self._budget.check(getattr(script_run, "session_id", None))
+
+        keys = [
+            self._flight_key(query, database, workgroup, output_location, reuse_results)
+            for query in queries
+        ]
+        return self._flight.execute_many(
+            keys,
+            queries,
+            lambda leader_queries: self._execute_many(
+                leader_queries,
+                database,
+                workgroup,
+                output_location,
+                timeout,
+                script_run,
+                reuse_results,
+            ),
+        )
 
-        logger.info(f"[{connection_type}] 쿼리 실행 시작")
-        logger.debug(f"[{connection_type}] 쿼리: {query[:200]}...")  # 처음 200자만 로깅
+    def single_flight_stats(self) -> dict:
+        """동일 쿼리 병합 통계 (실행 수, 절약된 실행 수, 진행 중인 쿼리 수)를 반환합니다."""
+        return self._flight.stats()
 
+    def cancellation_stats(self) -> dict:
+        """취소한 쿼리 수와 취소로 절약한 스캔 바이트 추정치를 반환합니다."""
+        with self._cancel_lock:
+            return dict(self._cancel_stats)
+
+    @staticmethod
+    def _flight_key(
+        query: str,
+        database: str,
+        workgroup: str,
+        output_location: str,
+        reuse_results: bool = True,
+    ) -> str:
+        # 재사용하지 않는 쿼리가 재사용 결과를 받지 않도록 별도로 병합
+        reuse = "reuse" if reuse_results else "fresh"
+        return f"{database}|{workgroup}|{output_location}|{reuse}|{normalize_sql(query)}"
+
+    def _execute_many(
+        self,
+        queries: list[str],
+        database: str,
+        workgroup: str,
+        output_location: str,
+        timeout: Optional[float],
+        script_run=None,
+        reuse_results: bool = True,
+    ) -> list[pd.DataFrame]:
+        """쿼리를 실제로 제출하고 모두 완료될 때까지 폴링합니다.
+
+        script_run(요청한 Streamlit 스크립트 실행)에 재실행/중단 요청이 들어오면, 다른 세션이
+        결과를 기다리지 않는 한 실행 중인 쿼리를 취소하고 스크립트 실행을 조용히 끝냅니다.
+        스캔한 바이트는 (취소된 쿼리 포함) 요청한 세션의 스캔 예산에 합산됩니다.
+        """
+        start_time = time.time()
+        connection_type = "athena"
+        session_id = getattr(script_run, "session_id", None)
+
+        logger.info(f"[{connection_type}] 쿼리 실행 시작 ({len(queries)}건)")
         client = self._get_client()
 
+        query_execution_ids: list[str] = []
+        pending: list[str] = []
+        results: dict[str, pd.DataFrame] = {}
+        executions: dict[str, dict] = {}
         try:
-            # 쿼리 실행 시작
-            response = client.start_query_execution(
-                QueryString=query,
-                QueryExecutionContext={"Database": database},
-                WorkGroup=workgroup,
-                ResultConfiguration={"OutputLocation": output_location},
+            # 모든 쿼리를 먼저 제출
+            for query in queries:
+                logger.debug(f"[{connection_type}] 쿼리: {query[:200]}...")  # 처음 200자만 로깅
+                query_execution_id = self._start_query(
+                    client, query, database, workgroup, output_location, reuse_results
+                )
+                query_execution_ids.append(query_execution_id)
+                pending.append(query_execution_id)
+
+            timings: dict[str, dict] = {}
+            wait_start = time.time()
+            attempt = 0
+
+            # 쿼리 완료 대기 (완료된 쿼리부터 결과 가져오기)
+            while pending:
+                executions = self._get_query_executions(client, pending)
+                still_pending = []
+
+                for query_execution_id in pending:
+                    execution = executions[query_execution_id]
+                    status = execution["Status"]["State"]
+
+                    if status not in ["SUCCEEDED", "FAILED", "CANCELLED"]:
+                        still_pending.append(query_execution_id)
+                        continue
+
+                    wait_time = time.time() - wait_start
+                    self._raise_for_status(execution, connection_type)
+                    self._remember_scanned_bytes(
+                        queries[query_execution_ids.index(query_execution_id)],
+                        execution,
+                    )
+
+                    statistics = execution.get("Statistics", {})
+                    scanned_bytes = statistics.get("DataScannedInBytes", 0)
+                    self._budget.charge(session_id, scanned_bytes)
+
+                    fetch_start = time.time()
+                    results[query_execution_id] = self._fetch_results(
+                        client, execution
+                    )
+                    timings[query_execution_id] = {
+                        "wait_time": wait_time,
+                        "fetch_time": time.time() - fetch_start,
+                        "poll_count": attempt + 1,
+                        "scanned_bytes": scanned_bytes,
+                        "engine_time": statistics.get("EngineExecutionTimeInMillis", 0) / 1000,
+                        "queue_time": statistics.get("QueryQueueTimeInMillis", 0) / 1000,
+                    }
+
+                pending = still_pending
+                if not pending:
+                    break
+
+                if timeout is not None and time.time() - wait_start >= timeout:
+                    raise TimeoutError(
+                        f"Athena 쿼리 대기 시간 초과 ({timeout:.0f}초, 미완료 {len(pending)}건)"
+                    )
+
+                time.sleep(self._polling.delay(attempt))
+                attempt += 1
+
+                if is_superseded(script_run) and not any(
+                    self._flight.waiters(
+                        self._flight_key(
+                            query, database, workgroup, output_location, reuse_results
+                        )
+                    )
+                    for query in queries
+                ):
+                    logger.info(
+                        f"[{connection_type}] 스크립트 재실행으로 결과가 필요 없어짐 "
+                        f"(미완료 {len(pending)}건)"
+                    )
+                    stop_script_run()
+
+            total_time = time.time() - start_time
+            dataframes = []
+            for query, query_execution_id in zip(queries, query_execution_ids):
+                df = results[query_execution_id]
+                self._record_performance(
+                    connection_type,
+                    query,
+                    total_time=total_time,
+                    row_count=len(df),
+                    query_execution_id=query_execution_id,
+                    **timings[query_execution_id],
+                )
+                dataframes.append(df)
+
+            return dataframes
+
+        except ClientError as e:
+            self._stop_queries(
+                client, pending, queries, query_execution_ids, executions, session_id
+            )
+            self._record_errors(
+                connection_type, queries, query_execution_ids, results, e
             )
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            error_message = e.response.get("Error", {}).get("Message", f"{e!s}")
+            error_msg = f"Athena 클라이언트 오류 ({error_code}): {error_message}"
+            logger.error(f"[{connection_type}] {error_msg}", exc_info=True)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            self._stop_queries(
+                client, pending, queries, query_execution_ids, executions, session_id
+            )
+            self._record_errors(
+                connection_type, queries, query_execution_ids, results, e
+            )
+            error_msg = f"Athena 쿼리 실행 중 오류: {e!s}"
+            logger.error(f"[{connection_type}] {error_msg}", exc_info=True)
+            raise Exception(error_msg) from e
+        except BaseException:
+            # Streamlit 재실행/중단(StopException 등)으로 결과가 필요 없어진 경우
+            self._stop_queries(
+                client, pending, queries, query_execution_ids, executions, session_id
+            )
+            raise
 
-            query_execution_id = response["QueryExecutionId"]
-            logger.debug(f"[{connection_type}] QueryExecutionId: {query_execution_id}")
+    def _start_query(
+        self,
+        client,
+        query: str,
+        database: str,
+        workgroup: str,
+        output_location: str,
+        reuse_results: bool = True,
+    ) -> str:
+        """쿼리 실행을 시작하고 QueryExecutionId를 반환합니다.
+
+        PreparedQuery는 prepared statement를 한 번 생성한 뒤 EXECUTE와 바인딩 파라미터로
+        실행하고, reuse_results이고 결과 재사용(ResultReuseConfiguration)이 가능하면 함께 요청합니다.
+        """
+        params = {
+            "QueryString": query,
+            "QueryExecutionContext": {"Database": database},
+            "WorkGroup": workgroup,
+            "ResultConfiguration": {"OutputLocation": output_location},
+        }
+
+        if self._use_prepared and isinstance(query, PreparedQuery):
+            self._ensure_prepared_statement(client, query, workgroup)
+            params["QueryString"] = f"EXECUTE {query.statement_name}"
+            params["ExecutionParameters"] = list(query.parameters)
+
+        max_age = self._result_reuse_max_age_minutes() if reuse_results else None
+        if max_age:
+            params["ResultReuseConfiguration"] = {
+                "ResultReuseByAgeConfiguration": {
+                    "Enabled": True,
+                    "MaxAgeInMinutes": max_age,
+                }
+            }
+
+        response = client.start_query_execution(**params)
+        query_execution_id = response["QueryExecutionId"]
+        logger.debug(f"[athena] QueryExecutionId: {query_execution_id}")
+        return query_execution_id
+
+    def _ensure_prepared_statement(
+        self, client, query: PreparedQuery, workgroup: str
+    ):
+        """WorkGroup에 prepared statement가 없으면 한 번만 생성합니다.
+
+        statement 이름에 템플릿 해시가 포함되어 있으므로, 같은 이름이 이미 있으면
+        같은 템플릿으로 만들어진 것으로 보고 그대로 사용합니다.
+        """
+        key = (workgroup, query.statement_name)
+        if key in self._prepared_statements:
+            return
 
-            # 쿼리 완료 대기
-            wait_start = time.time()
-            while True:
-                response = client.get_query_execution(
-                    QueryExecutionId=query_execution_id
+        with self._prepare_lock:
+            if key in self._prepared_statements:
+                return
+
+            try:
+                client.get_prepared_statement(
+                    StatementName=query.statement_name, WorkGroup=workgroup
                 )
-                status = response["QueryExecution"]["Status"]["State"]
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "ResourceNotFoundException":
+                    raise
+                try:
+                    client.create_prepared_statement(
+                        StatementName=query.statement_name,
+                        WorkGroup=workgroup,
+                        QueryStatement=query.template,
+                        Description="threelacha-streamlit dashboard query",
+                    )
+                    logger.info(f"[athena] prepared statement 생성: {query.statement_name}")
+                except ClientError as create_error:
+                    # 다른 프로세스가 먼저 만든 경우
+                    if "already exists" not in str(create_error).lower():
+                        raise
+
+            self._prepared_statements.add(key)
+
+    def _result_reuse_max_age_minutes(self) -> Optional[int]:
+        """결과 재사용 최대 기간(분)을 반환합니다 (재사용하지 않으면 None).
+
+        최대 기간은 설정값을 넘지 않으며, 현재 데이터 버전을 확인(감지)한 이후 경과한
+        시간으로 제한되어 갱신 전 데이터로 만들어진 결과는 재사용되지 않습니다.
+        이 프로세스에서 아직 데이터 버전을 확인하지 않았으면 재사용하지 않습니다.
+        """
+        max_age = self._result_reuse_max_age
+        if max_age <= 0 or self._data_version_changed_at is None:
+            return None
 
-                if status in ["SUCCEEDED", "FAILED", "CANCELLED"]:
-                    break
+        elapsed = int((time.time() - self._data_version_changed_at) // 60)
+        max_age = min(max_age, elapsed)
+
+        # Athena 허용 범위: 1분 ~ 7일
+        return min(max_age, 10080) if max_age >= 1 else None
+
+    def _on_data_version_change(self, old_version: Optional[str], new_version: str):
+        """데이터 버전 변경 시각을 기록하여 이전 결과의 재사용을 막습니다."""
+        self._data_version_changed_at = time.time()
+
+    def _get_query_executions(self, client, query_execution_ids: list[str]) -> dict:
+        """여러 쿼리의 실행 상태를 한 번의 호출로 조회합니다.
+
+        batch_get_query_execution은 호출당 최대 50개의 ID를 받으므로 나누어 조회합니다.
+        """
+        executions = {}
+        for i in range(0, len(query_execution_ids), 50):
+            response = client.batch_get_query_execution(
+                QueryExecutionIds=query_execution_ids[i : i + 50]
+            )
+            for execution in response.get("QueryExecutions", []):
+                executions[execution["QueryExecutionId"]] = execution
+
+            for unprocessed in response.get("UnprocessedQueryExecutionIds", []):
+                query_execution_id = unprocessed["QueryExecutionId"]
+                executions[query_execution_id] = client.get_query_execution(
+                    QueryExecutionId=query_execution_id
+                )["QueryExecution"]
+
+        return executions
 
-                time.sleep(1)
+    def _raise_for_status(self, execution: dict, connection_type: str):
+        """실패하거나 취소된 쿼리이면 예외를 발생시킵니다."""
+        status = execution["Status"]["State"]
 
-            wait_time = time.time() - wait_start
-            logger.debug(f"[{connection_type}] 쿼리 대기 시간: {wait_time:.2f}초")
+        if status == "FAILED":
+            reason = execution["Status"].get("StateChangeReason", "Unknown error")
+            error_msg = f"Athena 쿼리 실패: {reason}"
+            logger.error(f"[{connection_type}] {error_msg}")
+            raise Exception(error_msg)
+
+        if status == "CANCELLED":
+            error_msg = "Athena 쿼리가 취소되었습니다."
+            logger.warning(f"[{connection_type}] {error_msg}")
+            raise Exception(error_msg)
+
+    def _stop_queries(
+        self,
+        client,
+        pending: list[str],
+        queries: list[str],
+        query_execution_ids: list[str],
+        executions: dict[str, dict],
+        session_id: Optional[str] = None,
+    ):
+        """오류, 시간 초과, 스크립트 재실행으로 중단된 배치에서 아직 실행 중인 쿼리를 취소합니다.
+
+        절약한 스캔량은 같은 템플릿의 마지막 스캔 바이트에서 취소 직전까지 스캔한 바이트를
+        뺀 추정치이며, 이전 실행 기록이 없으면 0으로 봅니다.
+        """
+        if not pending:
+            return
 
-            if status == "FAILED":
-                reason = response["QueryExecution"]["Status"].get(
-                    "StateChangeReason", "Unknown error"
+        cancelled = 0
+        scanned_bytes = 0
+        saved_bytes = 0
+        for query_execution_id in pending:
+            try:
+                client.stop_query_execution(QueryExecutionId=query_execution_id)
+            except ClientError:
+                # 이미 완료된 쿼리는 취소할 수 없으므로 무시
+                continue
+
+            cancelled += 1
+            scanned = (
+                executions.get(query_execution_id, {})
+                .get("Statistics", {})
+                .get("DataScannedInBytes", 0)
+            )
+            template_id, _ = query_fingerprint(
+                queries[query_execution_ids.index(query_execution_id)]
+            )
+            scanned_bytes += scanned
+            # 취소된 쿼리도 취소 전까지 스캔한 만큼 과금됨
+            self._budget.charge(session_id, scanned)
+            saved_bytes += max(self._scanned_bytes.get(template_id, 0) - scanned, 0)
+            logger.debug(f"[athena] 쿼리 취소: {query_execution_id}")
+
+        if not cancelled:
+            return
+
+        with self._cancel_lock:
+            self._cancel_stats["cancelled"] += cancelled
+            self._cancel_stats["scanned_bytes_saved"] += saved_bytes
+
+        logger.warning(
+            f"[athena] 실행 중인 쿼리 {cancelled}건 취소 - "
+            f"취소 전 스캔: {scanned_bytes / 1024 / 1024:.1f} MB, "
+            f"절약한 스캔(추정): {saved_bytes / 1024 / 1024:.1f} MB"
+        )
+
+    def _remember_scanned_bytes(self, query: str, execution: dict):
+        """성공한 쿼리의 스캔 바이트를 템플릿별로 기록합니다 (재사용된 결과는 제외)."""
+        statistics = execution.get("Statistics", {})
+        if execution["Status"]["State"] != "SUCCEEDED" or statistics.get(
+            "ResultReuseInformation", {}
+        ).get("ReusedPreviousResult"):
+            return
+
+        template_id, _ = query_fingerprint(query)
+        self._scanned_bytes[template_id] = statistics.get("DataScannedInBytes", 0)
+
+    def _cancel_metric_lines(self) -> list[str]:
+        """취소 통계를 Prometheus 텍스트 형식의 줄 목록으로 반환합니다."""
+        stats = self.cancellation_stats()
+        return [
+            "# TYPE threelacha_athena_cancelled_queries_total counter",
+            format_metric("threelacha_athena_cancelled_queries_total", stats["cancelled"]),
+            "# TYPE threelacha_athena_scanned_bytes_saved_total counter",
+            format_metric(
+                "threelacha_athena_scanned_bytes_saved_total",
+                stats["scanned_bytes_saved"],
+            ),
+        ]
+
+    def _fetch_results(self, client, execution: dict) -> pd.DataFrame:
+        """완료된 쿼리의 결과를 가져옵니다.
+
+        s3 모드에서는 쿼리가 이미 기록한 출력 CSV를 직접 읽고,
+        CSV가 없는 쿼리(DDL 등)이거나 S3 읽기에 실패하면 get_query_results로 대체합니다.
+        """
+        query_execution_id = execution["QueryExecutionId"]
+        output_location = execution.get("ResultConfiguration", {}).get(
+            "OutputLocation", ""
+        )
+
+        if (
+            self._fetch_mode == "s3"
+            and execution.get("StatementType", "DML") == "DML"
+            and output_location.endswith(".csv")
+        ):
+            try:
+                # 컬럼 타입 정보만 얻기 위해 첫 페이지 1행만 조회
+                column_info = client.get_query_results(
+                    QueryExecutionId=query_execution_id, MaxResults=1
+                )["ResultSet"]["ResultSetMetadata"]["ColumnInfo"]
+                return self._fetch_results_from_s3(output_location, column_info)
+            except (ClientError, NoCredentialsError) as e:
+                logger.warning(
+                    f"[athena] S3 결과 읽기 실패, get_query_results로 대체: {e!s}"
                 )
-                error_msg = f"Athena 쿼리 실패: {reason}"
-                logger.error(f"[{connection_type}] {error_msg}")
-                raise Exception(error_msg)
-
-            if status == "CANCELLED":
-                error_msg = "Athena 쿼리가 취소되었습니다."
-                logger.warning(f"[{connection_type}] {error_msg}")
-                raise Exception(error_msg)
-
-            # 결과 가져오기
-            fetch_start = time.time()
-            results = client.get_query_results(QueryExecutionId=query_execution_id)
-
-            # 첫 번째 행은 컬럼명
-            columns = [
-                col["Name"]
-                for col in results["ResultSet"]["ResultSetMetadata"]["ColumnInfo"]
+
+        return self._fetch_results_from_api(client, query_execution_id)
+
+    def _fetch_results_from_s3(
+        self, output_location: str, column_info: Optional[list[dict]] = None
+    ) -> pd.DataFrame:
+        """S3 출력 CSV를 읽어 DataFrame으로 변환합니다.
+
+        파일이 ATHENA_S3_RANGE_SIZE보다 크면 Range 요청으로 나누어 병렬로 읽습니다.
+        """
+        parsed = urlparse(output_location)
+        bucket, key = parsed.netloc, parsed.path.lstrip("/")
+        s3 = self._get_s3_client()
+
+        size = s3.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        if size <= self._s3_range_size:
+            body = s3.get_object(Bucket=bucket, Key=key)["Body"].read()
+        else:
+            ranges = [
+                (start, min(start + self._s3_range_size, size) - 1)
+                for start in range(0, size, self._s3_range_size)
             ]
 
-            # 데이터 행 추출 (첫 번째 행 제외)
-            rows = []
-            for row in results["ResultSet"]["Rows"][1:]:
-                row_data = []
-                for col in row["Data"]:
-                    value = col.get("VarCharValue", "")
-                    # 숫자 타입 변환 시도
-                    try:
-                        if "." in value:
-                            row_data.append(float(value))
-                        else:
-                            row_data.append(int(value))
-                    except (ValueError, TypeError):
-                        row_data.append(value)
-                rows.append(row_data)
-
-            # DataFrame 생성
-            df = pd.DataFrame(rows, columns=columns)
-
-            # 다음 페이지가 있으면 계속 가져오기
-            next_token = results.get("NextToken")
-            while next_token:
-                results = client.get_query_results(
-                    QueryExecutionId=query_execution_id,
-                    NextToken=next_token,
+            def read_range(byte_range):
+                response = s3.get_object(
+                    Bucket=bucket, Key=key, Range=f"bytes={byte_range[0]}-{byte_range[1]}"
                 )
+                return response["Body"].read()
 
-                for row in results["ResultSet"]["Rows"]:
-                    row_data = []
-                    for col in row["Data"]:
-                        value = col.get("VarCharValue", "")
-                        try:
-                            if "." in value:
-                                row_data.append(float(value))
-                            else:
-                                row_data.append(int(value))
-                        except (ValueError, TypeError):
-                            row_data.append(value)
-                    rows.append(row_data)
-
-                next_token = results.get("NextToken")
-
-            # 최종 DataFrame 재생성 (모든 데이터 수집 후)
-            df = pd.DataFrame(rows, columns=columns)
-
-            fetch_time = time.time() - fetch_start
-            total_time = time.time() - start_time
+            max_workers = min(len(ranges), self._s3_max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                body = b"".join(executor.map(read_range, ranges))
 
-            logger.info(
-                f"[{connection_type}] 쿼리 완료 - "
-                f"총 시간: {total_time:.2f}초, "
-                f"대기 시간: {wait_time:.2f}초, "
-                f"결과 가져오기: {fetch_time:.2f}초, "
-                f"행 수: {len(df)}"
+        logger.debug(f"[athena] S3 결과 파일 읽기: {output_location} ({size:,} bytes)")
+
+        # 따옴표 없는 빈 필드만 NULL로 읽고 (빈 문자열 "" 유지) 컬럼 단위 타입 변환
+        return read_result_csv(body, column_info)
+
+    def _fetch_results_from_api(self, client, query_execution_id: str) -> pd.DataFrame:
+        """get_query_results로 결과를 모든 페이지에 걸쳐 가져옵니다."""
+        results = client.get_query_results(QueryExecutionId=query_execution_id)
+        column_info = results["ResultSet"]["ResultSetMetadata"]["ColumnInfo"]
+
+        # 데이터 행 추출 (첫 번째 행은 컬럼명이므로 제외)
+        rows = results["ResultSet"]["Rows"][1:]
+
+        # 다음 페이지가 있으면 계속 가져오기
+        next_token = results.get("NextToken")
+        while next_token:
+            results = client.get_query_results(
+                QueryExecutionId=query_execution_id,
+                NextToken=next_token,
             )
+            rows.extend(results["ResultSet"]["Rows"])
+            next_token = results.get("NextToken")
 
-            # Streamlit 세션 상태에 성능 정보 저장
-            if "query_performance" not in st.session_state:
-                st.session_state.query_performance = []
-
-            st.session_state.query_performance.append({
-                "connection_type": connection_type,
-                "total_time": total_time,
-                "wait_time": wait_time,
-                "fetch_time": fetch_time,
-                "row_count": len(df),
-                "query_preview": query[:100],
-            })
+        # ColumnInfo 타입 기준으로 컬럼 단위 변환
+        return decode_result_rows(column_info, rows)
+
+    def get_runtime_statistics(self, query_execution_id: str) -> dict:
+        """완료된 쿼리의 단계별 실행 시간과 처리량을 반환합니다.
 
-            return df
+        get_query_execution의 Statistics(대기열/계획/엔진 실행/결과 처리 시간, 스캔량)와
+        get_query_runtime_statistics의 Rows(입출력 행/바이트)를 합쳐 반환합니다.
+
+        Args:
+            query_execution_id: Athena QueryExecutionId
 
+        Returns:
+            dict: queue_ms, planning_ms, engine_ms, service_ms, total_ms, scanned_bytes,
+                input_rows, input_bytes, output_rows, output_bytes, reused (결과 재사용 여부)
+        """
+        client = self._get_client()
+        execution = client.get_query_execution(QueryExecutionId=query_execution_id)
+        statistics = execution["QueryExecution"].get("Statistics", {})
+
+        stats = {
+            "queue_ms": statistics.get("QueryQueueTimeInMillis"),
+            "planning_ms": statistics.get("QueryPlanningTimeInMillis"),
+            "engine_ms": statistics.get("EngineExecutionTimeInMillis"),
+            "service_ms": statistics.get("ServiceProcessingTimeInMillis"),
+            "total_ms": statistics.get("TotalExecutionTimeInMillis"),
+            "scanned_bytes": statistics.get("DataScannedInBytes"),
+            "reused": statistics.get("ResultReuseInformation", {}).get(
+                "ReusedPreviousResult", False
+            ),
+        }
+
+        try:
+            runtime = client.get_query_runtime_statistics(
+                QueryExecutionId=query_execution_id
+            )["QueryRuntimeStatistics"]
+            rows = runtime.get("Rows", {})
+            stats.update({
+                "input_rows": rows.get("InputRows"),
+                "input_bytes": rows.get("InputBytes"),
+                "output_rows": rows.get("OutputRows"),
+                "output_bytes": rows.get("OutputBytes"),
+            })
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", f"{e!s}")
-            error_msg = f"Athena 클라이언트 오류 ({error_code}): {error_message}"
-            logger.error(f"[{connection_type}] {error_msg}", exc_info=True)
-            raise Exception(error_msg) from e
-        except Exception as e:
-            error_msg = f"Athena 쿼리 실행 중 오류: {e!s}"
-            logger.error(f"[{connection_type}] {error_msg}", exc_info=True)
-            raise Exception(error_msg) from e
+            # DDL/재사용된 결과 등은 런타임 통계가 없을 수 있음
+            logger.debug(f"[athena] 런타임 통계 없음 ({query_execution_id}): {e!s}")
+
+        return stats
+
+    def _record_performance(
+        self,
+        connection_type: str,
+        query: str,
+        total_time: float,
+        wait_time: float,
+        fetch_time: float,
+        row_count: int,
+        poll_count: int,
+        query_execution_id: Optional[str] = None,
+        scanned_bytes: Optional[int] = None,
+        engine_time: Optional[float] = None,
+        queue_time: Optional[float] = None,
+    ):
+        """쿼리 성능 정보를 로깅하고 프로세스 전역 텔레메트리에 기록합니다."""
+        logger.info(
+            f"[{connection_type}] 쿼리 완료 - "
+            f"총 시간: {total_time:.2f}초, "
+            f"대기 시간: {wait_time:.2f}초, "
+            f"결과 가져오기: {fetch_time:.2f}초, "
+            f"폴링 횟수: {poll_count}, "
+            f"행 수: {row_count}, "
+            f"스캔: {(scanned_bytes or 0) / 1024 / 1024:.2f} MB"
+        )
+
+        telemetry.record(
+            connection_type,
+            query,
+            total_time=total_time,
+            wait_time=wait_time,
+            fetch_time=fetch_time,
+            row_count=row_count,
+            poll_count=poll_count,
+            query_execution_id=query_execution_id,
+            scanned_bytes=scanned_bytes,
+            engine_time=engine_time,
+            queue_time=queue_time,
+        )
+
+    @staticmethod
+    def _record_errors(
+        connection_type: str,
+        queries: list[str],
+        query_execution_ids: list[str],
+        results: dict,
+        error: Exception,
+    ):
+        """결과를 받지 못한 쿼리를 텔레메트리에 오류로 기록합니다."""
+        for i, query in enumerate(queries):
+            if i < len(query_execution_ids) and query_execution_ids[i] in results:
+                continue
+            telemetry.record_error(
+                connection_type,
+                query,
+                f"{error!s}",
+                timeout=isinstance(error, TimeoutError),
+            )
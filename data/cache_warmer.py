@@ -0,0 +1,259 @@
+"""새 데이터 버전 결과 캐시 예열 모듈
+
+매일 dbt 실행 후 각 지역/제철 품목/카테고리를 처음 여는 사용자는 Athena 콜드 지연을
+그대로 겪습니다. 프로세스당 하나의 백그라운드 스레드가 mart_update_status.latest_date를
+지켜보다가 버전이 바뀌면 화면에서 쓰는 쿼리 결과를 미리 결과 캐시에 채워 둡니다.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
+
+from data.connection import DatabaseConnection
+from data.data_version import get_data_version, get_version_tracker
+from data.logger import setup_logger
+from data.price_bundle import load_price_bundle
+from data.queries.channel_queries import DIST_CATEGORIES, get_channel_comparison_query
+from data.queries.eco_channel_queries import get_latest_price_statistics_query
+from data.queries.region_queries import get_region_stats_query
+from data.queries.season_queries import (
+    get_region_all_items_price_query,
+    get_season,
+    get_season_item_list,
+    get_season_region_price_query,
+)
+from data.telemetry import format_metric, telemetry
+
+logger = setup_logger("cache_warmer")
+
+
+class CacheWarmer:
+    """데이터 버전이 바뀔 때마다 화면 쿼리 결과를 결과 캐시에 미리 채우는 백그라운드 작업"""
+
+    def __init__(
+        self,
+        conn: DatabaseConnection,
+        max_workers: int = 4,
+        interval: float = 60.0,
+    ):
+        """
+        Args:
+            conn: 결과 캐시로 감싼 데이터베이스 연결 객체 (CachedConnection)
+            max_workers: 동시에 실행할 예열 쿼리 수
+            interval: 데이터 버전을 확인하는 주기 (초)
+        """
+        self._conn = conn
+        self._max_workers = max_workers
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._warmed_version: Optional[str] = None
+        self._progress = {
+            "version": None,
+            "state": "idle",
+            "total": 0,
+            "done": 0,
+            "failed": 0,
+            "started_at": None,
+            "finished_at": None,
+        }
+
+    def start(self):
+        """예열 스레드를 시작합니다 (이미 실행 중이면 무시)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="cache-warmer", daemon=True
+            )
+            self._thread.start()
+
+        # 다른 세션이 먼저 새 버전을 감지해도 바로 예열하도록 깨움
+        get_version_tracker(getattr(self._conn, "inner", self._conn)).add_listener(
+            self._on_version_change
+        )
+        telemetry.register_collector(self.metric_lines)
+        logger.info(
+            f"캐시 예열 스레드 시작 (동시 실행 {self._max_workers}개, 확인 주기 {self._interval:.0f}초)"
+        )
+
+    def progress(self) -> dict:
+        """현재(또는 마지막) 예열 진행 상황을 반환합니다.
+
+        Returns:
+            dict: version, state(idle/running/done/failed), total, done, failed, started_at, finished_at
+        """
+        with self._lock:
+            return dict(self._progress)
+
+    def metric_lines(self) -> list[str]:
+        """예열 진행 상황을 Prometheus 텍스트 형식의 줄 목록으로 반환합니다."""
+        progress = self.progress()
+        lines = ["# TYPE threelacha_cache_warm_queries gauge"]
+        for state in ("total", "done", "failed"):
+            lines.append(format_metric(
+                "threelacha_cache_warm_queries", progress[state], {"state": state}
+            ))
+        if progress["started_at"] and progress["finished_at"]:
+            lines += [
+                "# TYPE threelacha_cache_warm_duration_seconds gauge",
+                format_metric(
+                    "threelacha_cache_warm_duration_seconds",
+                    progress["finished_at"] - progress["started_at"],
+                ),
+            ]
+        return lines
+
+    def _on_version_change(self, old_version: Optional[str], new_version: str):
+        self._wake.set()
+
+    def _run(self):
+        """버전을 주기적으로 확인하고, 예열하지 않은 버전이면 예열합니다.
+
+        실패한 쿼리가 하나라도 있으면 예열 완료로 표시하지 않고 다음 주기에 다시 예열합니다.
+        성공한 쿼리는 이미 결과 캐시에 있으므로 재시도 때는 실패한 쿼리만 실제로 실행됩니다.
+        """
+        while True:
+            try:
+                version = get_data_version(self._conn)
+                if version != self._warmed_version and self.warm(version):
+                    self._warmed_version = version
+            except Exception as e:
+                with self._lock:
+                    self._progress.update(state="failed", finished_at=time.time())
+                logger.error(f"캐시 예열 실패: {e!s}", exc_info=True)
+
+            self._wake.wait(self._interval)
+            self._wake.clear()
+
+    def warm(self, version: str) -> bool:
+        """현재 데이터 버전의 화면 쿼리를 모두 실행하여 결과 캐시에 채웁니다.
+
+        Returns:
+            bool: 모든 쿼리가 성공했는지 여부 (실패가 있으면 state는 failed)
+        """
+        with self._lock:
+            self._progress.update(
+                version=version,
+                state="running",
+                total=0,
+                done=0,
+                failed=0,
+                started_at=time.time(),
+                finished_at=None,
+            )
+        logger.info(f"캐시 예열 시작: version={version}")
+
+        # 1단계: 목록 쿼리 (지역, 제철 품목) - 이후 쿼리의 파라미터가 됨
+        bundle = load_price_bundle(self._conn)
+        season_nm, item_df = self._conn.execute_many(
+            [get_season(conn=self._conn), get_season_item_list(conn=self._conn)],
+            allow_stale=False,
+        )
+        items = item_df["item_kind"].dropna().tolist()
+
+        # 2단계: 제철 품목별 지도 쿼리, 유통/친환경 페이지 쿼리
+        queries = [get_season_region_price_query(item_kind_filter=item, conn=self._conn) for item in items]
+        for category in DIST_CATEGORIES:
+            queries.append(get_channel_comparison_query(category_filter=category, limit=None, conn=self._conn))
+            queries.append(get_region_stats_query(category_filter=category, conn=self._conn))
+        queries.append(get_latest_price_statistics_query(conn=self._conn))
+        season_frames = self._execute_all(queries, item_count=len(items))
+
+        # 3단계: 지역별 전체 제철 품목 쿼리 (지역 목록 + 제철 마트에 있는 지역)
+        regions = set(bundle.countries)
+        for df in season_frames:
+            if df is not None and "country_nm" in df.columns:
+                regions.update(df["country_nm"].dropna().unique())
+        self._execute_all(
+            [get_region_all_items_price_query(region, conn=self._conn) for region in sorted(regions)]
+        )
+
+        with self._lock:
+            state = "failed" if self._progress["failed"] else "done"
+            self._progress.update(state=state, finished_at=time.time())
+            progress = dict(self._progress)
+        logger.info(
+            f"캐시 예열 완료: version={version}, {progress['done']}/{progress['total']}건 "
+            f"(실패 {progress['failed']}건), {progress['finished_at'] - progress['started_at']:.1f}초"
+        )
+        if progress["failed"]:
+            logger.warning(f"실패한 예열 쿼리 {progress['failed']}건은 다음 주기에 다시 실행합니다.")
+        return not progress["failed"]
+
+    def _execute_all(self, queries: list[str], item_count: int = 0) -> list:
+        """쿼리를 최대 max_workers개씩 동시에 실행하고 앞의 item_count개 결과를 반환합니다.
+
+        실패한 쿼리는 기록만 하고 건너뛰며, 다음 예열 주기(또는 사용자가 열 때) 다시 조회됩니다.
+        """
+        with self._lock:
+            self._progress["total"] += len(queries)
+
+        frames = [None] * item_count
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="cache-warmer"
+        ) as executor:
+            futures = {
+                executor.submit(self._conn.execute_query, query, allow_stale=False): i
+                for i, query in enumerate(queries)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    logger.warning(f"예열 쿼리 실패: {e!s}")
+                    with self._lock:
+                        self._progress["failed"] += 1
+                    continue
+
+                if i < item_count:
+                    frames[i] = df
+                with self._lock:
+                    self._progress["done"] += 1
+                    done, total = self._progress["done"], self._progress["total"]
+                if done % 10 == 0:
+                    logger.info(f"캐시 예열 진행: {done}/{total}")
+
+        return frames
+
+
+_warmer: Optional[CacheWarmer] = None
+_warmer_lock = threading.Lock()
+
+
+def start_cache_warmer(conn: DatabaseConnection) -> Optional[CacheWarmer]:
+    """프로세스당 한 번 캐시 예열 스레드를 시작합니다.
+
+    결과 캐시가 없는 연결이면 예열할 곳이 없으므로 시작하지 않습니다.
+
+    - CACHE_WARMER_ENABLED: 예열 사용 여부 (기본값 true)
+    - CACHE_WARMER_CONCURRENCY: 동시에 실행할 예열 쿼리 수 (기본값 4)
+    - CACHE_WARMER_INTERVAL: 데이터 버전 확인 주기 초 (기본값 60)
+
+    Returns:
+        Optional[CacheWarmer]: 실행 중인 예열 작업 (비활성화되었으면 None)
+    """
+    global _warmer
+    if os.getenv("CACHE_WARMER_ENABLED", "true").lower() != "true":
+        return None
+    if not hasattr(conn, "cache_stats"):
+        return None
+
+    with _warmer_lock:
+        if _warmer is None:
+            _warmer = CacheWarmer(
+                conn,
+                max_workers=int(os.getenv("CACHE_WARMER_CONCURRENCY", "4")),
+                interval=float(os.getenv("CACHE_WARMER_INTERVAL", "60")),
+            )
+            _warmer.start()
+        return _warmer
+
+
+def get_cache_warmer() -> Optional[CacheWarmer]:
+    """실행 중인 캐시 예열 작업을 반환합니다 (시작하지 않았으면 None)."""
+    return _warmer
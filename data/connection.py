@@ -1,5 +1,6 @@
 """데이터베이스 연결 추상 인터페이스 및 팩토리 모듈"""
 
+import threading
 from typing import Protocol, Literal
 import pandas as pd
 
@@ -19,6 +20,18 @@ class DatabaseConnection(Protocol):
         """
         ...
 
+    def execute_many(self, queries: list[str], **kwargs) -> list[pd.DataFrame]:
+        """서로 독립적인 여러 쿼리를 동시에 실행하고 DataFrame 리스트를 반환합니다.
+
+        Args:
+            queries: 실행할 SQL 쿼리 문자열 리스트
+            **kwargs: 데이터베이스별 추가 파라미터
+
+        Returns:
+            list[pd.DataFrame]: 입력 순서와 동일한 순서의 쿼리 결과 리스트
+        """
+        ...
+
     def get_config(self) -> tuple[str, str]:
         """데이터베이스 설정을 반환합니다.
 
@@ -28,13 +41,23 @@ class DatabaseConnection(Protocol):
         ...
 
 
+_connections: dict[tuple[str, bool], "DatabaseConnection"] = {}
+_connections_lock = threading.Lock()
+
+
 def get_database_connection(
-    db_type: Literal["rds", "athena"] = "athena",
+    db_type: Literal["rds", "athena", "local", "fixture"] = "athena",
+    use_cache: bool = False,
 ) -> DatabaseConnection:
-    """이터베이스 연결 팩토리 함수
+    """데이터베이스 연결 팩토리 함수
+
+    같은 (db_type, use_cache) 조합에 대해서는 프로세스 전체에서 하나의 연결 객체를
+    공유합니다. 연결 객체는 스레드 안전하므로 여러 Streamlit 세션/재실행에서 그대로
+    재사용되며, boto3 클라이언트와 SQLAlchemy 커넥션 풀도 한 번만 생성됩니다.
 
     Args:
-        db_type: 데이터베이스 타입 ("rds" 또는 "athena")
+        db_type: 데이터베이스 타입 ("rds", "athena", "local" 또는 "fixture")
+        use_cache: True이면 데이터 버전 기반 결과 캐시(CachedConnection)로 감싸서 반환
 
     Returns:
         DatabaseConnection: 데이터베이스 연결 객체
@@ -46,16 +69,53 @@ def get_database_connection(
 
         >>> # Athena 연결 사용
         >>> conn = get_database_connection("athena")
+
+        >>> # 로컬 DuckDB 마트 미러 사용 (scripts/sync_local_marts.py로 동기화)
+        >>> conn = get_database_connection("local")
+
+        >>> # 레포의 마트 픽스처로 오프라인 실행 (FIXTURE_LATENCY=athena로 지연 재현)
+        >>> conn = get_database_connection("fixture")
+
+        >>> # 결과 캐시 사용
+        >>> conn = get_database_connection("athena", use_cache=True)
     """
+    key = (db_type, use_cache)
+    conn = _connections.get(key)
+    if conn is not None:
+        return conn
+
+    with _connections_lock:
+        if key not in _connections:
+            _connections[key] = _create_connection(db_type, use_cache)
+        return _connections[key]
+
+
+def _create_connection(db_type: str, use_cache: bool) -> DatabaseConnection:
+    """새 데이터베이스 연결 객체를 생성합니다."""
     if db_type == "rds":
         from data.rds_connection import RDSConnection
 
-        return RDSConnection()
+        conn = RDSConnection()
     elif db_type == "athena":
         from data.athena_connection import AthenaConnection
 
-        return AthenaConnection()
+        conn = AthenaConnection()
+    elif db_type == "local":
+        from data.local_connection import LocalConnection
+
+        conn = LocalConnection()
+    elif db_type == "fixture":
+        from data.fixture_connection import FixtureConnection
+
+        conn = FixtureConnection()
     else:
         raise ValueError(
-            f"지원하지 않는 데이터베이스 타입: {db_type}. 'rds' 또는 'athena'를 사용하세요."
+            f"지원하지 않는 데이터베이스 타입: {db_type}. 'rds', 'athena', 'local' 또는 'fixture'를 사용하세요."
         )
+
+    if use_cache:
+        from data.query_cache import CachedConnection
+
+        return CachedConnection(conn)
+
+    return conn
@@ -0,0 +1,121 @@
+"""데이터 버전(mart_update_status.latest_date) 추적 모듈"""
+
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from data.connection import DatabaseConnection
+from data.logger import setup_logger
+from data.queries.meta_queries import get_update_status_query
+
+logger = setup_logger("data_version")
+
+
+class DataVersionTracker:
+    """mart_update_status.latest_date를 데이터 버전으로 추적하는 클래스
+
+    ttl초 동안은 마지막으로 읽은 버전을 그대로 사용하고, 그 이후 처음 요청될 때
+    다시 조회합니다. 버전이 바뀌면 등록된 리스너를 (이전 버전, 새 버전)으로 호출합니다.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self._ttl = ttl
+        self._lock = threading.RLock()
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+        self._changed_at = 0.0
+        self._listeners: list[Callable[[Optional[str], str], None]] = []
+
+    @property
+    def version(self) -> Optional[str]:
+        """마지막으로 확인한 데이터 버전 (아직 조회 전이면 None)"""
+        return self._version
+
+    @property
+    def changed_at(self) -> float:
+        """데이터 버전이 마지막으로 바뀐 것을 감지한 시각 (epoch 초)"""
+        return self._changed_at
+
+    def add_listener(self, callback: Callable[[Optional[str], str], None]):
+        """버전 변경 시 호출될 콜백을 등록합니다."""
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def get(self, conn: DatabaseConnection) -> str:
+        """현재 데이터 버전을 반환합니다 (TTL이 지났으면 다시 조회).
+
+        Args:
+            conn: 버전 조회에 사용할 (캐시되지 않은) 데이터베이스 연결 객체
+
+        Returns:
+            str: 데이터 버전 문자열
+        """
+        with self._lock:
+            if self._version is None or time.time() - self._checked_at >= self._ttl:
+                self.refresh(conn)
+            return self._version
+
+    def refresh(self, conn: DatabaseConnection) -> str:
+        """데이터 버전을 즉시 다시 조회합니다.
+
+        조회는 결과 재사용 없이(reuse_results=False) 실행됩니다.
+        조회에 실패하면 이전 버전을 유지하며, 이전 버전도 없으면 예외를 그대로 발생시킵니다.
+        """
+        with self._lock:
+            try:
+                # 재사용된 이전 결과로는 새 버전을 감지할 수 없으므로 항상 새로 조회
+                status_df = conn.execute_query(
+                    get_update_status_query(conn=conn), reuse_results=False
+                )
+                new_version = str(status_df["latest_date"].iloc[0])
+            except Exception as e:
+                if self._version is None:
+                    raise
+                logger.warning(f"데이터 버전 조회 실패, 이전 버전 유지: {e!s}")
+                self._checked_at = time.time()
+                return self._version
+
+            old_version = self._version
+            self._version = new_version
+            self._checked_at = time.time()
+
+            if old_version != new_version:
+                self._changed_at = self._checked_at
+                logger.info(f"데이터 버전 변경: {old_version} -> {new_version}")
+                for callback in list(self._listeners):
+                    try:
+                        callback(old_version, new_version)
+                    except Exception as e:
+                        logger.error(f"데이터 버전 리스너 오류: {e!s}", exc_info=True)
+
+            return new_version
+
+
+_trackers: dict[tuple, DataVersionTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_version_tracker(conn: DatabaseConnection) -> DataVersionTracker:
+    """연결 설정(get_config)별로 프로세스 전역에서 공유되는 버전 추적기를 반환합니다.
+
+    TTL은 DATA_VERSION_TTL 환경 변수(초, 기본값 60)로 지정합니다.
+    """
+    key = (conn.__class__.__name__, *conn.get_config())
+    with _trackers_lock:
+        if key not in _trackers:
+            _trackers[key] = DataVersionTracker(
+                ttl=float(os.getenv("DATA_VERSION_TTL", "60"))
+            )
+        return _trackers[key]
+
+
+def get_data_version(conn: DatabaseConnection) -> str:
+    """연결 객체의 현재 데이터 버전을 반환합니다.
+
+    연결 객체가 자체적으로 data_version을 제공하면(예: CachedConnection) 그것을 사용합니다.
+    """
+    if hasattr(conn, "data_version"):
+        return conn.data_version
+    return get_version_tracker(conn).get(conn)
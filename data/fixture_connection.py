@@ -0,0 +1,148 @@
+"""픽스처(CSV/Parquet) 기반 오프라인 연결 모듈
+
+레포에 포함된 마트 픽스처(fixtures/marts/<table>.csv|parquet)를 메모리 DuckDB에 올려
+기존 쿼리 빌더에 그대로 응답합니다. AWS 자격 증명 없이 앱을 실행하거나,
+LatencyModel로 Athena의 대기열/실행 시간을 흉내 내어 페이지 단위 성능을 측정할 수 있습니다.
+"""
+
+import os
+import random
+import threading
+from pathlib import Path
+from typing import Optional
+
+from data.local_connection import LocalConnection, _import_duckdb
+from data.logger import setup_logger
+
+logger = setup_logger("fixture_connection")
+
+
+class LatencyModel:
+    """쿼리당 지연 시간(대기열 + 실행)을 로그 정규 분포로 생성하는 모델
+
+    Athena는 짧은 쿼리도 대기열 대기와 실행에 수백 ms ~ 수 초가 걸리고,
+    꼬리 지연이 긴 분포를 보이므로 중앙값과 분산으로 이를 근사합니다.
+    """
+
+    # 프리셋: (대기열 중앙값, 실행 시간 중앙값, 로그 표준편차)
+    PRESETS = {
+        "none": (0.0, 0.0, 0.0),
+        "athena": (0.25, 0.8, 0.5),
+        "rds": (0.0, 0.03, 0.3),
+    }
+
+    def __init__(
+        self,
+        queue_time: float = 0.25,
+        execution_time: float = 0.8,
+        sigma: float = 0.5,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            queue_time: 대기열 대기 시간 중앙값 (초)
+            execution_time: 실행 시간 중앙값 (초)
+            sigma: 로그 정규 분포의 표준편차 (0이면 항상 중앙값)
+            seed: 난수 시드 (재현 가능한 벤치마크용)
+        """
+        self.queue_time = queue_time
+        self.execution_time = execution_time
+        self.sigma = sigma
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["LatencyModel"]:
+        """FIXTURE_LATENCY 환경 변수로 지연 모델을 생성합니다.
+
+        - 프리셋 이름: none(기본값), athena, rds
+        - 또는 "대기열,실행,표준편차" 형식의 숫자 (예: 0.5,1.2,0.4)
+
+        Returns:
+            Optional[LatencyModel]: 지연이 없으면 None
+        """
+        value = os.getenv("FIXTURE_LATENCY", "none").strip().lower()
+        if value in cls.PRESETS:
+            queue_time, execution_time, sigma = cls.PRESETS[value]
+        else:
+            try:
+                queue_time, execution_time, sigma = (float(v) for v in value.split(","))
+            except ValueError as e:
+                raise ValueError(
+                    f"잘못된 FIXTURE_LATENCY 값: {value}. "
+                    f"{', '.join(cls.PRESETS)} 또는 '대기열,실행,표준편차' 형식을 사용하세요."
+                ) from e
+
+        if queue_time <= 0 and execution_time <= 0:
+            return None
+        return cls(queue_time, execution_time, sigma)
+
+    def sample(self) -> float:
+        """쿼리 하나의 지연 시간(초)을 생성합니다."""
+        with self._lock:
+            return sum(
+                median * self._random.lognormvariate(0.0, self.sigma)
+                for median in (self.queue_time, self.execution_time)
+                if median > 0
+            )
+
+
+class FixtureConnection(LocalConnection):
+    """마트 픽스처 파일을 메모리 DuckDB로 조회하는 오프라인 연결 클래스"""
+
+    _connection_type = "fixture"
+
+    def __init__(
+        self,
+        fixture_dir: Optional[str] = None,
+        schema: Optional[str] = None,
+        latency: Optional[LatencyModel] = None,
+    ):
+        """
+        Args:
+            fixture_dir: <table>.csv 또는 <table>.parquet 파일이 있는 디렉토리
+                (기본값: FIXTURE_DIR 또는 fixtures/marts)
+            schema: 쿼리 빌더가 사용할 스키마 이름 (기본값: LOCAL_DB_SCHEMA 또는 team3_gold)
+            latency: 쿼리마다 추가할 지연 모델 (기본값: FIXTURE_LATENCY 환경 변수)
+        """
+        fixture_dir = fixture_dir or os.getenv("FIXTURE_DIR", "fixtures/marts")
+        super().__init__(path=fixture_dir, schema=schema)
+        self._latency = latency if latency is not None else LatencyModel.from_env()
+
+    def _get_connection(self):
+        """픽스처를 모두 올린 메모리 DuckDB 연결을 반환합니다 (처음 한 번만 로드)."""
+        if self._conn is None:
+            with self._conn_lock:
+                if self._conn is None:
+                    self._conn = self._load_fixtures()
+        return self._conn
+
+    def _load_fixtures(self):
+        """픽스처 디렉토리의 모든 CSV/Parquet 파일을 스키마 아래 테이블로 만듭니다."""
+        duckdb = _import_duckdb()
+        fixture_dir = Path(self._path)
+        files = sorted(fixture_dir.glob("*.csv")) + sorted(fixture_dir.glob("*.parquet"))
+        if not files:
+            raise FileNotFoundError(
+                f"픽스처 파일이 없습니다: {fixture_dir} "
+                "(python -m scripts.generate_fixture_marts로 생성하세요)"
+            )
+
+        conn = duckdb.connect(":memory:")
+        conn.execute(f"CREATE SCHEMA IF NOT EXISTS {self._schema}")
+        for path in files:
+            reader = "read_parquet" if path.suffix == ".parquet" else "read_csv_auto"
+            conn.execute(
+                f"CREATE OR REPLACE TABLE {self._schema}.{path.stem} "
+                f"AS SELECT * FROM {reader}(?)",
+                [str(path)],
+            )
+
+        logger.info(f"[fixture] 픽스처 {len(files)}개 로드: {fixture_dir}")
+        return conn
+
+    def _simulated_latency(self, query_count: int) -> list[float]:
+        """지연 모델이 있으면 쿼리별 지연 시간을 생성합니다."""
+        if self._latency is None:
+            return []
+        return [self._latency.sample() for _ in range(query_count)]
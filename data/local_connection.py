@@ -0,0 +1,309 @@
+"""로컬 임베디드(DuckDB) 마트 미러 연결 모듈
+
+대시보드가 읽는 gold 마트는 모두 작고, 읽기 전용이며, 하루 한 번 갱신됩니다.
+sync_local_marts()로 Athena/RDS의 마트를 DuckDB 파일 하나에 복제해 두면
+기존 쿼리 빌더를 그대로 로컬에서 실행할 수 있어 조회가 수 ms로 끝나고,
+트래픽이 늘어도 Athena 스캔 비용이 늘지 않습니다.
+
+duckdb는 선택 의존성입니다 (uv sync --extra local).
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from data.connection import DatabaseConnection
+from data.logger import setup_logger
+from data.queries.query_utils import normalize_sql
+from data.single_flight import SingleFlight
+from data.telemetry import telemetry
+from data.queries.meta_queries import get_update_status_query
+
+logger = setup_logger("local_connection")
+
+# 대시보드가 읽는 gold 마트 목록 (동기화 대상)
+MART_TABLES = (
+    "mart_update_status",
+    "mart_price_drop_top3",
+    "mart_price_rise_top3",
+    "mart_price_region_count",
+    "mart_season_region_product",
+    "mart_retail_channel_comparison",
+    "mart_retail_region_comparison",
+    "mart_eco_price_statistics_by_category",
+)
+
+
+def _import_duckdb():
+    """duckdb를 지연 import합니다 (설치되어 있지 않으면 안내 메시지와 함께 실패)."""
+    try:
+        import duckdb
+    except ImportError as e:
+        raise ImportError(
+            "로컬 연결에는 duckdb가 필요합니다. 'uv sync --extra local'로 설치하세요."
+        ) from e
+    return duckdb
+
+
+class LocalConnection(DatabaseConnection):
+    """DuckDB 파일에 복제된 gold 마트를 조회하는 연결 클래스
+
+    동기화 작업은 새 파일을 만든 뒤 원자적으로 교체하므로, 파일이 바뀐 것을
+    감지하면 다음 쿼리부터 새 파일을 다시 엽니다.
+    """
+
+    _connection_type = "local"
+
+    def __init__(self, path: Optional[str] = None, schema: Optional[str] = None):
+        """
+        Args:
+            path: DuckDB 파일 경로 (기본값: LOCAL_DB_PATH 또는 .cache/marts.duckdb)
+            schema: 마트가 들어 있는 스키마 이름
+                (기본값: LOCAL_DB_SCHEMA 또는 ATHENA_DATABASE와 동일한 team3_gold)
+        """
+        self._path = path or os.getenv("LOCAL_DB_PATH", ".cache/marts.duckdb")
+        self._schema = schema or os.getenv(
+            "LOCAL_DB_SCHEMA", os.getenv("ATHENA_DATABASE", "team3_gold")
+        )
+        self._conn = None
+        self._conn_mtime: Optional[int] = None
+        self._conn_lock = threading.Lock()
+        self._flight = SingleFlight(self._connection_type)
+        logger.info(
+            f"LocalConnection 초기화: path={self._path}, schema={self._schema}"
+        )
+
+    def get_config(self) -> tuple[str, str]:
+        """로컬 DB 설정을 반환합니다.
+
+        Returns:
+            tuple[str, str]: schema, path
+        """
+        return self._schema, self._path
+
+    def _get_connection(self):
+        """DuckDB 연결을 반환합니다 (파일이 교체되었으면 다시 엶)."""
+        try:
+            mtime = os.stat(self._path).st_mtime_ns
+        except FileNotFoundError as e:
+            raise FileNotFoundError(
+                f"로컬 마트 파일이 없습니다: {self._path} "
+                "(python -m scripts.sync_local_marts로 먼저 동기화하세요)"
+            ) from e
+
+        if self._conn is None or self._conn_mtime != mtime:
+            with self._conn_lock:
+                if self._conn is None or self._conn_mtime != mtime:
+                    duckdb = _import_duckdb()
+                    # 이전 연결은 다른 스레드의 cursor가 아직 사용 중일 수 있으므로
+                    # 명시적으로 닫지 않고 참조가 사라질 때 정리되도록 둠
+                    self._conn = duckdb.connect(self._path, read_only=True)
+                    self._conn_mtime = mtime
+                    logger.info(f"[local] 로컬 마트 파일 열기: {self._path}")
+
+        return self._conn
+
+    def execute_query(self, query: str, **kwargs) -> pd.DataFrame:
+        """로컬 DuckDB에서 쿼리를 실행하고 DataFrame으로 반환합니다.
+
+        Args:
+            query: 실행할 SQL 쿼리 문자열
+            **kwargs: 추가 파라미터 (사용되지 않지만 호환성을 위해 유지)
+
+        Returns:
+            pd.DataFrame: 쿼리 결과를 담은 DataFrame
+        """
+        return self.execute_many([query], **kwargs)[0]
+
+    def execute_many(self, queries: list[str], **kwargs) -> list[pd.DataFrame]:
+        """여러 쿼리를 순서대로 실행합니다 (로컬 조회는 수 ms라 병렬화하지 않음).
+
+        다른 세션에서 같은 쿼리가 이미 실행 중이면 그 결과를 기다려 복사본을 받습니다.
+
+        Args:
+            queries: 실행할 SQL 쿼리 문자열 리스트
+            **kwargs: 추가 파라미터 (사용되지 않지만 호환성을 위해 유지)
+
+        Returns:
+            list[pd.DataFrame]: 입력 순서와 동일한 순서의 쿼리 결과 리스트
+        """
+        if not queries:
+            return []
+
+        return self._flight.execute_many(
+            [f"{self._path}|{self._schema}|{normalize_sql(query)}" for query in queries],
+            queries,
+            self._execute_many,
+        )
+
+    def single_flight_stats(self) -> dict:
+        """동일 쿼리 병합 통계 (실행 수, 절약된 실행 수, 진행 중인 쿼리 수)를 반환합니다."""
+        return self._flight.stats()
+
+    def _execute_many(self, queries: list[str]) -> list[pd.DataFrame]:
+        """쿼리를 실제로 실행합니다."""
+        connection_type = self._connection_type
+        dataframes: list[pd.DataFrame] = []
+
+        try:
+            # 지연 모델이 있으면 (예: FixtureConnection) 동시에 제출된 쿼리처럼 가장 긴 지연만큼 대기
+            delays = self._simulated_latency(len(queries))
+            if delays:
+                time.sleep(max(delays))
+            else:
+                delays = [0.0] * len(queries)
+
+            # cursor()는 같은 DB를 공유하는 별도 연결이므로 여러 스레드에서 안전하게 사용 가능
+            cursor = self._get_connection().cursor()
+            try:
+                for query, delay in zip(queries, delays):
+                    start_time = time.time()
+                    logger.debug(f"[{connection_type}] 쿼리: {query[:200]}...")
+                    df = _restore_dates(cursor.execute(str(query)))
+                    fetch_time = time.time() - start_time
+                    self._record_performance(
+                        connection_type, query, delay + fetch_time, delay, len(df)
+                    )
+                    dataframes.append(df)
+                return dataframes
+            finally:
+                cursor.close()
+        except Exception as e:
+            for query in queries[len(dataframes):]:
+                telemetry.record_error(connection_type, query, f"{e!s}")
+            error_msg = f"로컬 쿼리 실행 중 오류: {e!s}"
+            logger.error(f"[{connection_type}] {error_msg}", exc_info=True)
+            raise Exception(error_msg) from e
+
+    def _simulated_latency(self, query_count: int) -> list[float]:
+        """쿼리별로 추가할 지연 시간(초)을 반환합니다 (로컬 연결은 지연 없음)."""
+        return []
+
+    def _record_performance(
+        self,
+        connection_type: str,
+        query: str,
+        total_time: float,
+        wait_time: float,
+        row_count: int,
+    ):
+        """쿼리 성능 정보를 로깅하고 프로세스 전역 텔레메트리에 기록합니다."""
+        logger.info(
+            f"[{connection_type}] 쿼리 완료 - "
+            f"총 시간: {total_time:.3f}초, "
+            f"대기 시간: {wait_time:.3f}초, "
+            f"행 수: {row_count}"
+        )
+
+        telemetry.record(
+            connection_type,
+            query,
+            total_time=total_time,
+            wait_time=wait_time,
+            row_count=row_count,
+        )
+
+
+def _restore_dates(cursor) -> pd.DataFrame:
+    """결과를 DataFrame으로 변환하고 DATE 컬럼은 Athena 결과와 같이 datetime.date로 맞춥니다."""
+    date_columns = [
+        name for name, type_code, *_ in cursor.description if str(type_code) == "DATE"
+    ]
+    df = cursor.df()
+    for name in date_columns:
+        df[name] = df[name].dt.date
+    return df
+
+
+def read_local_version(path: str, schema: str) -> Optional[str]:
+    """로컬 마트 파일의 데이터 버전(latest_date)을 반환합니다 (없거나 읽을 수 없으면 None)."""
+    if not os.path.exists(path):
+        return None
+
+    duckdb = _import_duckdb()
+    try:
+        with duckdb.connect(path, read_only=True) as conn:
+            row = conn.execute(
+                f"SELECT latest_date FROM {schema}.mart_update_status"
+            ).fetchone()
+    except Exception as e:
+        logger.warning(f"로컬 마트 버전 조회 실패 ({path}): {e!s}")
+        return None
+
+    return str(row[0]) if row else None
+
+
+def sync_local_marts(
+    source: DatabaseConnection,
+    path: Optional[str] = None,
+    schema: Optional[str] = None,
+    force: bool = False,
+) -> bool:
+    """원본(Athena/RDS)의 gold 마트를 로컬 DuckDB 파일로 복제합니다.
+
+    원본의 mart_update_status.latest_date가 로컬 파일과 같으면 아무것도 하지 않습니다.
+    새 파일을 임시 경로에 모두 쓴 뒤 os.replace로 교체하므로, 동기화 중에도
+    대시보드는 이전 파일을 끝까지 읽을 수 있습니다.
+    원본 쿼리는 모두 결과 재사용 없이(reuse_results=False) 실행합니다.
+
+    Args:
+        source: 마트를 읽어올 원본 데이터베이스 연결 객체
+        path: DuckDB 파일 경로 (기본값: LOCAL_DB_PATH 또는 .cache/marts.duckdb)
+        schema: 로컬 스키마 이름 (기본값: LOCAL_DB_SCHEMA 또는 team3_gold)
+        force: True이면 버전이 같아도 다시 복제
+
+    Returns:
+        bool: 복제를 수행했으면 True, 이미 최신이라 건너뛰었으면 False
+    """
+    duckdb = _import_duckdb()
+    local = LocalConnection(path, schema)
+    schema, path = local.get_config()
+
+    # 원본의 재사용된 이전 결과로 새 버전을 표시하지 않도록 결과 재사용 없이 조회
+    status_df = source.execute_query(
+        get_update_status_query(conn=source), reuse_results=False
+    )
+    source_version = str(status_df["latest_date"].iloc[0])
+    local_version = read_local_version(path, schema)
+
+    if not force and source_version == local_version:
+        logger.info(f"로컬 마트가 최신입니다: version={local_version}")
+        return False
+
+    logger.info(f"로컬 마트 동기화 시작: {local_version} -> {source_version}")
+    start_time = time.time()
+
+    source_database, _ = source.get_config()
+    dataframes = source.execute_many(
+        [f"SELECT * FROM {source_database}.{table}" for table in MART_TABLES],
+        reuse_results=False,
+    )
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    try:
+        with duckdb.connect(tmp_path) as conn:
+            conn.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+            for table, df in zip(MART_TABLES, dataframes):
+                conn.register("mart_df", df)
+                conn.execute(f"CREATE TABLE {schema}.{table} AS SELECT * FROM mart_df")
+                conn.unregister("mart_df")
+                logger.info(f"  {table}: {len(df)}행")
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    logger.info(
+        f"로컬 마트 동기화 완료: version={source_version}, "
+        f"소요 시간: {time.time() - start_time:.2f}초"
+    )
+    return True
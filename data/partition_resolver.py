@@ -0,0 +1,90 @@
+"""마트별 최신 파티션(res_dt) 조회 모듈
+
+일자별 마트를 조회할 때마다 WITH latest_date AS (SELECT MAX(res_dt) ...)를 붙이면
+Athena는 실제 쿼리를 시작하기 전에 테이블 전체를 훑어야 합니다. 데이터 버전마다
+모든 마트의 최신 res_dt를 한 번에 조회해 두고, 쿼리 빌더는 이를 리터럴
+res_dt = DATE '...' 조건으로 사용하여 파티션 프루닝이 적용되게 합니다.
+"""
+
+import threading
+from datetime import date
+from typing import Optional
+
+import pandas as pd
+
+from data.connection import DatabaseConnection
+from data.data_version import get_data_version
+from data.logger import setup_logger
+from data.queries.meta_queries import get_latest_partitions_query
+
+logger = setup_logger("partition_resolver")
+
+# res_dt로 파티션된 일자별 마트
+RES_DT_MARTS = (
+    "mart_retail_channel_comparison",
+    "mart_retail_region_comparison",
+    "mart_eco_price_statistics_by_category",
+)
+
+# 연결 설정별 (데이터 버전, 마트 -> 최신 res_dt)
+_partitions: dict[tuple, tuple[str, dict[str, Optional[date]]]] = {}
+_partitions_lock = threading.Lock()
+
+
+def get_latest_partition(conn: DatabaseConnection, table: str) -> Optional[date]:
+    """마트의 최신 res_dt를 반환합니다.
+
+    연결 설정별로 마지막 데이터 버전의 결과만 프로세스 전역에 보관하며,
+    버전이 바뀐 뒤 처음 호출될 때 RES_DT_MARTS 전체를 한 쿼리로 다시 조회합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+        table: 마트 테이블 이름 (RES_DT_MARTS 중 하나)
+
+    Returns:
+        Optional[date]: 최신 res_dt (마트가 비어 있으면 None)
+    """
+    if table not in RES_DT_MARTS:
+        raise ValueError(f"res_dt 파티션 마트가 아닙니다: {table}")
+
+    key = (conn.__class__.__name__, *conn.get_config())
+    version = get_data_version(conn)
+
+    cached = _partitions.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1].get(table)
+
+    with _partitions_lock:
+        cached = _partitions.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1].get(table)
+
+        # 이전 버전 결과로 답하면 새 버전 쿼리에 지난 날짜가 들어가므로 항상 새로 조회
+        df = conn.execute_query(
+            get_latest_partitions_query(list(RES_DT_MARTS), conn=conn), allow_stale=False
+        )
+        latest = {
+            row.table_nm: _to_date(row.max_date) for row in df.itertuples(index=False)
+        }
+        _partitions[key] = (version, latest)
+        logger.info(f"최신 파티션 조회: version={version}, {latest}")
+        return latest.get(table)
+
+
+def resolved_partition_dates(conn: DatabaseConnection) -> set[date]:
+    """이미 조회해 둔 최신 res_dt 값들을 반환합니다 (새로 조회하지 않음).
+
+    Returns:
+        set[date]: 마지막으로 조회한 데이터 버전의 최신 res_dt 집합 (조회한 적 없으면 빈 집합)
+    """
+    cached = _partitions.get((conn.__class__.__name__, *conn.get_config()))
+    if cached is None:
+        return set()
+    return {latest for latest in cached[1].values() if latest is not None}
+
+
+def _to_date(value) -> Optional[date]:
+    """드라이버마다 다른 날짜 표현(date/Timestamp/문자열)을 date로 통일합니다."""
+    if value is None or pd.isna(value):
+        return None
+    return pd.Timestamp(value).date()
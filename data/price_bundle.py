@@ -0,0 +1,128 @@
+"""지역별 가격 마트 번들 로더 모듈
+
+mart_price_drop_top3, mart_price_rise_top3, mart_price_region_count는 지역 수 x 3행
+정도의 작은 테이블입니다. 데이터 버전마다 세 마트 전체를 한 번에 조회해
+country_nm 기준으로 나누어 두고, 지역 선택이 바뀌면 DB 조회 없이 로컬에서 잘라 씁니다.
+"""
+
+import threading
+from typing import Optional
+
+import pandas as pd
+
+from data.connection import DatabaseConnection
+from data.data_version import get_data_version
+from data.logger import setup_logger
+from data.query_cache import is_refreshing
+from data.queries.price_queries import (
+    get_price_drop_top3_query,
+    get_price_region_rate_query,
+    get_price_rise_top3_query,
+)
+
+logger = setup_logger("price_bundle")
+
+
+class PriceBundle:
+    """한 데이터 버전의 지역별 가격 마트를 country_nm 기준으로 나누어 보관하는 클래스"""
+
+    def __init__(
+        self,
+        version: str,
+        drop_df: pd.DataFrame,
+        rise_df: pd.DataFrame,
+        rate_df: pd.DataFrame,
+    ):
+        """
+        Args:
+            version: 데이터 버전 (mart_update_status.latest_date)
+            drop_df: mart_price_drop_top3 전체 결과
+            rise_df: mart_price_rise_top3 전체 결과
+            rate_df: mart_price_region_count 전체 결과
+        """
+        self.version = version
+        self._drop = _split_by_country(drop_df)
+        self._rise = _split_by_country(rise_df)
+        self._rate = _split_by_country(rate_df)
+        self._empty = {
+            "drop": drop_df.iloc[0:0],
+            "rise": rise_df.iloc[0:0],
+            "rate": rate_df.iloc[0:0],
+        }
+
+    @property
+    def countries(self) -> list[str]:
+        """하락 TOP3 마트에 존재하는 지역 목록 (가나다순)"""
+        return sorted(self._drop)
+
+    def drop_top3(self, country: str) -> pd.DataFrame:
+        """지역의 전일 대비 가격 하락 TOP3 (ranking 순)"""
+        return self._slice(self._drop, "drop", country)
+
+    def rise_top3(self, country: str) -> pd.DataFrame:
+        """지역의 전일 대비 가격 상승 TOP3 (ranking 순)"""
+        return self._slice(self._rise, "rise", country)
+
+    def region_rate(self, country: str) -> pd.DataFrame:
+        """지역의 상승/하락/유지 품목 개수"""
+        return self._slice(self._rate, "rate", country)
+
+    def _slice(
+        self, frames: dict[str, pd.DataFrame], name: str, country: str
+    ) -> pd.DataFrame:
+        # 호출 측에서 컬럼을 추가해도 번들이 바뀌지 않도록 복사본을 반환
+        return frames.get(country, self._empty[name]).copy()
+
+
+def _split_by_country(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """DataFrame을 country_nm별로 나눕니다 (각 지역 내 행 순서 유지)."""
+    return {
+        country: group.reset_index(drop=True)
+        for country, group in df.groupby("country_nm", sort=False)
+    }
+
+
+_bundles: dict[tuple, PriceBundle] = {}
+_bundles_lock = threading.Lock()
+
+
+def load_price_bundle(conn: DatabaseConnection) -> PriceBundle:
+    """현재 데이터 버전의 가격 마트 번들을 반환합니다.
+
+    연결 설정별로 마지막 데이터 버전의 번들 하나만 프로세스 전역에 보관하며,
+    버전이 바뀐 뒤 처음 호출될 때 세 마트를 execute_many로 한 번에 다시 조회합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        PriceBundle: 지역별로 나누어진 가격 마트 번들
+    """
+    key = (conn.__class__.__name__, *conn.get_config())
+    version = get_data_version(conn)
+
+    bundle: Optional[PriceBundle] = _bundles.get(key)
+    if bundle is not None and bundle.version == version:
+        return bundle
+
+    with _bundles_lock:
+        bundle = _bundles.get(key)
+        if bundle is not None and bundle.version == version:
+            return bundle
+
+        drop_df, rise_df, rate_df = conn.execute_many([
+            get_price_drop_top3_query(conn=conn),
+            get_price_rise_top3_query(conn=conn),
+            get_price_region_rate_query(conn=conn),
+        ])
+        bundle = PriceBundle(
+            drop_df.attrs.get("data_version", version), drop_df, rise_df, rate_df
+        )
+        if any(is_refreshing(df) for df in (drop_df, rise_df, rate_df)):
+            # 이전 버전 결과로 만든 번들은 보관하지 않고, 갱신이 끝난 뒤 다시 조회
+            return bundle
+        _bundles[key] = bundle
+        logger.info(
+            f"가격 마트 번들 로드: version={version}, 지역 수={len(bundle.countries)}"
+        )
+        return bundle
@@ -1,11 +1,15 @@
 """친환경 관련 쿼리 생성 모듈"""
 
+from .query_utils import latest_partition_condition
 from data.connection import DatabaseConnection
+from data.partition_resolver import get_latest_partition
 
 
 def get_latest_price_statistics_query(conn: DatabaseConnection = None) -> str:
     """최신 가격 통계 데이터를 조회하는 쿼리를 생성합니다.
 
+    최신 날짜는 데이터 버전마다 한 번 조회한 값을 리터럴로 사용합니다.
+
     Args:
         category_filter: 카테고리 필터
 
@@ -13,12 +17,9 @@ def get_latest_price_statistics_query(conn: DatabaseConnection = None) -> str:
         str: SQL 쿼리 문자열
     """
     database, user = conn.get_config()
+    latest_date = get_latest_partition(conn, "mart_eco_price_statistics_by_category")
 
     query = f"""
-    WITH latest_date AS (
-        SELECT MAX(res_dt) as max_date
-        FROM {database}.mart_eco_price_statistics_by_category
-    )
     SELECT 
         res_dt,
         item_cd,
@@ -29,8 +30,7 @@ def get_latest_price_statistics_query(conn: DatabaseConnection = None) -> str:
         min_price,
         max_price
     FROM {database}.mart_eco_price_statistics_by_category
-    CROSS JOIN latest_date
-    WHERE res_dt = latest_date.max_date
+    WHERE {latest_partition_condition(latest_date)}
     ORDER BY item_nm, market_category, avg_price
     """
 
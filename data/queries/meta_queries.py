@@ -16,3 +16,40 @@ def get_update_status_query(conn: DatabaseConnection = None) -> str:
             country_count
         FROM {database}.mart_update_status
     """
+
+
+def get_latest_partitions_query(
+    tables: list[str], conn: DatabaseConnection = None
+) -> str:
+    """
+    마트별 최신 res_dt 파티션 조회 쿼리 (마트당 한 행)
+    - table_nm: 마트 테이블 이름
+    - max_date: 최신 res_dt
+    """
+    database, user = conn.get_config()
+    return "\n        UNION ALL\n".join(
+        f"""
+        SELECT
+            '{table}' AS table_nm,
+            MAX(res_dt) AS max_date
+        FROM {database}.{table}"""
+        for table in tables
+    )
+
+
+def get_distinct_text_query(
+    columns_by_table: dict[str, list[str]], conn: DatabaseConnection = None
+) -> str:
+    """
+    마트의 문자열 컬럼에 등장하는 고유 값 조회 쿼리 (폰트 서브셋용)
+    - text_value: 품목/품종/지역/카테고리 이름 등
+    """
+    database, user = conn.get_config()
+    return "\n        UNION\n".join(
+        f"""
+        SELECT DISTINCT
+            CAST({column} AS VARCHAR) AS text_value
+        FROM {database}.{table}"""
+        for table, columns in columns_by_table.items()
+        for column in columns
+    )
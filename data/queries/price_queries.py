@@ -1,7 +1,7 @@
 """지역별 가격비교 쿼리 생성 모듈"""
 
 from typing import Optional
-from .query_utils import build_where_country_clause
+from .query_utils import build_where_country_clause, to_prepared_query
 from data.connection import DatabaseConnection
 import pandas as pd
 
@@ -31,12 +31,13 @@ def get_price_drop_top3_query(
     Returns:
         str: SQL 쿼리 문자열
     """
-    where_sql = build_where_country_clause(country_filter)
+    where_sql = build_where_country_clause(country_filter, placeholder=True)
     #    limit_clause = f"LIMIT {limit}" if limit else ""
     database, user = conn.get_config()
 
     query = f"""
     SELECT
+        country_nm,
         item_nm,
         kind_nm,
         product_cls_unit,
@@ -47,10 +48,12 @@ def get_price_drop_top3_query(
         prev_1d_dir_pct
     FROM {database}.mart_price_drop_top3
     {where_sql}
-    ORDER BY ranking
+    ORDER BY country_nm, ranking
     """
 
-    return query.strip()
+    return to_prepared_query(
+        query.strip(), "price_drop_top3", [country_filter] if country_filter else []
+    )
 
 
 def get_price_rise_top3_query(
@@ -67,11 +70,12 @@ def get_price_rise_top3_query(
     Returns:
         str: SQL 쿼리 문자열
     """
-    where_sql = build_where_country_clause(country_filter)
+    where_sql = build_where_country_clause(country_filter, placeholder=True)
     database, user = conn.get_config()
 
     query = f"""
     SELECT
+        country_nm,
         item_nm,
         kind_nm,
         product_cls_unit,
@@ -82,10 +86,12 @@ def get_price_rise_top3_query(
         prev_1d_dir_pct
     FROM {database}.mart_price_rise_top3
     {where_sql}
-    ORDER BY ranking
+    ORDER BY country_nm, ranking
     """
 
-    return query.strip()
+    return to_prepared_query(
+        query.strip(), "price_rise_top3", [country_filter] if country_filter else []
+    )
 
 
 def get_price_region_rate_query(
@@ -93,7 +99,7 @@ def get_price_region_rate_query(
     conn: DatabaseConnection = None,
 ) -> str:
     """지역별 상승/하락/유지 개수 집계 쿼리"""
-    where_sql = build_where_country_clause(country_filter)
+    where_sql = build_where_country_clause(country_filter, placeholder=True)
     database, user = conn.get_config()
 
     query = f"""
@@ -106,4 +112,6 @@ def get_price_region_rate_query(
     {where_sql}
     """
 
-    return query.strip()
+    return to_prepared_query(
+        query.strip(), "price_region_count", [country_filter] if country_filter else []
+    )
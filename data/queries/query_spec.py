@@ -0,0 +1,171 @@
+"""구조화된 쿼리 명세(QuerySpec) 모듈
+
+단순 집계 쿼리를 테이블, 그룹 컬럼, 집계, 필터, 정렬로 표현하여 SQL로 렌더링하고,
+이미 가진 더 넓은 결과로 좁은 쿼리에 답할 수 있는지(포함 관계)를 판단합니다.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+import pandas as pd
+
+from .query_utils import sql_literal
+
+# 지원하는 필터 연산자
+FILTER_OPERATORS = ("=", "!=")
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    """집계 컬럼 (예: AVG(avg_price) AS "평균가격")"""
+
+    func: str
+    column: str
+    alias: str
+
+    def to_sql(self) -> str:
+        return f'{self.func}({self.column}) as "{self.alias}"'
+
+
+@dataclass(frozen=True)
+class Filter:
+    """컬럼과 값의 비교 조건 (= 또는 !=)"""
+
+    column: str
+    op: str
+    value: object
+
+    def __post_init__(self):
+        if self.op not in FILTER_OPERATORS:
+            raise ValueError(f"지원하지 않는 필터 연산자: {self.op}")
+
+    def to_sql(self) -> str:
+        return f"{self.column} {self.op} {sql_literal(self.value)}"
+
+    def mask(self, series: pd.Series) -> pd.Series:
+        """DataFrame 컬럼에 같은 조건을 적용한 마스크 (SQL처럼 NULL은 항상 제외)"""
+        matched = series == self.value if self.op == "=" else series != self.value
+        return matched & series.notna()
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """단일 테이블 조회/집계 쿼리 명세
+
+    Attributes:
+        table: 스키마를 포함한 테이블 이름
+        columns: (컬럼, 별칭) 튜플. 집계가 있으면 그룹 컬럼이 됨
+        aggregates: 집계 컬럼
+        filters: AND로 결합되는 비교 조건
+        order_by: 정렬 컬럼 (원본 컬럼 이름)
+        limit: 결과 제한 개수
+    """
+
+    table: str
+    columns: tuple[tuple[str, str], ...]
+    aggregates: tuple[Aggregate, ...] = ()
+    filters: tuple[Filter, ...] = ()
+    order_by: tuple[str, ...] = ()
+    limit: Optional[int] = None
+
+    def to_sql(self) -> str:
+        """Athena/PostgreSQL/DuckDB에서 공통으로 실행되는 SQL을 생성합니다."""
+        select = [
+            column if column == alias else f'{column} as "{alias}"'
+            for column, alias in self.columns
+        ] + [aggregate.to_sql() for aggregate in self.aggregates]
+
+        lines = [
+            "SELECT",
+            "    " + ",\n    ".join(select),
+            f"FROM {self.table}",
+        ]
+        if self.filters:
+            lines.append(
+                "WHERE " + " AND ".join(condition.to_sql() for condition in self.filters)
+            )
+        if self.aggregates and self.columns:
+            lines.append("GROUP BY " + ", ".join(column for column, _ in self.columns))
+        if self.order_by:
+            lines.append("ORDER BY " + ", ".join(self.order_by))
+        if self.limit:
+            lines.append(f"LIMIT {self.limit}")
+
+        return "\n".join(lines)
+
+    def to_query(self) -> "SpecQuery":
+        """명세를 담은 실행용 쿼리 문자열을 반환합니다."""
+        return SpecQuery(self.to_sql(), self)
+
+    def residual_filters(self, wider: "QuerySpec") -> Optional[tuple[Filter, ...]]:
+        """wider의 결과를 걸러 이 명세의 결과를 만들 수 있으면 추가로 적용할 필터를 반환합니다.
+
+        wider가 이 명세와 같은 테이블/컬럼/집계/정렬이고 필터가 부분집합이며,
+        추가 필터가 모두 결과에 포함된 그룹 컬럼에 대한 것일 때만 가능합니다
+        (그룹 컬럼으로 결과 행을 거르는 것은 원본 행을 거른 뒤 집계한 것과 같음).
+
+        Returns:
+            Optional[tuple[Filter, ...]]: 추가 필터 (포함 관계가 아니면 None)
+        """
+        if (
+            wider.table != self.table
+            or wider.columns != self.columns
+            or wider.aggregates != self.aggregates
+            or wider.order_by != self.order_by
+            or wider.limit is not None
+            or self.limit is not None
+        ):
+            return None
+
+        if not set(wider.filters) <= set(self.filters):
+            return None
+
+        residual = tuple(f for f in self.filters if f not in wider.filters)
+        group_columns = {column for column, _ in self.columns}
+        if any(f.column not in group_columns for f in residual):
+            return None
+        return residual
+
+    def apply_filters(self, df: pd.DataFrame, filters: tuple[Filter, ...]) -> pd.DataFrame:
+        """이 명세의 결과 DataFrame(별칭 컬럼)에 필터를 적용합니다 (행 순서 유지)."""
+        aliases = dict(self.columns)
+        mask = pd.Series(True, index=df.index)
+        for condition in filters:
+            mask &= condition.mask(df[aliases[condition.column]])
+        return df[mask].reset_index(drop=True)
+
+
+def build_filters(
+    date_filter: Optional[date] = None, category_filter: Optional[str] = None
+) -> list[Filter]:
+    """build_where_clause와 같은 조건을 Filter 리스트로 구성합니다.
+
+    Args:
+        date_filter: 날짜 필터 (date 객체)
+        category_filter: 카테고리 필터 (문자열, "전체"인 경우 필터링 안함)
+
+    Returns:
+        list[Filter]: 필터 리스트 (조건이 없으면 빈 리스트)
+    """
+    filters = []
+    if date_filter:
+        filters.append(Filter("res_dt", "=", date_filter))
+    if category_filter and category_filter != "전체":
+        filters.append(Filter("category_nm", "=", category_filter))
+    return filters
+
+
+class SpecQuery(str):
+    """렌더링된 SQL 문자열이면서 원본 QuerySpec을 함께 담는 쿼리
+
+    str을 상속하므로 어떤 연결 객체에서도 그대로 실행할 수 있고,
+    CachedConnection은 spec을 이용해 더 넓은 캐시 결과로 답할 수 있는지 확인합니다.
+    """
+
+    spec: QuerySpec
+
+    def __new__(cls, sql: str, spec: QuerySpec):
+        obj = super().__new__(cls, sql)
+        obj.spec = spec
+        return obj
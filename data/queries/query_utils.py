@@ -1,5 +1,6 @@
 """쿼리 생성 공통 유틸리티"""
-from typing import Optional
+import hashlib
+from typing import Optional, Sequence
 from datetime import date
 
 
@@ -29,8 +30,114 @@ def build_where_clause(
     
     return ""
 
-def build_where_country_clause(country_filter: Optional[str] = None) -> str:
+def build_where_country_clause(
+    country_filter: Optional[str] = None, placeholder: bool = False
+) -> str:
+    """지역 필터 WHERE 절을 구성합니다.
+
+    Args:
+        country_filter: 지역 필터
+        placeholder: True이면 값 대신 prepared statement용 '?' 자리표시자를 사용
+
+    Returns:
+        str: WHERE 절 SQL 문자열
+    """
     clauses = ["1=1"]  # 기본 조건
     if country_filter:
-        clauses.append(f"country_nm = '{country_filter}'")
+        clauses.append(
+            "country_nm = ?" if placeholder else f"country_nm = {sql_literal(country_filter)}"
+        )
     return "WHERE " + " AND ".join(clauses)
+
+
+def latest_partition_condition(latest_date: Optional[date]) -> str:
+    """최신 res_dt 파티션만 읽는 조건을 구성합니다.
+
+    Args:
+        latest_date: 최신 res_dt (마트가 비어 있으면 None)
+
+    Returns:
+        str: res_dt = DATE '...' 조건 (최신 날짜가 없으면 항상 거짓인 조건)
+    """
+    if latest_date is None:
+        return "1 = 0"
+    return f"res_dt = {sql_literal(latest_date)}"
+
+
+def latest_date_column(latest_date: Optional[date]) -> str:
+    """최신 날짜를 결과 컬럼으로 넣기 위한 DATE 리터럴을 반환합니다."""
+    if latest_date is None:
+        return "CAST(NULL AS DATE)"
+    return sql_literal(latest_date)
+
+
+def sql_literal(value) -> str:
+    """값을 SQL 리터럴 문자열로 변환합니다 (문자열은 작은따옴표 이스케이프)."""
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, date):
+        return f"DATE '{value}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class PreparedQuery(str):
+    """리터럴 SQL 문자열이면서 prepared statement 실행 정보를 함께 담는 쿼리
+
+    str을 상속하므로 일반 쿼리 문자열과 똑같이 어떤 연결 객체에서도 실행할 수 있고,
+    AthenaConnection은 이 정보를 이용해 PREPARE 한 번 + EXECUTE로 실행합니다.
+
+    Attributes:
+        statement_name: prepared statement 이름 (템플릿 해시 포함)
+        template: '?' 자리표시자가 포함된 SQL 템플릿
+        parameters: 자리표시자 순서대로의 SQL 리터럴 값
+    """
+
+    statement_name: str
+    template: str
+    parameters: tuple[str, ...]
+
+    def __new__(
+        cls, sql: str, statement_name: str, template: str, parameters: Sequence[str]
+    ):
+        obj = super().__new__(cls, sql)
+        obj.statement_name = statement_name
+        obj.template = template
+        obj.parameters = tuple(parameters)
+        return obj
+
+
+def to_prepared_query(template: str, name: str, values: Sequence) -> str:
+    """'?' 자리표시자 템플릿과 값으로 실행 가능한 쿼리를 생성합니다.
+
+    Args:
+        template: '?' 자리표시자가 포함된 SQL 템플릿
+        name: prepared statement 기본 이름 (템플릿 해시가 덧붙여짐)
+        values: 자리표시자 순서대로의 값
+
+    Returns:
+        str: 값이 없으면 템플릿 그대로의 문자열, 있으면 PreparedQuery
+    """
+    if not values:
+        return template
+
+    parameters = [sql_literal(value) for value in values]
+    parts = template.split("?")
+    if len(parts) - 1 != len(parameters):
+        raise ValueError(
+            f"자리표시자 수({len(parts) - 1})와 파라미터 수({len(parameters)})가 다릅니다."
+        )
+
+    sql = parts[0] + "".join(
+        parameter + part for parameter, part in zip(parameters, parts[1:])
+    )
+    digest = hashlib.sha1(template.encode("utf-8")).hexdigest()[:8]
+    return PreparedQuery(sql, f"{name}_{digest}", template, parameters)
+
+
+def normalize_sql(query: str) -> str:
+    """캐시 키 등 비교 용도로 SQL 문자열을 정규화합니다.
+
+    연속된 공백/줄바꿈을 하나의 공백으로 합치고 앞뒤 공백과 끝의 세미콜론을 제거합니다.
+    실행용이 아니므로 주석이 포함된 쿼리도 그대로 한 줄로 합칩니다.
+    """
+    return " ".join(str(query).split()).rstrip(";").strip()
@@ -2,6 +2,7 @@
 
 from typing import Optional
 from datetime import date
+from .query_spec import Aggregate, Filter, QuerySpec, build_filters
 from .query_utils import build_where_clause
 from data.connection import DatabaseConnection
 
@@ -68,40 +69,37 @@ def get_region_stats_query(
 ) -> str:
     """지역별 통계 쿼리를 생성합니다.
 
+    카테고리를 그룹 컬럼에 포함하므로, 카테고리 필터가 있는 쿼리는 같은 날짜의
+    "전체" 결과가 캐시되어 있으면 데이터베이스를 다시 조회하지 않고 그 결과에서 걸러집니다.
+
     Args:
         date_filter: 날짜 필터
         category_filter: 카테고리 필터
 
     Returns:
-        str: SQL 쿼리 문자열
+        str: SQL 쿼리 문자열 (QuerySpec을 담은 SpecQuery)
     """
-    where_sql = build_where_clause(date_filter, category_filter)
     database, user = conn.get_config()
 
-    # "기타" 지역 제외 조건 추가
-    exclude_condition = "country_nm != '기타'"
-
-    # WHERE 절 구성
-    if where_sql:
-        # 기존 WHERE 절이 있으면 AND로 추가
-        where_sql = where_sql + f" AND {exclude_condition}"
-    else:
-        # WHERE 절이 없으면 새로 생성
-        where_sql = f"WHERE {exclude_condition}"
-
-    query = f"""
-    SELECT 
-        country_nm as "지역",
-        item_nm as "품목",
-        kind_nm as "품종",
-        AVG(avg_price) as "평균가격",
-        MIN(min_price) as "최저가격",
-        MAX(max_price) as "최고가격",
-        SUM(record_count) as "총레코드수"
-    FROM {database}.mart_retail_region_comparison
-    {where_sql}
-    GROUP BY country_nm, item_nm, kind_nm
-    ORDER BY country_nm, item_nm, kind_nm
-    """
-
-    return query.strip()
+    # "기타" 지역 제외
+    filters = [Filter("country_nm", "!=", "기타")]
+    filters += build_filters(date_filter, category_filter)
+
+    spec = QuerySpec(
+        table=f"{database}.mart_retail_region_comparison",
+        columns=(
+            ("country_nm", "지역"),
+            ("item_nm", "품목"),
+            ("kind_nm", "품종"),
+            ("category_nm", "카테고리"),
+        ),
+        aggregates=(
+            Aggregate("AVG", "avg_price", "평균가격"),
+            Aggregate("MIN", "min_price", "최저가격"),
+            Aggregate("MAX", "max_price", "최고가격"),
+            Aggregate("SUM", "record_count", "총레코드수"),
+        ),
+        filters=tuple(filters),
+        order_by=("country_nm", "item_nm", "kind_nm"),
+    )
+    return spec.to_query()
@@ -5,6 +5,7 @@
 
 from typing import Optional
 from data.connection import DatabaseConnection
+from .query_utils import to_prepared_query
 
 
 def get_season(
@@ -51,7 +52,7 @@ def get_season_region_price_query(
     """
     where_sql = ""
     if item_kind_filter:
-        where_sql = f"WHERE CONCAT(item_nm, '(', kind_nm, ')') = '{item_kind_filter}'"
+        where_sql = "WHERE CONCAT(item_nm, '(', kind_nm, ')') = ?"
     database, user = conn.get_config()
 
     query = f"""
@@ -83,7 +84,11 @@ def get_season_region_price_query(
     FROM {database}.mart_season_region_product
     {where_sql}
     """
-    return query.strip()
+    return to_prepared_query(
+        query.strip(),
+        "season_region_price",
+        [item_kind_filter] if item_kind_filter else [],
+    )
 
 
 def get_region_all_items_price_query(
@@ -96,7 +101,7 @@ def get_region_all_items_price_query(
         country_filter: 지역명 (예: 서울)
         conn: 데이터베이스 연결 객체
     """
-    where_sql = f"WHERE country_nm = '{country_filter}'"
+    where_sql = "WHERE country_nm = ?"
     database, user = conn.get_config()
 
     query = f"""
@@ -120,4 +125,6 @@ def get_region_all_items_price_query(
     FROM CTE
     {where_sql}
     """
-    return query.strip()
+    return to_prepared_query(
+        query.strip(), "region_all_items_price", [country_filter]
+    )
@@ -0,0 +1,639 @@
+"""데이터 버전 기반 쿼리 결과 캐시 모듈
+
+캐시 키는 정규화된 SQL 문자열과 현재 데이터 버전(mart_update_status.latest_date)입니다.
+결과는 메모리(LRU)에 보관하고 디스크(Parquet)에도 기록하여 컨테이너 재시작 후에도
+재사용하며, 파이프라인이 새 latest_date를 게시하면 전체 캐시가 자동으로 무효화됩니다.
+
+stale-while-revalidate 모드에서는 무효화된 이전 버전 결과를 즉시 반환하고
+새 버전 결과는 백그라운드에서 조회하여 캐시에 채웁니다.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from data.connection import DatabaseConnection
+from data.data_version import get_version_tracker
+from data.logger import setup_logger
+from data.queries.query_spec import Filter, QuerySpec
+from data.partition_resolver import resolved_partition_dates
+from data.queries.query_utils import normalize_sql, sql_literal
+from data.scan_budget import QueryBudgetExceeded
+from data.telemetry import format_metric, query_fingerprint, telemetry
+
+logger = setup_logger("query_cache")
+
+
+class QueryResultStore:
+    """메모리 LRU + 디스크(Parquet) 2단계 쿼리 결과 저장소 (스레드 안전)"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: int = 256,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_stale_entries: int = 64,
+    ):
+        """
+        Args:
+            cache_dir: Parquet 파일을 기록할 디렉토리 (None이면 디스크 저장 안 함)
+            max_entries: 메모리에 보관할 최대 결과 수
+            max_bytes: 메모리에 보관할 결과의 최대 총 크기 (바이트)
+            max_stale_entries: 무효화된 이전 버전 결과를 메모리에 남겨 둘 최대 수
+                (세션 스캔 예산 초과 시 또는 stale-while-revalidate 모드에서 대신 제공)
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[tuple[str, str], tuple[pd.DataFrame, int]] = (
+            OrderedDict()
+        )
+        self._memory_bytes = 0
+        self._max_stale_entries = max_stale_entries
+        # stale 키 -> (데이터 버전, 결과, 무효화 시각): 무효화된 이전 버전 결과 중 최근 것
+        self._stale: OrderedDict[str, tuple[str, pd.DataFrame, float]] = OrderedDict()
+        # 메모리 항목 -> stale 키 (최신 파티션 날짜처럼 버전마다 바뀌는 부분을 뺀 키)
+        self._stale_keys: dict[tuple[str, str], str] = {}
+        # 데이터 버전별 (네임스페이스, QuerySpec) -> 캐시 키 (포함 관계 조회용)
+        self._specs: dict[str, OrderedDict[tuple[str, QuerySpec], str]] = {}
+        self._stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "derived_hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    def get(self, version: str, key: str) -> Optional[pd.DataFrame]:
+        """캐시된 결과의 복사본을 반환합니다 (없으면 None)."""
+        with self._lock:
+            entry = self._memory.get((version, key))
+            if entry is not None:
+                self._memory.move_to_end((version, key))
+                self._stats["hits"] += 1
+                return entry[0].copy()
+
+        df = self._read_disk(version, key)
+        if df is not None:
+            self._put_memory(version, key, df)
+            with self._lock:
+                self._stats["disk_hits"] += 1
+            return df.copy()
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, version: str, key: str, df: pd.DataFrame, stale_key: Optional[str] = None):
+        """결과를 메모리와 디스크에 저장합니다.
+
+        Args:
+            version: 데이터 버전
+            key: 캐시 키
+            df: 쿼리 결과
+            stale_key: 버전이 바뀐 뒤 이 결과를 이전 버전 결과로 찾을 키 (기본값: 캐시 키).
+                같은 stale 키의 이전 버전 결과는 더 이상 제공하지 않음
+        """
+        df = df.copy()
+        stale_key = stale_key or key
+        with self._lock:
+            self._stale_keys[(version, key)] = stale_key
+            stale = self._stale.get(stale_key)
+            if stale is not None and stale[0] != version:
+                del self._stale[stale_key]
+        self._put_memory(version, key, df)
+        self._write_disk(version, key, df)
+
+    def register_spec(self, version: str, namespace: str, spec: QuerySpec, key: str):
+        """캐시에 저장한 결과의 QuerySpec을 기록하여 더 좁은 쿼리가 재사용할 수 있게 합니다."""
+        with self._lock:
+            specs = self._specs.setdefault(version, OrderedDict())
+            specs[(namespace, spec)] = key
+            specs.move_to_end((namespace, spec))
+            while len(specs) > self._max_entries:
+                specs.popitem(last=False)
+
+    def get_subsumed(
+        self, version: str, namespace: str, spec: QuerySpec
+    ) -> Optional[pd.DataFrame]:
+        """spec을 포함하는 더 넓은 캐시 결과가 있으면 pandas로 걸러 반환합니다 (없으면 None).
+
+        조회 수 통계는 get()의 미스 이후에 호출되므로 적중 시 미스 하나를 파생 적중으로 옮깁니다.
+        """
+        with self._lock:
+            candidates = [
+                (wider, key)
+                for (wider_namespace, wider), key in self._specs.get(version, {}).items()
+                if wider_namespace == namespace and wider != spec
+            ]
+
+        for wider, key in reversed(candidates):
+            residual = spec.residual_filters(wider)
+            if residual is None:
+                continue
+
+            with self._lock:
+                entry = self._memory.get((version, key))
+            df = entry[0] if entry is not None else self._read_disk(version, key)
+            if df is None:
+                continue
+
+            with self._lock:
+                self._stats["misses"] -= 1
+                self._stats["derived_hits"] += 1
+            logger.debug(f"포함 관계 캐시 적중: 추가 필터 {_describe_filters(residual)}")
+            return spec.apply_filters(df, residual)
+
+        return None
+
+    def invalidate(self, keep_version: Optional[str] = None):
+        """keep_version 이외 버전의 결과를 메모리와 디스크에서 모두 삭제합니다."""
+        with self._lock:
+            for cache_key in [k for k in self._memory if k[0] != keep_version]:
+                df, size = self._memory.pop(cache_key)
+                self._memory_bytes -= size
+                self._keep_stale(cache_key[0], self._stale_keys.get(cache_key, cache_key[1]), df)
+            self._stale_keys = {
+                cache_key: stale_key
+                for cache_key, stale_key in self._stale_keys.items()
+                if cache_key[0] == keep_version and cache_key in self._memory
+            }
+            for version in [v for v in self._specs if v != keep_version]:
+                del self._specs[version]
+
+        if self._cache_dir is None or not self._cache_dir.exists():
+            return
+
+        keep_dir = _version_dirname(keep_version) if keep_version else None
+        for path in self._cache_dir.iterdir():
+            if path.is_dir() and path.name != keep_dir:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def get_stale(
+        self, key: str, max_age: Optional[float] = None
+    ) -> Optional[tuple[str, pd.DataFrame]]:
+        """무효화된 이전 버전 결과 중 키가 같은 것을 (데이터 버전, 복사본)으로 반환합니다.
+
+        Args:
+            key: stale 키 (put에서 지정한 키, 지정하지 않았으면 캐시 키)
+            max_age: 무효화된 지 이 시간(초)이 지난 결과는 반환하지 않음 (None이면 제한 없음)
+        """
+        with self._lock:
+            entry = self._stale.get(key)
+            if entry is None:
+                return None
+            stale_version, df, superseded_at = entry
+            if max_age is not None and time.time() - superseded_at > max_age:
+                return None
+            self._stale.move_to_end(key)
+            self._stats["stale_hits"] += 1
+            return stale_version, df.copy()
+
+    def _keep_stale(self, version: str, key: str, df: pd.DataFrame):
+        """이전 버전 결과를 stale LRU에 남깁니다 (호출 측에서 잠금을 잡고 있어야 함)."""
+        if self._max_stale_entries <= 0:
+            return
+        self._stale[key] = (version, df, time.time())
+        self._stale.move_to_end(key)
+        while len(self._stale) > self._max_stale_entries:
+            self._stale.popitem(last=False)
+
+    def on_version_change(self, old_version: Optional[str], new_version: str):
+        """새 데이터 버전이 게시되면 이전 버전의 결과를 모두 삭제합니다."""
+        logger.info(f"캐시 무효화: 데이터 버전 {old_version} -> {new_version}")
+        self.invalidate(keep_version=new_version)
+
+    def stats(self) -> dict:
+        """캐시 적중/미스 통계와 메모리 사용량을 반환합니다."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._memory)
+            stats["stale_entries"] = len(self._stale)
+            stats["memory_bytes"] = self._memory_bytes
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        lookups += stats["derived_hits"]
+        stats["hit_rate"] = (
+            (stats["hits"] + stats["disk_hits"] + stats["derived_hits"]) / lookups
+            if lookups
+            else 0.0
+        )
+        return stats
+
+    def metric_lines(self) -> list[str]:
+        """캐시 통계를 Prometheus 텍스트 형식의 줄 목록으로 반환합니다."""
+        stats = self.stats()
+        lines = [
+            "# HELP threelacha_query_cache_lookups_total Query cache lookups by result",
+            "# TYPE threelacha_query_cache_lookups_total counter",
+        ]
+        for result, key in (
+            ("memory_hit", "hits"),
+            ("disk_hit", "disk_hits"),
+            ("derived_hit", "derived_hits"),
+            ("stale_hit", "stale_hits"),
+            ("miss", "misses"),
+        ):
+            lines.append(format_metric(
+                "threelacha_query_cache_lookups_total", stats[key], {"result": result}
+            ))
+        lines += [
+            "# TYPE threelacha_query_cache_evictions_total counter",
+            format_metric("threelacha_query_cache_evictions_total", stats["evictions"]),
+            "# TYPE threelacha_query_cache_entries gauge",
+            format_metric("threelacha_query_cache_entries", stats["entries"]),
+            "# TYPE threelacha_query_cache_memory_bytes gauge",
+            format_metric("threelacha_query_cache_memory_bytes", stats["memory_bytes"]),
+        ]
+        return lines
+
+    def _put_memory(self, version: str, key: str, df: pd.DataFrame):
+        size = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            previous = self._memory.pop((version, key), None)
+            if previous is not None:
+                self._memory_bytes -= previous[1]
+
+            self._memory[(version, key)] = (df, size)
+            self._memory_bytes += size
+
+            # LRU 제거 (가장 오래 사용되지 않은 결과부터)
+            while len(self._memory) > 1 and (
+                len(self._memory) > self._max_entries
+                or self._memory_bytes > self._max_bytes
+            ):
+                evicted_key, (_, evicted_size) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted_size
+                self._stale_keys.pop(evicted_key, None)
+                self._stats["evictions"] += 1
+
+    def _disk_path(self, version: str, key: str) -> Optional[Path]:
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / _version_dirname(version) / f"{key}.parquet"
+
+    def _read_disk(self, version: str, key: str) -> Optional[pd.DataFrame]:
+        path = self._disk_path(version, key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            logger.warning(f"디스크 캐시 읽기 실패 ({path}): {e!s}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_disk(self, version: str, key: str, df: pd.DataFrame):
+        path = self._disk_path(version, key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 다른 프로세스/스레드가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"디스크 캐시 쓰기 실패 ({path}): {e!s}")
+
+
+def _describe_filters(filters: tuple[Filter, ...]) -> str:
+    return " AND ".join(condition.to_sql() for condition in filters) or "없음"
+
+
+def _version_dirname(version: str) -> str:
+    """데이터 버전을 디렉토리 이름으로 안전하게 변환합니다."""
+    return re.sub(r"[^0-9A-Za-z_.-]", "_", version)
+
+
+def parse_stale_limits(text: str) -> dict[str, float]:
+    """"테이블=초,테이블=초" 형식의 테이블별 최대 stale 기간 설정을 파싱합니다.
+
+    Args:
+        text: 설정 문자열 (예: "mart_update_status=0,mart_season_region_price=21600")
+
+    Returns:
+        dict[str, float]: 테이블 이름 -> 최대 stale 기간(초)
+    """
+    limits = {}
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        table, _, seconds = item.partition("=")
+        try:
+            limits[table.strip()] = float(seconds)
+        except ValueError:
+            logger.warning(f"잘못된 stale 기간 설정 무시: {item.strip()}")
+    return limits
+
+
+class CachedConnection(DatabaseConnection):
+    """임의의 DatabaseConnection을 감싸 쿼리 결과를 데이터 버전 기준으로 캐시하는 클래스
+
+    반환하는 모든 DataFrame의 attrs["data_version"]에 결과의 데이터 버전을 담습니다.
+    stale-while-revalidate 모드에서 이전 버전 결과를 대신 반환하면 attrs["stale_version"]과
+    attrs["refreshing"]도 함께 설정합니다 (is_refreshing으로 확인).
+    """
+
+    def __init__(
+        self,
+        inner: DatabaseConnection,
+        store: Optional[QueryResultStore] = None,
+        stale_while_revalidate: Optional[bool] = None,
+        max_stale_age: Optional[float] = None,
+        stale_limits: Optional[dict[str, float]] = None,
+        refresh_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            inner: 실제 쿼리를 실행할 데이터베이스 연결 객체
+            store: 결과 저장소 (기본값: 프로세스 전역 저장소)
+            stale_while_revalidate: 캐시 미스 시 이전 버전 결과를 즉시 반환하고 백그라운드에서 갱신할지 여부
+                (기본값: QUERY_CACHE_STALE_WHILE_REVALIDATE, false)
+            max_stale_age: 새 버전 감지 후 이전 버전 결과를 제공할 최대 기간 (초)
+                (기본값: QUERY_CACHE_STALE_MAX_AGE, 3600)
+            stale_limits: 테이블별 최대 stale 기간 (초, 0이면 제공 안 함). 쿼리가 여러 테이블을
+                조회하면 가장 짧은 기간을 적용 (기본값: QUERY_CACHE_STALE_LIMITS)
+            refresh_workers: 백그라운드 갱신을 동시에 실행할 최대 쿼리 수
+                (기본값: QUERY_CACHE_REFRESH_WORKERS, 4)
+        """
+        self._inner = inner
+        self._store = store or get_result_store()
+        self._tracker = get_version_tracker(inner)
+        self._tracker.add_listener(self._store.on_version_change)
+
+        if stale_while_revalidate is None:
+            stale_while_revalidate = (
+                os.getenv("QUERY_CACHE_STALE_WHILE_REVALIDATE", "false").lower() == "true"
+            )
+        self._stale_while_revalidate = stale_while_revalidate
+        self._max_stale_age = (
+            max_stale_age
+            if max_stale_age is not None
+            else float(os.getenv("QUERY_CACHE_STALE_MAX_AGE", "3600"))
+        )
+        self._stale_limits = (
+            stale_limits
+            if stale_limits is not None
+            else parse_stale_limits(os.getenv("QUERY_CACHE_STALE_LIMITS", ""))
+        )
+        self._refresh_workers = refresh_workers or int(os.getenv("QUERY_CACHE_REFRESH_WORKERS", "4"))
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: set[str] = set()
+        self._refresh_stats = {"refreshes": 0, "refresh_failures": 0}
+
+    @property
+    def inner(self) -> DatabaseConnection:
+        """캐시로 감싼 실제 데이터베이스 연결 객체"""
+        return self._inner
+
+    @property
+    def data_version(self) -> str:
+        """현재 데이터 버전 (mart_update_status.latest_date)"""
+        return self._tracker.get(self._inner)
+
+    def get_config(self) -> tuple[str, str]:
+        """감싼 연결 객체의 설정을 반환합니다."""
+        return self._inner.get_config()
+
+    def cache_stats(self) -> dict:
+        """캐시 적중/미스 통계와 백그라운드 갱신 현황을 반환합니다."""
+        stats = self._store.stats()
+        with self._refresh_lock:
+            stats.update(self._refresh_stats)
+            stats["refreshing"] = len(self._refreshing)
+        return stats
+
+    def execute_query(self, query: str, allow_stale: bool = True, **kwargs) -> pd.DataFrame:
+        """캐시된 결과가 있으면 반환하고, 없으면 쿼리를 실행한 뒤 캐시합니다.
+
+        stale-while-revalidate 모드이고 허용 기간 안의 이전 버전 결과가 있으면 그 결과를
+        즉시 반환하고 쿼리는 백그라운드에서 실행합니다. 세션 스캔 예산을 초과해 쿼리를
+        실행할 수 없을 때도 이전 버전 결과를 대신 반환합니다 (df.attrs["stale_version"]에 해당 버전 표시).
+
+        Args:
+            query: 실행할 SQL 쿼리 문자열
+            allow_stale: False이면 이전 버전 결과를 즉시 반환하지 않고 항상 새로 조회 (캐시 예열 등)
+            **kwargs: 감싼 연결 객체에 그대로 전달할 추가 파라미터
+
+        Returns:
+            pd.DataFrame: 쿼리 결과를 담은 DataFrame (캐시 항목의 복사본)
+        """
+        version = self.data_version
+        key = self._cache_key(query)
+
+        df = self._lookup(version, key, query)
+        if df is None and allow_stale:
+            df = self._revalidate(version, key, query, kwargs)
+        if df is not None:
+            return df
+
+        try:
+            df = self._inner.execute_query(query, **kwargs)
+        except QueryBudgetExceeded as e:
+            return self._stale_results([query], e)[0]
+
+        self._put(version, key, query, df)
+        df.attrs["data_version"] = version
+        return df
+
+    def execute_many(
+        self, queries: list[str], allow_stale: bool = True, **kwargs
+    ) -> list[pd.DataFrame]:
+        """캐시되지 않은 쿼리만 모아 감싼 연결 객체의 execute_many로 실행합니다.
+
+        stale-while-revalidate 모드에서는 이전 버전 결과가 있는 쿼리를 백그라운드 갱신으로 돌리고,
+        세션 스캔 예산을 초과했으면 캐시되지 않은 쿼리는 이전 데이터 버전의 결과로 대신합니다.
+
+        Args:
+            queries: 실행할 SQL 쿼리 문자열 리스트
+            allow_stale: False이면 이전 버전 결과를 즉시 반환하지 않고 항상 새로 조회
+            **kwargs: 감싼 연결 객체에 그대로 전달할 추가 파라미터
+
+        Returns:
+            list[pd.DataFrame]: 입력 순서와 동일한 순서의 쿼리 결과 리스트
+        """
+        version = self.data_version
+        keys = [self._cache_key(query) for query in queries]
+        results: list[Optional[pd.DataFrame]] = [
+            self._lookup(version, key, query) for key, query in zip(keys, queries)
+        ]
+        if allow_stale:
+            for i, df in enumerate(results):
+                if df is None:
+                    results[i] = self._revalidate(version, keys[i], queries[i], kwargs)
+
+        missing = [i for i, df in enumerate(results) if df is None]
+        if missing:
+            try:
+                dataframes = self._inner.execute_many(
+                    [queries[i] for i in missing], **kwargs
+                )
+            except QueryBudgetExceeded as e:
+                for i, df in zip(missing, self._stale_results([queries[i] for i in missing], e)):
+                    results[i] = df
+                return results
+
+            for i, df in zip(missing, dataframes):
+                self._put(version, keys[i], queries[i], df)
+                df.attrs["data_version"] = version
+                results[i] = df
+
+        return results
+
+    def _max_stale_age_for(self, query: str) -> float:
+        """쿼리가 조회하는 테이블의 최대 stale 기간 중 가장 짧은 값을 반환합니다."""
+        _, label = query_fingerprint(query)
+        limits = [self._stale_limits[table] for table in label.split("+") if table in self._stale_limits]
+        return min(limits) if limits else self._max_stale_age
+
+    def _revalidate(
+        self, version: str, key: str, query: str, kwargs: dict
+    ) -> Optional[pd.DataFrame]:
+        """허용 기간 안의 이전 버전 결과가 있으면 반환하고 새 버전 조회를 백그라운드로 예약합니다.
+
+        Returns:
+            Optional[pd.DataFrame]: 이전 버전 결과 (stale-while-revalidate 모드가 아니거나 없으면 None)
+        """
+        if not self._stale_while_revalidate:
+            return None
+        max_age = self._max_stale_age_for(query)
+        if max_age <= 0:
+            return None
+
+        entry = self._store.get_stale(self._stale_key(query), max_age=max_age)
+        if entry is None:
+            return None
+
+        stale_version, df = entry
+        self._schedule_refresh(version, key, query, kwargs)
+        df.attrs.update(data_version=stale_version, stale_version=stale_version, refreshing=True)
+        return df
+
+    def _schedule_refresh(self, version: str, key: str, query: str, kwargs: dict):
+        """같은 키의 갱신이 진행 중이 아니면 백그라운드 갱신을 예약합니다."""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=self._refresh_workers, thread_name_prefix="cache-refresh"
+                )
+            executor = self._refresh_executor
+        executor.submit(self._refresh, version, key, query, kwargs)
+
+    def _refresh(self, version: str, key: str, query: str, kwargs: dict):
+        """새 버전 결과를 조회해 캐시에 채웁니다 (그 사이 버전이 또 바뀌었으면 버림)."""
+        try:
+            df = self._inner.execute_query(query, **kwargs)
+            if self.data_version == version:
+                self._put(version, key, query, df)
+            with self._refresh_lock:
+                self._refresh_stats["refreshes"] += 1
+        except Exception as e:
+            with self._refresh_lock:
+                self._refresh_stats["refresh_failures"] += 1
+            logger.warning(f"백그라운드 캐시 갱신 실패: {e!s}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    def _stale_results(
+        self, queries: list[str], error: QueryBudgetExceeded
+    ) -> list[pd.DataFrame]:
+        """모든 쿼리의 이전 버전 결과를 반환하고, 하나라도 없으면 예산 초과 예외를 다시 발생시킵니다."""
+        stale = [self._store.get_stale(self._stale_key(query)) for query in queries]
+        if any(entry is None for entry in stale):
+            raise error
+
+        dataframes = []
+        for stale_version, df in stale:
+            df.attrs.update(data_version=stale_version, stale_version=stale_version)
+            dataframes.append(df)
+        logger.warning(
+            f"스캔 예산 초과로 이전 버전 결과 제공 ({len(queries)}건, "
+            f"버전: {', '.join(sorted({v for v, _ in stale}))})"
+        )
+        return dataframes
+
+    def _lookup(self, version: str, key: str, query: str) -> Optional[pd.DataFrame]:
+        """캐시된 결과를 찾고, 없으면 QuerySpec을 포함하는 더 넓은 결과에서 걸러냅니다."""
+        df = self._store.get(version, key)
+        spec = getattr(query, "spec", None)
+        if df is None and spec is not None:
+            df = self._store.get_subsumed(version, self._namespace(), spec)
+            if df is not None:
+                self._put(version, key, query, df)
+
+        if df is not None:
+            df.attrs["data_version"] = version
+        return df
+
+    def _put(self, version: str, key: str, query: str, df: pd.DataFrame):
+        self._store.put(version, key, df, stale_key=self._stale_key(query))
+        spec = getattr(query, "spec", None)
+        if spec is not None:
+            self._store.register_spec(version, self._namespace(), spec, key)
+
+    def _namespace(self) -> str:
+        """같은 저장소를 쓰는 다른 연결의 결과와 섞이지 않도록 구분하는 이름"""
+        database, extra = self._inner.get_config()
+        return f"{self._inner.__class__.__name__}|{database}|{extra}"
+
+    def _cache_key(self, query: str) -> str:
+        """연결 설정과 정규화된 SQL로 캐시 키를 생성합니다."""
+        raw = f"{self._namespace()}|{normalize_sql(query)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def _stale_key(self, query: str) -> str:
+        """버전이 바뀌어도 같은 쿼리로 취급할 키를 생성합니다.
+
+        쿼리 빌더가 넣은 최신 res_dt 리터럴은 버전마다 달라지므로 자리표시자로 바꿉니다.
+        """
+        sql = normalize_sql(query)
+        for latest_date in resolved_partition_dates(self):
+            sql = sql.replace(sql_literal(latest_date), "DATE ?")
+        raw = f"{self._namespace()}|{sql}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def is_refreshing(df: pd.DataFrame) -> bool:
+    """CachedConnection이 이전 버전 결과를 반환하고 새 버전을 백그라운드에서 조회 중인지 확인합니다."""
+    return bool(df.attrs.get("refreshing", False))
+
+
+_result_store: Optional[QueryResultStore] = None
+_result_store_lock = threading.Lock()
+
+
+def get_result_store() -> QueryResultStore:
+    """프로세스 전역에서 공유되는 결과 저장소를 반환합니다.
+
+    - QUERY_CACHE_DIR: Parquet 저장 디렉토리 (기본값 .cache/query_results, 빈 값이면 디스크 저장 안 함)
+    - QUERY_CACHE_MAX_ENTRIES: 메모리 최대 항목 수 (기본값 256)
+    - QUERY_CACHE_MAX_MB: 메모리 최대 크기 MB (기본값 256)
+    - QUERY_CACHE_MAX_STALE_ENTRIES: 예산 초과/stale-while-revalidate 시 제공할 이전 버전 결과 수 (기본값 64)
+    """
+    global _result_store
+    with _result_store_lock:
+        if _result_store is None:
+            _result_store = QueryResultStore(
+                cache_dir=os.getenv("QUERY_CACHE_DIR", ".cache/query_results") or None,
+                max_entries=int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "256")),
+                max_bytes=int(os.getenv("QUERY_CACHE_MAX_MB", "256")) * 1024 * 1024,
+                max_stale_entries=int(os.getenv("QUERY_CACHE_MAX_STALE_ENTRIES", "64")),
+            )
+            telemetry.register_collector(_result_store.metric_lines)
+        return _result_store
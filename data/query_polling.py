@@ -0,0 +1,66 @@
+"""쿼리 완료 폴링 전략 모듈"""
+
+import os
+import random
+from typing import Optional
+
+
+class PollingStrategy:
+    """지터가 포함된 지수 백오프 폴링 전략
+
+    짧은 쿼리는 수십 ms 안에 완료를 감지하고, 오래 걸리는 쿼리는 간격을 점점 늘려
+    get_query_execution 호출 수를 줄입니다.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 0.05,
+        max_delay: float = 1.0,
+        multiplier: float = 1.6,
+        jitter: float = 0.3,
+        timeout: Optional[float] = 120.0,
+    ):
+        """
+        Args:
+            initial_delay: 첫 폴링 간격 (초)
+            max_delay: 최대 폴링 간격 (초)
+            multiplier: 폴링마다 간격에 곱해지는 배수
+            jitter: 간격을 무작위로 줄이는 비율 (0이면 지터 없음)
+            timeout: 전체 대기 제한 시간 (초, None이면 제한 없음)
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.timeout = timeout
+
+    @classmethod
+    def from_env(cls) -> "PollingStrategy":
+        """환경 변수로 폴링 전략을 생성합니다.
+
+        - ATHENA_POLL_INITIAL_DELAY: 첫 폴링 간격 (기본값 0.05초)
+        - ATHENA_POLL_MAX_DELAY: 최대 폴링 간격 (기본값 1초)
+        - ATHENA_POLL_MULTIPLIER: 백오프 배수 (기본값 1.6)
+        - ATHENA_POLL_JITTER: 지터 비율 (기본값 0.3)
+        - ATHENA_QUERY_TIMEOUT: 전체 대기 제한 시간 (기본값 120초, 0이면 제한 없음)
+        """
+        timeout = float(os.getenv("ATHENA_QUERY_TIMEOUT", "120"))
+        return cls(
+            initial_delay=float(os.getenv("ATHENA_POLL_INITIAL_DELAY", "0.05")),
+            max_delay=float(os.getenv("ATHENA_POLL_MAX_DELAY", "1.0")),
+            multiplier=float(os.getenv("ATHENA_POLL_MULTIPLIER", "1.6")),
+            jitter=float(os.getenv("ATHENA_POLL_JITTER", "0.3")),
+            timeout=timeout if timeout > 0 else None,
+        )
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째 폴링 이후 대기할 시간을 반환합니다.
+
+        Args:
+            attempt: 0부터 시작하는 폴링 횟수
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        base = min(self.max_delay, self.initial_delay * (self.multiplier**attempt))
+        return base * random.uniform(1 - self.jitter, 1)
@@ -1,12 +1,16 @@
 """RDS 데이터베이스 연결 모듈"""
 
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-import streamlit as st
 from sqlalchemy import create_engine
 from data.connection import DatabaseConnection
 from data.logger import setup_logger
+from data.queries.query_utils import normalize_sql
+from data.single_flight import SingleFlight
+from data.telemetry import telemetry
 
 logger = setup_logger("rds_connection")
 
@@ -16,11 +20,14 @@ class RDSConnection(DatabaseConnection):
 
     def __init__(self):
         self._engine = None
+        self._engine_lock = threading.Lock()
         self._database = os.getenv("RDS_DB")
         self._schema = os.getenv("RDS_SCHEMA")
         self._host = os.getenv("RDS_HOST")
         self._port = os.getenv("RDS_PORT", "5432")
         self._user = os.getenv("RDS_USER")
+        self._max_workers = int(os.getenv("RDS_MAX_WORKERS", "8"))
+        self._flight = SingleFlight("rds")
         logger.info(
             f"RDSConnection 초기화: host={self._host}, database={self._database}, schema={self._schema}"
         )
@@ -34,16 +41,33 @@ class RDSConnection(DatabaseConnection):
         return self._schema, self._database
 
     def _get_engine(self):
-        """RDS 엔진을 생성하고 반환합니다."""
-        if self._engine is None:
-            user = os.getenv("RDS_USER")
-            password = os.getenv("RDS_PASSWORD")
-            host = os.getenv("RDS_HOST")
-            port = os.getenv("RDS_PORT", "5432")
-            db = os.getenv("RDS_DB")
+        """RDS 엔진을 생성하고 반환합니다.
 
-            url = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{db}"
-            self._engine = create_engine(url)
+        엔진(커넥션 풀)은 프로세스에서 한 번만 생성되어 모든 세션이 공유합니다.
+
+        - RDS_POOL_SIZE: 유지할 커넥션 수 (기본값 5)
+        - RDS_MAX_OVERFLOW: 풀 크기를 넘어 추가로 열 수 있는 커넥션 수 (기본값 10)
+        - RDS_POOL_RECYCLE: 커넥션 재생성 주기 (초, 기본값 1800)
+        - RDS_POOL_TIMEOUT: 풀에서 커넥션을 기다리는 최대 시간 (초, 기본값 30)
+        """
+        if self._engine is None:
+            with self._engine_lock:
+                if self._engine is None:
+                    user = os.getenv("RDS_USER")
+                    password = os.getenv("RDS_PASSWORD")
+                    host = os.getenv("RDS_HOST")
+                    port = os.getenv("RDS_PORT", "5432")
+                    db = os.getenv("RDS_DB")
+
+                    url = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{db}"
+                    self._engine = create_engine(
+                        url,
+                        pool_size=int(os.getenv("RDS_POOL_SIZE", "5")),
+                        max_overflow=int(os.getenv("RDS_MAX_OVERFLOW", "10")),
+                        pool_pre_ping=True,
+                        pool_recycle=int(os.getenv("RDS_POOL_RECYCLE", "1800")),
+                        pool_timeout=int(os.getenv("RDS_POOL_TIMEOUT", "30")),
+                    )
 
         return self._engine
 
@@ -57,39 +81,106 @@ class RDSConnection(DatabaseConnection):
         Returns:
             pd.DataFrame: 쿼리 결과를 담은 DataFrame
         """
-        start_time = time.time()
+        return self._flight.execute_many(
+            [self._flight_key(query)],
+            [query],
+            lambda leader_queries: [self._execute_one(leader_queries[0])],
+        )[0]
+
+    def _execute_one(self, query: str) -> pd.DataFrame:
+        """쿼리 하나를 실제로 실행합니다."""
         connection_type = "rds"
 
         logger.info(f"[{connection_type}] 쿼리 실행 시작")
-        logger.debug(f"[{connection_type}] 쿼리: {query[:200]}...")  # 처음 200자만 로깅
-
         engine = self._get_engine()
 
         try:
-            df = pd.read_sql(query, engine)
-            total_time = time.time() - start_time
-
-            logger.info(
-                f"[{connection_type}] 쿼리 완료 - "
-                f"총 시간: {total_time:.2f}초, "
-                f"행 수: {len(df)}"
-            )
-
-            # Streamlit 세션 상태에 성능 정보 저장
-            if "query_performance" not in st.session_state:
-                st.session_state.query_performance = []
-
-            st.session_state.query_performance.append({
-                "connection_type": connection_type,
-                "total_time": total_time,
-                "wait_time": 0,  # RDS는 대기 시간이 없음
-                "fetch_time": total_time,
-                "row_count": len(df),
-                "query_preview": query[:100],
-            })
-
+            df, total_time = self._run_query(engine, query)
+            self._record_performance(connection_type, query, total_time, len(df))
             return df
         except Exception as e:
+            telemetry.record_error(connection_type, query, f"{e!s}")
             error_msg = f"RDS 쿼리 실행 중 오류: {e!s}"
             logger.error(f"[{connection_type}] {error_msg}", exc_info=True)
             raise Exception(error_msg) from e
+
+    def execute_many(self, queries: list[str], **kwargs) -> list[pd.DataFrame]:
+        """여러 RDS 쿼리를 스레드 풀에서 동시에 실행합니다.
+
+        각 쿼리는 SQLAlchemy 엔진의 커넥션 풀에서 별도 커넥션을 받아 실행되므로,
+        전체 소요 시간은 가장 느린 쿼리 하나의 시간에 가깝습니다.
+        다른 세션에서 같은 쿼리가 이미 실행 중이면 그 결과를 기다려 복사본을 받습니다.
+
+        Args:
+            queries: 실행할 SQL 쿼리 문자열 리스트
+            **kwargs: 추가 파라미터 (사용되지 않지만 호환성을 위해 유지)
+
+        Returns:
+            list[pd.DataFrame]: 입력 순서와 동일한 순서의 쿼리 결과 리스트
+        """
+        if not queries:
+            return []
+
+        return self._flight.execute_many(
+            [self._flight_key(query) for query in queries], queries, self._execute_many
+        )
+
+    def single_flight_stats(self) -> dict:
+        """동일 쿼리 병합 통계 (실행 수, 절약된 실행 수, 진행 중인 쿼리 수)를 반환합니다."""
+        return self._flight.stats()
+
+    def _flight_key(self, query: str) -> str:
+        return f"{self._host}|{self._database}|{normalize_sql(query)}"
+
+    def _execute_many(self, queries: list[str]) -> list[pd.DataFrame]:
+        """쿼리를 스레드 풀에서 실제로 실행합니다."""
+        connection_type = "rds"
+
+        logger.info(f"[{connection_type}] 쿼리 실행 시작 ({len(queries)}건)")
+        engine = self._get_engine()
+
+        try:
+            def run(query: str) -> tuple[pd.DataFrame, float]:
+                try:
+                    return self._run_query(engine, query)
+                except Exception as e:
+                    telemetry.record_error(connection_type, query, f"{e!s}")
+                    raise
+
+            # 워커 스레드에서는 쿼리만 실행하고, 성능 기록은 호출 스레드에서 수행
+            max_workers = min(len(queries), self._max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(run, queries))
+
+            dataframes = []
+            for query, (df, total_time) in zip(queries, outcomes):
+                self._record_performance(connection_type, query, total_time, len(df))
+                dataframes.append(df)
+
+            return dataframes
+        except Exception as e:
+            error_msg = f"RDS 쿼리 실행 중 오류: {e!s}"
+            logger.error(f"[{connection_type}] {error_msg}", exc_info=True)
+            raise Exception(error_msg) from e
+
+    @staticmethod
+    def _run_query(engine, query: str) -> tuple[pd.DataFrame, float]:
+        """쿼리를 실행하고 (결과, 소요 시간)을 반환합니다."""
+        start_time = time.time()
+        logger.debug(f"[rds] 쿼리: {query[:200]}...")  # 처음 200자만 로깅
+        df = pd.read_sql(query, engine)
+        return df, time.time() - start_time
+
+    def _record_performance(
+        self, connection_type: str, query: str, total_time: float, row_count: int
+    ):
+        """쿼리 성능 정보를 로깅하고 프로세스 전역 텔레메트리에 기록합니다."""
+        logger.info(
+            f"[{connection_type}] 쿼리 완료 - "
+            f"총 시간: {total_time:.2f}초, "
+            f"행 수: {row_count}"
+        )
+
+        telemetry.record(
+            connection_type, query, total_time=total_time, row_count=row_count
+        )
@@ -0,0 +1,134 @@
+"""Athena 결과 타입 디코딩 모듈
+
+Athena가 반환하는 ResultSetMetadata.ColumnInfo의 타입 정보를 이용해
+컬럼 단위로 한 번에(벡터화) 값을 변환합니다. NULL은 NaN/NA로 변환됩니다.
+get_query_results 결과와 S3 출력 CSV 모두 NULL과 빈 문자열을 구분합니다.
+"""
+
+import csv
+import io
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+
+INTEGER_TYPES = {"tinyint", "smallint", "integer", "int", "bigint"}
+FLOAT_TYPES = {"double", "float", "real", "decimal"}
+DATE_TYPES = {"date"}
+TIMESTAMP_TYPES = {"timestamp", "timestamp with time zone"}
+BOOLEAN_TYPES = {"boolean"}
+
+
+def decode_column(values: pd.Series, athena_type: str) -> pd.Series:
+    """문자열 컬럼을 Athena 타입에 맞게 변환합니다.
+
+    Args:
+        values: 문자열(NULL은 None/NaN) 값을 담은 Series
+        athena_type: ColumnInfo의 Type 값 (예: varchar, bigint, decimal)
+
+    Returns:
+        pd.Series: 타입이 변환된 Series
+            - 정수형: Int64 (NULL은 <NA>)
+            - 실수형/decimal: float64 (NULL은 NaN)
+            - date: datetime.date 객체 (NULL은 NaT)
+            - timestamp: datetime64 (NULL은 NaT)
+            - boolean: boolean (NULL은 <NA>)
+            - 그 외(varchar 등): 문자열 (NULL은 None)
+    """
+    athena_type = athena_type.lower()
+
+    if athena_type in INTEGER_TYPES:
+        return values.astype("string").astype("Int64")
+    if athena_type in FLOAT_TYPES:
+        return pd.to_numeric(values, errors="coerce").astype("float64")
+    if athena_type in DATE_TYPES:
+        return pd.to_datetime(values, format="%Y-%m-%d", errors="coerce").dt.date
+    if athena_type in TIMESTAMP_TYPES:
+        return pd.to_datetime(values, format="ISO8601", errors="coerce")
+    if athena_type in BOOLEAN_TYPES:
+        return values.str.lower().map({"true": True, "false": False}).astype("boolean")
+
+    return values.astype(object).where(values.notna(), None)
+
+
+def decode_result_rows(column_info: list[dict], rows: list[dict]) -> pd.DataFrame:
+    """get_query_results의 Rows를 타입이 지정된 DataFrame으로 변환합니다.
+
+    VarCharValue가 없는 셀은 NULL로 취급합니다 (빈 문자열과 구분됨).
+
+    Args:
+        column_info: ResultSetMetadata.ColumnInfo 리스트
+        rows: 헤더 행을 제외한 ResultSet.Rows 리스트
+
+    Returns:
+        pd.DataFrame: 컬럼별로 타입이 변환된 DataFrame
+    """
+    cells = [row["Data"] for row in rows]
+
+    # 행 -> 열 전치를 컬럼별 리스트 컴프리헨션 한 번으로 수행한 뒤 컬럼 단위로 변환
+    return pd.DataFrame({
+        col["Name"]: decode_column(
+            pd.Series([data[i].get("VarCharValue") for data in cells], dtype=object),
+            col["Type"],
+        )
+        for i, col in enumerate(column_info)
+    })
+
+
+def decode_frame(
+    df: pd.DataFrame, column_info: Optional[list[dict]] = None
+) -> pd.DataFrame:
+    """문자열로 읽은 DataFrame(예: S3 출력 CSV)을 컬럼 타입에 맞게 변환합니다.
+
+    Args:
+        df: 모든 값이 문자열(NULL은 None/NaN)인 DataFrame
+        column_info: ResultSetMetadata.ColumnInfo 리스트 (None이면 변환하지 않음)
+
+    Returns:
+        pd.DataFrame: 컬럼별로 타입이 변환된 DataFrame
+    """
+    if not column_info:
+        return df
+
+    types = {col["Name"]: col["Type"] for col in column_info}
+    return pd.DataFrame({
+        name: decode_column(df[name], types.get(name, "varchar"))
+        for name in df.columns
+    })
+
+
+def read_result_csv(
+    body: bytes, column_info: Optional[list[dict]] = None
+) -> pd.DataFrame:
+    """Athena 출력 CSV를 읽어 타입이 지정된 DataFrame으로 변환합니다.
+
+    Athena는 값이 있는 필드를 항상 따옴표로 감싸고 NULL은 따옴표 없는 빈 필드로 씁니다.
+    pandas CSV 파서는 둘을 구분하지 못하므로 pyarrow CSV 파서로 따옴표 없는 빈 필드만
+    NULL로 읽어, 빈 문자열("")은 get_query_results 경로와 같이 빈 문자열로 남깁니다.
+
+    Args:
+        body: 헤더 행을 포함한 CSV 파일 내용
+        column_info: ResultSetMetadata.ColumnInfo 리스트 (None이면 문자열 그대로 반환)
+
+    Returns:
+        pd.DataFrame: 컬럼별로 타입이 변환된 DataFrame
+    """
+    if column_info:
+        names = [col["Name"] for col in column_info]
+    else:
+        header = body.split(b"\n", 1)[0].decode("utf-8").rstrip("\r")
+        names = next(csv.reader([header]), [])
+
+    table = pa_csv.read_csv(
+        io.BytesIO(body),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=dict.fromkeys(names, pa.string()),
+            null_values=[""],
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=False,
+        ),
+    )
+    df = table.to_pandas()
+    return decode_frame(df, column_info)
@@ -0,0 +1,175 @@
+"""세션별 Athena 스캔 예산 모듈
+
+Athena 비용은 스캔한 바이트에 비례합니다. Streamlit 세션마다 최근 window초 동안
+스캔한 바이트를 합산하고, 예산을 넘긴 세션은 새 쿼리를 시작하지 못하게 하여
+한 사용자가 비용을 끌어올리는 것을 막습니다 (캐시된 결과나 이전 버전 결과는 계속 제공).
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Optional
+
+from data.logger import setup_logger
+from data.telemetry import format_metric, telemetry
+
+logger = setup_logger("scan_budget")
+
+
+class QueryBudgetExceeded(Exception):
+    """세션의 스캔 예산을 초과하여 새 쿼리를 시작할 수 없을 때 발생하는 예외"""
+
+
+class _SessionUsage:
+    """세션 하나의 (시각, 스캔 바이트) 기록과 누적 카운터"""
+
+    def __init__(self):
+        self.charges: deque[tuple[float, int]] = deque()
+        self.total_bytes = 0
+        self.queries = 0
+        self.rejections = 0
+        self.last_seen = 0.0
+
+
+class ScanBudget:
+    """세션별 스캔 바이트를 집계하고 예산 초과 여부를 판단하는 스레드 안전 클래스"""
+
+    def __init__(
+        self,
+        budget_bytes: int = 0,
+        window: float = 3600.0,
+        max_sessions: int = 1000,
+    ):
+        """
+        Args:
+            budget_bytes: window 동안 세션이 스캔할 수 있는 최대 바이트 (0이면 제한 없음)
+            window: 예산을 적용할 기간 (초)
+            max_sessions: 기록을 보관할 최대 세션 수 (오래 사용되지 않은 세션부터 제거)
+        """
+        self._budget_bytes = budget_bytes
+        self._window = window
+        self._max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions: OrderedDict[str, _SessionUsage] = OrderedDict()
+        self._rejections = 0
+
+    @property
+    def budget_bytes(self) -> int:
+        """세션별 예산 (바이트, 0이면 제한 없음)"""
+        return self._budget_bytes
+
+    def _usage_for(self, session_id: str) -> _SessionUsage:
+        """세션 기록을 반환합니다 (없으면 생성, 호출 측에서 잠금을 잡고 있어야 함)."""
+        usage = self._sessions.get(session_id)
+        if usage is None:
+            usage = _SessionUsage()
+            self._sessions[session_id] = usage
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+
+        # 기간이 지난 기록 제거
+        cutoff = time.time() - self._window
+        while usage.charges and usage.charges[0][0] < cutoff:
+            usage.charges.popleft()
+        usage.last_seen = time.time()
+        return usage
+
+    def charge(self, session_id: Optional[str], scanned_bytes: int):
+        """세션이 스캔한 바이트를 기록합니다 (스크립트 실행 밖의 쿼리는 기록하지 않음)."""
+        if session_id is None:
+            return
+        with self._lock:
+            usage = self._usage_for(session_id)
+            usage.charges.append((time.time(), scanned_bytes))
+            usage.total_bytes += scanned_bytes
+            usage.queries += 1
+
+    def usage(self, session_id: Optional[str]) -> int:
+        """세션이 최근 window 동안 스캔한 바이트를 반환합니다."""
+        if session_id is None:
+            return 0
+        with self._lock:
+            if session_id not in self._sessions:
+                return 0
+            return sum(scanned for _, scanned in self._usage_for(session_id).charges)
+
+    def check(self, session_id: Optional[str]):
+        """세션이 예산을 초과했으면 QueryBudgetExceeded를 발생시킵니다."""
+        if session_id is None or self._budget_bytes <= 0:
+            return
+
+        used = self.usage(session_id)
+        if used < self._budget_bytes:
+            return
+
+        with self._lock:
+            self._usage_for(session_id).rejections += 1
+            self._rejections += 1
+
+        error_msg = (
+            f"세션 스캔 예산 초과: 최근 {self._window / 60:.0f}분 동안 "
+            f"{used / 1024 / 1024:.1f} MB / {self._budget_bytes / 1024 / 1024:.0f} MB"
+        )
+        logger.warning(f"[athena] {error_msg} (session={session_id[:8]})")
+        raise QueryBudgetExceeded(error_msg)
+
+    def sessions(self) -> list[dict]:
+        """세션별 사용량을 최근 window 스캔량이 많은 순으로 반환합니다.
+
+        Returns:
+            list[dict]: session_id, window_bytes, total_bytes, queries, rejections, last_seen
+        """
+        with self._lock:
+            rows = [
+                {
+                    "session_id": session_id,
+                    "window_bytes": sum(scanned for _, scanned in self._usage_for(session_id).charges),
+                    "total_bytes": usage.total_bytes,
+                    "queries": usage.queries,
+                    "rejections": usage.rejections,
+                    "last_seen": usage.last_seen,
+                }
+                for session_id, usage in list(self._sessions.items())
+            ]
+        return sorted(rows, key=lambda row: row["window_bytes"], reverse=True)
+
+    def metric_lines(self) -> list[str]:
+        """예산 통계를 Prometheus 텍스트 형식의 줄 목록으로 반환합니다."""
+        sessions = self.sessions()
+        over_budget = (
+            sum(row["window_bytes"] >= self._budget_bytes for row in sessions)
+            if self._budget_bytes > 0
+            else 0
+        )
+        with self._lock:
+            rejections = self._rejections
+        return [
+            "# TYPE threelacha_scan_budget_rejections_total counter",
+            format_metric("threelacha_scan_budget_rejections_total", rejections),
+            "# TYPE threelacha_scan_budget_sessions_over_budget gauge",
+            format_metric("threelacha_scan_budget_sessions_over_budget", over_budget),
+        ]
+
+
+_scan_budget: Optional[ScanBudget] = None
+_scan_budget_lock = threading.Lock()
+
+
+def get_scan_budget() -> ScanBudget:
+    """프로세스 전역에서 공유되는 세션 스캔 예산을 반환합니다.
+
+    - ATHENA_SESSION_SCAN_BUDGET_MB: 세션별 스캔 예산 MB (기본값 0, 제한 없음)
+    - ATHENA_SESSION_SCAN_WINDOW_MINUTES: 예산 적용 기간 분 (기본값 60)
+    """
+    global _scan_budget
+    with _scan_budget_lock:
+        if _scan_budget is None:
+            _scan_budget = ScanBudget(
+                budget_bytes=int(float(os.getenv("ATHENA_SESSION_SCAN_BUDGET_MB", "0")) * 1024 * 1024),
+                window=float(os.getenv("ATHENA_SESSION_SCAN_WINDOW_MINUTES", "60")) * 60,
+            )
+            telemetry.register_collector(_scan_budget.metric_lines)
+        return _scan_budget
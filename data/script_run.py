@@ -0,0 +1,94 @@
+"""Streamlit 스크립트 실행(run) 상태 조회 모듈
+
+사용자가 선택 박스를 빠르게 바꾸면 Streamlit은 이전 스크립트 실행을 중단하고 다시 실행합니다.
+중단 요청은 다음 st 호출 시점에야 처리되므로, 쿼리 완료를 기다리는 동안에는
+이 모듈로 요청 여부를 직접 확인해 오래 걸리는 작업을 먼저 정리할 수 있습니다.
+
+요청 상태는 Streamlit의 비공개 구현(ScriptRequests._state, _rerun_data)을 읽습니다.
+Streamlit 1.37~1.52 기준으로 작성되었으며 (1.38부터 scriptrunner_utils로 이동),
+이후 버전에서 import나 속성 접근이 실패하면 "중단 요청 없음"으로 동작합니다
+(쿼리를 취소하지 않고 끝까지 기다림).
+"""
+
+from typing import Any, Optional
+
+import streamlit as st
+
+from data.logger import setup_logger
+
+logger = setup_logger("script_run")
+
+try:
+    from streamlit.runtime.scriptrunner_utils.exceptions import StopException
+    from streamlit.runtime.scriptrunner_utils.script_requests import ScriptRequestType
+    from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
+except ImportError:
+    try:
+        # Streamlit 1.37
+        from streamlit.runtime.scriptrunner.exceptions import StopException
+        from streamlit.runtime.scriptrunner.script_requests import ScriptRequestType
+        from streamlit.runtime.scriptrunner.script_run_context import get_script_run_ctx
+    except ImportError as e:
+        logger.warning(f"Streamlit 스크립트 실행 상태를 읽을 수 없어 재실행 감지를 사용하지 않음: {e!s}")
+        StopException = ScriptRequestType = get_script_run_ctx = None
+
+# 비공개 속성 구조가 달라 확인에 실패한 뒤에는 다시 시도하지 않음
+_supported = ScriptRequestType is not None
+
+
+def current_script_run() -> Optional[Any]:
+    """현재 스레드의 스크립트 실행 컨텍스트(ScriptRunContext)를 반환합니다.
+
+    스크립트 스레드가 아니거나 실행 상태를 읽을 수 없는 버전이면 None을 반환합니다.
+    """
+    if get_script_run_ctx is None:
+        return None
+    return get_script_run_ctx(suppress_warning=True)
+
+
+def is_superseded(ctx: Optional[Any]) -> bool:
+    """스크립트 실행에 중단(STOP) 또는 재실행(RERUN) 요청이 들어왔는지 확인합니다.
+
+    요청을 소비하지 않고 상태만 읽으며, 현재 실행을 중단시키지 않는 fragment 재실행
+    요청은 무시합니다 (ScriptRequests.on_scriptrunner_yield와 같은 기준).
+    비공개 속성 구조가 예상과 다르면 경고를 한 번 남기고 항상 False를 반환합니다.
+    """
+    global _supported
+    requests = getattr(ctx, "script_requests", None)
+    if not _supported or requests is None:
+        return False
+
+    try:
+        state = requests._state
+        if state == ScriptRequestType.STOP:
+            return True
+        if state != ScriptRequestType.RERUN:
+            return False
+
+        rerun_data = requests._rerun_data
+        fragment_only = bool(rerun_data.fragment_id_queue) and not (
+            rerun_data.is_fragment_scoped_rerun
+        )
+    except AttributeError as e:
+        _supported = False
+        logger.warning(f"Streamlit 재실행 요청 상태를 읽을 수 없어 재실행 감지를 사용하지 않음: {e!s}")
+        return False
+    return not fragment_only
+
+
+def stop_script_run():
+    """현재 스크립트 실행을 조용히 끝냅니다.
+
+    st.stop()과 달리 대기 중인 재실행 요청을 STOP으로 바꾸지 않으므로,
+    Streamlit은 실행을 끝낸 뒤 새 입력으로 바로 다시 실행합니다.
+    StopException을 찾을 수 없는 버전에서는 st.stop()을 사용합니다.
+    """
+    if StopException is None:
+        st.stop()
+    raise StopException()
+
+
+def current_session_id() -> Optional[str]:
+    """현재 스크립트 실행이 속한 Streamlit 세션 ID를 반환합니다 (스크립트 스레드가 아니면 None)."""
+    ctx = current_script_run()
+    return getattr(ctx, "session_id", None)
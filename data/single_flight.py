@@ -0,0 +1,148 @@
+"""동일 쿼리 동시 실행 병합(single-flight) 모듈
+
+아침 트래픽처럼 여러 세션이 같은 쿼리를 동시에 요청하면, 먼저 요청한 쪽(leader)만
+실제로 실행하고 나머지(waiter)는 같은 Future를 기다렸다가 결과의 복사본을 받습니다.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable
+
+import pandas as pd
+
+from data.logger import setup_logger
+from data.telemetry import format_metric, telemetry
+
+logger = setup_logger("single_flight")
+
+
+class _Abandoned(Exception):
+    """leader의 실행이 중단되어(예: Streamlit 재실행) 결과를 받지 못했음을 waiter에게 알리는 예외"""
+
+
+class SingleFlight:
+    """키(정규화된 SQL 등)별로 진행 중인 실행을 하나로 합치는 스레드 안전 클래스"""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: 메트릭/로그에 표시할 이름 (예: 연결 타입)
+        """
+        self._name = name
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future] = {}
+        self._waiters: dict[str, int] = {}
+        self._stats = {"executions": 0, "shared": 0}
+        telemetry.register_collector(self.metric_lines)
+
+    def stats(self) -> dict:
+        """실행 수(executions), 합쳐져 절약된 실행 수(shared), 진행 중인 키 수(in_flight)를 반환합니다."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._calls)
+        return stats
+
+    def metric_lines(self) -> list[str]:
+        """통계를 Prometheus 텍스트 형식의 줄 목록으로 반환합니다."""
+        stats = self.stats()
+        return [
+            "# TYPE threelacha_single_flight_total counter",
+            format_metric(
+                "threelacha_single_flight_total",
+                stats["executions"],
+                {"backend": self._name, "role": "executed"},
+            ),
+            format_metric(
+                "threelacha_single_flight_total",
+                stats["shared"],
+                {"backend": self._name, "role": "shared"},
+            ),
+        ]
+
+    def _acquire(self, key: str) -> tuple[Future, bool]:
+        """키의 Future와 leader 여부를 반환합니다 (진행 중인 실행이 없으면 leader가 됨)."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._stats["shared"] += 1
+                self._waiters[key] = self._waiters.get(key, 0) + 1
+                return future, False
+
+            future = Future()
+            self._calls[key] = future
+            self._stats["executions"] += 1
+            return future, True
+
+    def _release(self, key: str) -> Future:
+        with self._lock:
+            self._waiters.pop(key, None)
+            return self._calls.pop(key)
+
+    def waiters(self, key: str) -> int:
+        """진행 중인 실행의 결과를 기다리는 다른 호출 수를 반환합니다."""
+        with self._lock:
+            return self._waiters.get(key, 0)
+
+    def execute_many(
+        self,
+        keys: list[str],
+        queries: list[str],
+        run: Callable[[list[str]], list[pd.DataFrame]],
+    ) -> list[pd.DataFrame]:
+        """진행 중이지 않은 쿼리만 run으로 실행하고, 나머지는 진행 중인 실행의 결과를 기다립니다.
+
+        leader는 자신이 맡은 쿼리를 먼저 실행해 결과를 공개한 뒤에 다른 실행을 기다리므로
+        세션끼리 서로를 기다리며 멈추는 일은 없습니다. leader의 실행이 중단되면
+        (Exception이 아닌 BaseException, 예: Streamlit StopException) waiter가 직접 다시 실행합니다.
+
+        Args:
+            keys: 쿼리별 병합 키 (같은 키는 같은 결과를 반환해야 함)
+            queries: 실행할 SQL 쿼리 문자열 리스트
+            run: 쿼리 리스트를 받아 같은 순서의 결과 리스트를 반환하는 실제 실행 함수
+
+        Returns:
+            list[pd.DataFrame]: 입력 순서와 동일한 순서의 쿼리 결과 리스트
+                (leader가 아닌 쿼리는 결과의 복사본)
+        """
+        futures: list[Future] = []
+        leader_indexes: list[int] = []
+        for i, key in enumerate(keys):
+            future, is_leader = self._acquire(key)
+            futures.append(future)
+            if is_leader:
+                leader_indexes.append(i)
+
+        results: dict[int, pd.DataFrame] = {}
+        if leader_indexes:
+            try:
+                dataframes = run([queries[i] for i in leader_indexes])
+            except Exception as e:
+                for i in leader_indexes:
+                    self._release(keys[i]).set_exception(e)
+                raise
+            except BaseException:
+                for i in leader_indexes:
+                    self._release(keys[i]).set_exception(_Abandoned())
+                raise
+
+            for i, df in zip(leader_indexes, dataframes):
+                self._release(keys[i]).set_result(df)
+                results[i] = df
+
+        retry_indexes: list[int] = []
+        for i, future in enumerate(futures):
+            if i in results:
+                continue
+            try:
+                results[i] = future.result().copy()
+            except _Abandoned:
+                retry_indexes.append(i)
+
+        if retry_indexes:
+            logger.info(f"[{self._name}] 중단된 실행을 다시 요청합니다 ({len(retry_indexes)}건)")
+            retried = self.execute_many(
+                [keys[i] for i in retry_indexes], [queries[i] for i in retry_indexes], run
+            )
+            results.update(zip(retry_indexes, retried))
+
+        return [results[i] for i in range(len(queries))]
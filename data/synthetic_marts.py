@@ -0,0 +1,287 @@
+"""합성(synthetic) gold 마트 생성 모듈
+
+AWS 자격 증명 없이 대시보드를 실행하거나 성능을 측정할 수 있도록, 실제 마트와
+같은 컬럼 구성의 데이터를 지역 수 x 품목 수 x 일수 규모로 만들어 냅니다.
+지역 이름과 좌표는 assets/retail_regions.json에서 가져오므로 지도도 그대로 그려집니다.
+"""
+
+import json
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+REGIONS_GEOJSON = Path(__file__).resolve().parent.parent / "assets" / "retail_regions.json"
+
+# (카테고리, 품목, 품종, 단위, 기준 가격)
+ITEM_CATALOG = (
+    ("식량작물", "쌀", "일반계", "20kg", 58000),
+    ("식량작물", "찹쌀", "일반계", "1kg", 4800),
+    ("식량작물", "감자", "수미", "100g", 420),
+    ("식량작물", "고구마", "밤", "1kg", 5600),
+    ("채소류", "배추", "월동", "1포기", 3900),
+    ("채소류", "무", "월동", "1개", 1900),
+    ("채소류", "양파", "양파", "1kg", 2900),
+    ("채소류", "대파", "대파", "1kg", 3500),
+    ("채소류", "오이", "가시계통", "10개", 9800),
+    ("채소류", "당근", "무세척", "1kg", 4200),
+    ("채소류", "시금치", "시금치", "100g", 980),
+    ("특용작물", "참깨", "백색", "500g", 15500),
+    ("특용작물", "땅콩", "국산", "100g", 2600),
+    ("과일류", "사과", "후지", "10개", 28000),
+    ("과일류", "배", "신고", "10개", 39000),
+    ("과일류", "감귤", "노지", "10개", 4200),
+    ("과일류", "딸기", "딸기", "100g", 2300),
+    ("축산물", "소", "한우 등심", "100g", 11500),
+    ("축산물", "돼지", "삼겹살", "100g", 2700),
+    ("축산물", "닭", "육계", "1kg", 6100),
+    ("축산물", "계란", "특란", "30구", 7200),
+    ("수산물", "고등어", "국산(염장)", "1마리", 4300),
+    ("수산물", "오징어", "냉동", "1마리", 5200),
+    ("수산물", "김", "마른김", "10장", 1300),
+)
+
+CHANNEL_TYPES = ("유통", "전통")
+ECO_MARKETS = ("이마트", "롯데마트", "홈플러스", "하나로마트")
+
+
+def _season_of(month: int) -> str:
+    """월을 계절 이름으로 변환합니다."""
+    if month in (3, 4, 5):
+        return "봄"
+    if month in (6, 7, 8):
+        return "여름"
+    if month in (9, 10, 11):
+        return "가을"
+    return "겨울"
+
+
+def _load_regions(count: int) -> pd.DataFrame:
+    """GeoJSON의 지역 이름(CITY_AB_NM)과 대략적인 중심 좌표를 count개 반환합니다.
+
+    GeoJSON의 지역 수보다 많이 요청하면 이름에 번호를 붙여 반복합니다.
+    """
+    with open(REGIONS_GEOJSON, encoding="utf-8") as f:
+        features = json.load(f)["features"]
+
+    base = []
+    for feature in features:
+        coords = np.array(_outer_ring(feature["geometry"]))
+        base.append((
+            feature["properties"]["CITY_AB_NM"],
+            float(coords[:, 1].mean()),
+            float(coords[:, 0].mean()),
+        ))
+
+    regions = []
+    for i in range(count):
+        name, lat, lon = base[i % len(base)]
+        if i >= len(base):
+            name = f"{name}{i // len(base) + 1}"
+        regions.append((name, lat, lon))
+
+    return pd.DataFrame(regions, columns=["country_nm", "latitude", "longitude"])
+
+
+def _outer_ring(geometry: dict) -> list:
+    """Polygon/MultiPolygon의 첫 번째 외곽선 좌표를 반환합니다."""
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"][0][0]
+    return geometry["coordinates"][0]
+
+
+def _load_items(count: int) -> pd.DataFrame:
+    """품목 카탈로그에서 count개를 반환합니다 (부족하면 번호를 붙여 반복)."""
+    items = []
+    for i in range(count):
+        category, item, kind, unit, price = ITEM_CATALOG[i % len(ITEM_CATALOG)]
+        if i >= len(ITEM_CATALOG):
+            item = f"{item}{i // len(ITEM_CATALOG) + 1}"
+        items.append((1000 + i, category, item, kind, unit, price))
+
+    return pd.DataFrame(
+        items,
+        columns=[
+            "product_no",
+            "category_nm",
+            "item_nm",
+            "kind_nm",
+            "product_cls_unit",
+            "base_price",
+        ],
+    )
+
+
+def generate_marts(
+    regions: int = 32,
+    items: int = 24,
+    days: int = 3,
+    latest_date: Optional[date] = None,
+    seed: int = 42,
+) -> dict[str, pd.DataFrame]:
+    """모든 gold 마트를 합성 데이터로 생성합니다.
+
+    Args:
+        regions: 지역 수
+        items: 품목(품종) 수
+        days: 일자별 마트(유통/지역/친환경 비교)에 포함할 일수
+        latest_date: 최신 데이터 일자 (기본값: 오늘)
+        seed: 난수 시드 (같은 인자면 항상 같은 데이터 생성)
+
+    Returns:
+        dict[str, pd.DataFrame]: 마트 테이블 이름 -> DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    latest_date = latest_date or date.today()
+    region_df = _load_regions(regions)
+    item_df = _load_items(items)
+    dates = [latest_date - timedelta(days=offset) for offset in range(days)]
+
+    # 지역 x 품목 기준 가격 (지역별로 +-15%)
+    product = region_df.merge(item_df, how="cross")
+    product["base_pr"] = (
+        product["base_price"] * rng.uniform(0.85, 1.15, len(product))
+    ).round(-1)
+
+    # 전일 가격: 약 30%는 변동 없음, 나머지는 +-20% 이내 변동
+    change = rng.uniform(-0.2, 0.2, len(product))
+    change[rng.random(len(product)) < 0.3] = 0.0
+    product["prev_1d_pr"] = (product["base_pr"] / (1 + change)).round(-1)
+    product["prev_1d_dir_pct"] = (
+        (product["base_pr"] - product["prev_1d_pr"]) / product["prev_1d_pr"] * 100
+    ).round(2)
+    product["prev_1y_pr"] = (
+        product["base_pr"] * rng.uniform(0.7, 1.3, len(product))
+    ).round(-1)
+
+    daily = product[
+        [
+            "country_nm",
+            "item_nm",
+            "kind_nm",
+            "product_cls_unit",
+            "base_pr",
+            "prev_1d_pr",
+            "prev_1d_dir_pct",
+        ]
+    ].assign(base_dt=latest_date, prev_1d_dt=latest_date - timedelta(days=1))
+
+    def top3(ascending: bool, mask: pd.Series) -> pd.DataFrame:
+        df = daily[mask].sort_values(
+            ["country_nm", "prev_1d_dir_pct"], ascending=[True, ascending]
+        )
+        df = df.groupby("country_nm", sort=False).head(3).copy()
+        df["ranking"] = df.groupby("country_nm").cumcount() + 1
+        return df[
+            [
+                "country_nm",
+                "item_nm",
+                "kind_nm",
+                "product_cls_unit",
+                "base_dt",
+                "base_pr",
+                "prev_1d_dt",
+                "prev_1d_pr",
+                "prev_1d_dir_pct",
+                "ranking",
+            ]
+        ].reset_index(drop=True)
+
+    direction = np.sign(daily["prev_1d_dir_pct"])
+    region_count = (
+        daily.assign(
+            rise_count=direction > 0, drop_count=direction < 0, keep_count=direction == 0
+        )
+        .groupby("country_nm", as_index=False)[["rise_count", "drop_count", "keep_count"]]
+        .sum()
+    )
+
+    season = product[
+        [
+            "product_no",
+            "category_nm",
+            "item_nm",
+            "kind_nm",
+            "product_cls_unit",
+            "country_nm",
+            "latitude",
+            "longitude",
+            "base_pr",
+            "prev_1y_pr",
+        ]
+    ].assign(
+        dt=int(latest_date.strftime("%Y%m%d")),
+        base_dt="당일",
+        prev_1y_dt="1년전",
+        present_month=latest_date.month,
+        season=_season_of(latest_date.month),
+        season_month=latest_date.month,
+    )
+
+    def daily_prices(keys: pd.DataFrame) -> pd.DataFrame:
+        """keys(품목 x 구분)를 일자별로 펼치고 평균/최저/최고 가격을 붙입니다."""
+        df = pd.DataFrame({"res_dt": dates}).merge(keys, how="cross")
+        df["avg_price"] = (df["base_price"] * rng.uniform(0.8, 1.2, len(df))).round(1)
+        df["min_price"] = (df["avg_price"] * rng.uniform(0.7, 0.95, len(df))).round(-1)
+        df["max_price"] = (df["avg_price"] * rng.uniform(1.05, 1.3, len(df))).round(-1)
+        df["record_count"] = rng.integers(1, 40, len(df))
+        return df.drop(columns="base_price")
+
+    item_keys = item_df[["category_nm", "item_nm", "kind_nm", "base_price"]]
+    channel = daily_prices(
+        item_keys.merge(pd.DataFrame({"channel_type": CHANNEL_TYPES}), how="cross")
+    )
+    region = daily_prices(item_keys.merge(region_df[["country_nm"]], how="cross"))
+    eco = daily_prices(
+        item_df[["product_no", "item_nm", "base_price"]]
+        .rename(columns={"product_no": "item_cd"})
+        .merge(pd.DataFrame({"market_category": ECO_MARKETS}), how="cross")
+    )
+
+    return {
+        "mart_update_status": pd.DataFrame({
+            "latest_date": [latest_date],
+            "row_count": [len(product)],
+            "country_count": [len(region_df)],
+        }),
+        "mart_price_drop_top3": top3(True, daily["prev_1d_dir_pct"] < 0),
+        "mart_price_rise_top3": top3(False, daily["prev_1d_dir_pct"] > 0),
+        "mart_price_region_count": region_count,
+        "mart_season_region_product": season,
+        "mart_retail_channel_comparison": channel,
+        "mart_retail_region_comparison": region,
+        "mart_eco_price_statistics_by_category": eco,
+    }
+
+
+def write_marts(
+    marts: dict[str, pd.DataFrame], output_dir: str, file_format: str = "csv"
+) -> list[Path]:
+    """마트를 테이블 이름별 파일(<table>.csv 또는 <table>.parquet)로 저장합니다.
+
+    Args:
+        marts: 마트 테이블 이름 -> DataFrame
+        output_dir: 저장할 디렉토리
+        file_format: "csv" 또는 "parquet"
+
+    Returns:
+        list[Path]: 저장한 파일 경로 리스트
+    """
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"지원하지 않는 파일 형식: {file_format}. 'csv' 또는 'parquet'를 사용하세요.")
+
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    paths = []
+    for table, df in marts.items():
+        path = output / f"{table}.{file_format}"
+        if file_format == "csv":
+            df.to_csv(path, index=False)
+        else:
+            df.to_parquet(path, index=False)
+        paths.append(path)
+
+    return paths
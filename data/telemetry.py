@@ -0,0 +1,521 @@
+"""프로세스 전역 쿼리 텔레메트리 모듈
+
+모든 연결 객체가 쿼리마다 실행 시간(총/대기/결과 가져오기), 행 수, 오류를 기록합니다.
+쿼리 템플릿(리터럴을 제거한 SQL)별로 고정 크기 링 버퍼에 최근 샘플만 보관하므로
+세션/프로세스가 오래 살아 있어도 메모리 사용량이 일정하며, p50/p95/p99를 계산하고
+Prometheus 텍스트 형식으로 내보낼 수 있습니다.
+"""
+
+import hashlib
+import os
+import re
+import statistics
+import threading
+import time
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+from data.logger import setup_logger
+from data.queries.query_utils import PreparedQuery, normalize_sql
+
+logger = setup_logger("telemetry")
+
+PERCENTILES = (50, 95, 99)
+PHASES = ("total", "wait", "fetch")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_TABLE_NAME = re.compile(r"\b(?:from|join)\s+(?:\w+\.)?(\w+)", re.IGNORECASE)
+
+
+def query_fingerprint(query: str) -> tuple[str, str]:
+    """쿼리의 템플릿 ID와 사람이 읽을 수 있는 라벨을 반환합니다.
+
+    문자열/숫자 리터럴을 '?'로 바꾼 정규화 SQL이 같으면 같은 템플릿으로 취급합니다.
+
+    Args:
+        query: SQL 쿼리 문자열 (PreparedQuery이면 템플릿 사용)
+
+    Returns:
+        tuple[str, str]: (템플릿 ID, 조회 테이블 이름을 이은 라벨)
+    """
+    text = query.template if isinstance(query, PreparedQuery) else query
+    text = normalize_sql(text)
+    text = _NUMBER_LITERAL.sub("?", _STRING_LITERAL.sub("?", text))
+
+    tables = list(dict.fromkeys(_TABLE_NAME.findall(text)))
+    # CTE 이름(latest_date, aggregated_data 등)보다 마트 테이블을 우선 표시
+    marts = [table for table in tables if table.startswith("mart_")] or tables
+    label = "+".join(marts) if marts else "query"
+
+    template_id = hashlib.sha1(text.encode("utf-8")).hexdigest()[:10]
+    return template_id, label
+
+
+def percentiles(values: list[float], points: tuple[int, ...] = PERCENTILES) -> dict:
+    """값 목록의 백분위수를 {"p50": ..., "p95": ...} 형태로 반환합니다."""
+    if not values:
+        return {}
+    if len(values) == 1:
+        return {f"p{point}": values[0] for point in points}
+
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {f"p{point}": cuts[point - 1] for point in points}
+
+
+class _TemplateStats:
+    """쿼리 템플릿 하나의 링 버퍼와 누적 카운터"""
+
+    def __init__(self, template_id: str, label: str, connection_type: str, max_samples: int):
+        self.template_id = template_id
+        self.label = label
+        self.connection_type = connection_type
+        self.samples = {phase: deque(maxlen=max_samples) for phase in PHASES}
+        self.rows = deque(maxlen=max_samples)
+        self.polls = deque(maxlen=max_samples)
+        # Athena QueryExecution.Statistics (스캔 바이트, 엔진 실행/대기열 시간)
+        self.scanned = deque(maxlen=max_samples)
+        self.engine = deque(maxlen=max_samples)
+        self.queue = deque(maxlen=max_samples)
+        self.scanned_sum = 0
+        self.sums = dict.fromkeys(PHASES, 0.0)
+        self.count = 0
+        self.row_sum = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.last_seen = 0.0
+        self.query_preview = ""
+
+
+class QueryTelemetry:
+    """쿼리 템플릿별 실행 통계를 보관하는 스레드 안전 저장소
+
+    - 템플릿별 총/대기/결과 가져오기 시간, 행 수, 폴링 횟수: 최근 max_samples개 (링 버퍼)
+    - 템플릿별 실행 수, 누적 시간, 오류/시간 초과 수: 프로세스 시작 이후 누적
+    - 최근 쿼리 기록: 최근 max_recent건 (느린 쿼리 확인용)
+    - 템플릿 수는 max_templates개로 제한하며, 가장 오래 사용되지 않은 템플릿부터 제거
+    """
+
+    def __init__(self, max_samples: int = 512, max_recent: int = 1000, max_templates: int = 500):
+        """
+        Args:
+            max_samples: 템플릿별로 보관할 최근 샘플 수
+            max_recent: 보관할 최근 쿼리 기록 수
+            max_templates: 보관할 최대 템플릿 수
+        """
+        self._max_samples = max_samples
+        self._max_templates = max_templates
+        self._lock = threading.Lock()
+        self._templates: OrderedDict[str, _TemplateStats] = OrderedDict()
+        self._recent: deque[dict] = deque(maxlen=max_recent)
+        self._pages: dict[str, deque] = {}
+        self._page_counts: dict[str, int] = {}
+        self._collectors: list[Callable[[], list[str]]] = []
+
+    def _stats_for(
+        self, connection_type: str, query: str, fingerprint: tuple[str, str]
+    ) -> _TemplateStats:
+        """템플릿 통계를 반환합니다 (없으면 생성, 호출 측에서 잠금을 잡고 있어야 함)."""
+        template_id, label = fingerprint
+        key = f"{connection_type}:{template_id}"
+
+        stats = self._templates.get(key)
+        if stats is None:
+            stats = _TemplateStats(template_id, label, connection_type, self._max_samples)
+            self._templates[key] = stats
+            while len(self._templates) > self._max_templates:
+                self._templates.popitem(last=False)
+        else:
+            self._templates.move_to_end(key)
+
+        stats.last_seen = time.time()
+        stats.query_preview = query[:200]
+        return stats
+
+    def record(
+        self,
+        connection_type: str,
+        query: str,
+        total_time: float,
+        wait_time: float = 0.0,
+        fetch_time: Optional[float] = None,
+        row_count: int = 0,
+        poll_count: Optional[int] = None,
+        query_execution_id: Optional[str] = None,
+        scanned_bytes: Optional[int] = None,
+        engine_time: Optional[float] = None,
+        queue_time: Optional[float] = None,
+    ):
+        """완료된 쿼리 하나의 실행 통계를 기록합니다.
+
+        Args:
+            connection_type: 연결 타입 (athena, rds, local, fixture)
+            query: 실행한 SQL 쿼리 문자열
+            total_time: 총 소요 시간 (초)
+            wait_time: 완료 대기 시간 (초)
+            fetch_time: 결과 가져오기 시간 (초, None이면 total_time - wait_time)
+            row_count: 결과 행 수
+            poll_count: 완료 확인까지의 폴링 횟수 (Athena)
+            query_execution_id: Athena QueryExecutionId (런타임 통계 조회용)
+            scanned_bytes: 스캔한 바이트 (Athena DataScannedInBytes)
+            engine_time: 엔진 실행 시간 (초, Athena EngineExecutionTimeInMillis)
+            queue_time: 대기열 대기 시간 (초, Athena QueryQueueTimeInMillis)
+        """
+        if fetch_time is None:
+            fetch_time = max(total_time - wait_time, 0.0)
+        values = {"total": total_time, "wait": wait_time, "fetch": fetch_time}
+        fingerprint = query_fingerprint(query)
+
+        with self._lock:
+            stats = self._stats_for(connection_type, query, fingerprint)
+            for phase, value in values.items():
+                stats.samples[phase].append(value)
+                stats.sums[phase] += value
+            stats.rows.append(row_count)
+            if poll_count is not None:
+                stats.polls.append(poll_count)
+            if scanned_bytes is not None:
+                stats.scanned.append(scanned_bytes)
+                stats.scanned_sum += scanned_bytes
+            if engine_time is not None:
+                stats.engine.append(engine_time)
+            if queue_time is not None:
+                stats.queue.append(queue_time)
+            stats.count += 1
+            stats.row_sum += row_count
+
+            self._recent.append({
+                "timestamp": stats.last_seen,
+                "connection_type": connection_type,
+                "template_id": stats.template_id,
+                "label": stats.label,
+                "total_time": total_time,
+                "wait_time": wait_time,
+                "fetch_time": fetch_time,
+                "row_count": row_count,
+                "poll_count": poll_count,
+                "query_execution_id": query_execution_id,
+                "scanned_bytes": scanned_bytes,
+                "engine_time": engine_time,
+                "queue_time": queue_time,
+                "query_preview": query[:200],
+                "error": None,
+            })
+
+    def record_error(
+        self, connection_type: str, query: str, error: str, timeout: bool = False
+    ):
+        """실패하거나 시간 초과된 쿼리를 기록합니다."""
+        fingerprint = query_fingerprint(query)
+        with self._lock:
+            stats = self._stats_for(connection_type, query, fingerprint)
+            stats.errors += 1
+            if timeout:
+                stats.timeouts += 1
+
+            self._recent.append({
+                "timestamp": stats.last_seen,
+                "connection_type": connection_type,
+                "template_id": stats.template_id,
+                "label": stats.label,
+                "query_preview": query[:200],
+                "error": error[:500],
+                "timeout": timeout,
+            })
+
+    def record_page(self, page: str, render_time: float):
+        """페이지 한 번의 렌더링(스크립트 실행) 시간을 기록합니다."""
+        with self._lock:
+            if page not in self._pages:
+                self._pages[page] = deque(maxlen=self._max_samples)
+                self._page_counts[page] = 0
+            self._pages[page].append((time.time(), render_time))
+            self._page_counts[page] += 1
+
+    def page_summary(self) -> list[dict]:
+        """페이지별 렌더링 시간 요약을 반환합니다.
+
+        Returns:
+            list[dict]: page, count, mean, p50, p95, p99 (초)
+        """
+        with self._lock:
+            snapshot = {
+                page: ([value for _, value in samples], self._page_counts[page])
+                for page, samples in self._pages.items()
+            }
+
+        summary = []
+        for page, (values, count) in snapshot.items():
+            if not values:
+                continue
+            summary.append({
+                "page": page,
+                "count": count,
+                "mean": statistics.fmean(values),
+                **percentiles(values),
+            })
+        return summary
+
+    def page_samples(self) -> list[dict]:
+        """페이지 렌더링 시간 샘플을 {page, timestamp, render_time} 목록으로 반환합니다."""
+        with self._lock:
+            return [
+                {"page": page, "timestamp": timestamp, "render_time": value}
+                for page, samples in self._pages.items()
+                for timestamp, value in samples
+            ]
+
+    def template_summary(self) -> list[dict]:
+        """템플릿별 통계 요약을 반환합니다 (p95 총 시간이 긴 순).
+
+        Returns:
+            list[dict]: template_id, label, connection_type, count, errors, timeouts,
+                total/wait/fetch의 mean·p50·p95·p99, rows_mean, polls_mean,
+                scanned_mean, scanned_total, engine_mean, queue_mean, last_seen, query_preview
+        """
+        with self._lock:
+            snapshot = [
+                (
+                    stats,
+                    {phase: list(samples) for phase, samples in stats.samples.items()},
+                    list(stats.rows),
+                    list(stats.polls),
+                    (list(stats.scanned), list(stats.engine), list(stats.queue)),
+                )
+                for stats in self._templates.values()
+            ]
+
+        summary = []
+        for stats, samples, rows, polls, (scanned, engine, queue) in snapshot:
+            row = {
+                "template_id": stats.template_id,
+                "label": stats.label,
+                "connection_type": stats.connection_type,
+                "count": stats.count,
+                "errors": stats.errors,
+                "timeouts": stats.timeouts,
+                "rows_mean": statistics.fmean(rows) if rows else None,
+                "polls_mean": statistics.fmean(polls) if polls else None,
+                "scanned_mean": statistics.fmean(scanned) if scanned else None,
+                "scanned_total": stats.scanned_sum,
+                "engine_mean": statistics.fmean(engine) if engine else None,
+                "queue_mean": statistics.fmean(queue) if queue else None,
+                "last_seen": stats.last_seen,
+                "query_preview": stats.query_preview,
+            }
+            for phase, values in samples.items():
+                row[f"{phase}_mean"] = statistics.fmean(values) if values else None
+                for name, value in percentiles(values).items():
+                    row[f"{phase}_{name}"] = value
+            summary.append(row)
+
+        return sorted(summary, key=lambda row: row.get("total_p95") or 0.0, reverse=True)
+
+    def recent(self, limit: Optional[int] = None) -> list[dict]:
+        """최근 쿼리 기록을 오래된 순으로 반환합니다."""
+        with self._lock:
+            records = list(self._recent)
+        return records[-limit:] if limit else records
+
+    def slowest(self, limit: int = 10) -> list[dict]:
+        """최근 기록 중 총 시간이 가장 긴 쿼리를 반환합니다."""
+        records = [record for record in self.recent() if record["error"] is None]
+        return sorted(records, key=lambda record: record["total_time"], reverse=True)[:limit]
+
+    def reset(self):
+        """모든 기록을 삭제합니다."""
+        with self._lock:
+            self._templates.clear()
+            self._recent.clear()
+            self._pages.clear()
+            self._page_counts.clear()
+
+    def register_collector(self, collector: Callable[[], list[str]]):
+        """Prometheus 출력에 추가할 메트릭 줄을 만드는 콜백을 등록합니다 (중복 등록 무시)."""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render_prometheus(self) -> str:
+        """통계를 Prometheus 텍스트 노출 형식(0.0.4)으로 반환합니다."""
+        lines = [
+            "# HELP threelacha_query_duration_seconds Query latency by template and phase",
+            "# TYPE threelacha_query_duration_seconds summary",
+        ]
+        summary = self.template_summary()
+        with self._lock:
+            totals = {
+                (stats.connection_type, stats.template_id): (dict(stats.sums), stats.count, stats.row_sum)
+                for stats in self._templates.values()
+            }
+            collectors = list(self._collectors)
+
+        for row in summary:
+            sums, count, _ = totals.get((row["connection_type"], row["template_id"]), ({}, 0, 0))
+            labels = {
+                "backend": row["connection_type"],
+                "template": row["template_id"],
+                "table": row["label"],
+            }
+            for phase in PHASES:
+                phase_labels = {**labels, "phase": phase}
+                for point in PERCENTILES:
+                    value = row.get(f"{phase}_p{point}")
+                    if value is not None:
+                        lines.append(format_metric(
+                            "threelacha_query_duration_seconds",
+                            value,
+                            {**phase_labels, "quantile": str(point / 100)},
+                        ))
+                lines.append(format_metric(
+                    "threelacha_query_duration_seconds_sum", sums.get(phase, 0.0), phase_labels
+                ))
+                lines.append(format_metric(
+                    "threelacha_query_duration_seconds_count", count, phase_labels
+                ))
+
+        lines += [
+            "# HELP threelacha_query_rows_total Rows returned by template",
+            "# TYPE threelacha_query_rows_total counter",
+        ]
+        for row in summary:
+            _, _, row_sum = totals.get((row["connection_type"], row["template_id"]), ({}, 0, 0))
+            lines.append(format_metric(
+                "threelacha_query_rows_total",
+                row_sum,
+                {"backend": row["connection_type"], "template": row["template_id"], "table": row["label"]},
+            ))
+
+        lines += [
+            "# HELP threelacha_query_scanned_bytes_total Bytes scanned by template (Athena)",
+            "# TYPE threelacha_query_scanned_bytes_total counter",
+        ]
+        for row in summary:
+            if row["scanned_mean"] is None:
+                continue
+            lines.append(format_metric(
+                "threelacha_query_scanned_bytes_total",
+                row["scanned_total"],
+                {"backend": row["connection_type"], "template": row["template_id"], "table": row["label"]},
+            ))
+
+        lines += [
+            "# HELP threelacha_query_errors_total Failed queries by template and kind",
+            "# TYPE threelacha_query_errors_total counter",
+        ]
+        for row in summary:
+            labels = {"backend": row["connection_type"], "template": row["template_id"], "table": row["label"]}
+            lines.append(format_metric(
+                "threelacha_query_errors_total", row["errors"] - row["timeouts"], {**labels, "kind": "error"}
+            ))
+            lines.append(format_metric(
+                "threelacha_query_errors_total", row["timeouts"], {**labels, "kind": "timeout"}
+            ))
+
+        lines += [
+            "# HELP threelacha_page_render_seconds Streamlit script run time by page",
+            "# TYPE threelacha_page_render_seconds summary",
+        ]
+        for row in self.page_summary():
+            for point in PERCENTILES:
+                lines.append(format_metric(
+                    "threelacha_page_render_seconds",
+                    row[f"p{point}"],
+                    {"page": row["page"], "quantile": str(point / 100)},
+                ))
+            lines.append(format_metric(
+                "threelacha_page_render_seconds_count", row["count"], {"page": row["page"]}
+            ))
+
+        for collector in collectors:
+            try:
+                lines.extend(collector())
+            except Exception as e:
+                logger.warning(f"메트릭 수집기 오류: {e!s}")
+
+        return "\n".join(lines) + "\n"
+
+
+def format_metric(name: str, value: float, labels: Optional[dict] = None) -> str:
+    """Prometheus 텍스트 형식의 메트릭 한 줄을 만듭니다."""
+    if not labels:
+        return f"{name} {value}"
+
+    def escape(text: str) -> str:
+        return str(text).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    label_text = ",".join(f'{key}="{escape(val)}"' for key, val in labels.items())
+    return f"{name}{{{label_text}}} {value}"
+
+
+# 프로세스 전역 쿼리 텔레메트리
+telemetry = QueryTelemetry(
+    max_samples=int(os.getenv("TELEMETRY_MAX_SAMPLES", "512")),
+    max_recent=int(os.getenv("TELEMETRY_MAX_RECENT", "1000")),
+)
+
+
+_metrics_server: Optional[ThreadingHTTPServer] = None
+_metrics_server_lock = threading.Lock()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """/metrics 요청에 Prometheus 텍스트를 응답하는 핸들러"""
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+
+        body = telemetry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"metrics 요청: {format % args}")
+
+
+def start_metrics_server(
+    port: Optional[int] = None, host: Optional[str] = None
+) -> Optional[int]:
+    """Prometheus 메트릭 HTTP 서버를 데몬 스레드로 시작합니다 (프로세스당 한 번).
+
+    /metrics는 인증 없이 테이블 이름과 쿼리 미리보기를 노출하므로 기본적으로
+    루프백에만 바인딩합니다. 컨테이너에서는 METRICS_HOST=0.0.0.0으로 열고
+    호스트에서는 루프백/사설망에만 포트를 게시하세요.
+
+    Args:
+        port: 포트 번호 (기본값: METRICS_PORT 환경 변수, 없거나 0이면 시작하지 않음)
+        host: 바인딩할 주소 (기본값: METRICS_HOST 환경 변수, 없으면 127.0.0.1)
+
+    Returns:
+        Optional[int]: 서버가 실행 중인 포트 (시작하지 않았으면 None)
+    """
+    global _metrics_server
+    if _metrics_server is not None:
+        return _metrics_server.server_address[1]
+
+    port = port if port is not None else int(os.getenv("METRICS_PORT", "0"))
+    if not port:
+        return None
+    host = host or os.getenv("METRICS_HOST", "127.0.0.1")
+
+    with _metrics_server_lock:
+        if _metrics_server is None:
+            try:
+                server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as e:
+                logger.warning(f"메트릭 서버 시작 실패 (port={port}): {e!s}")
+                return None
+            server.daemon_threads = True
+            threading.Thread(
+                target=server.serve_forever, name="metrics-server", daemon=True
+            ).start()
+            _metrics_server = server
+            logger.info(f"메트릭 서버 시작: http://{host}:{server.server_address[1]}/metrics")
+
+    return _metrics_server.server_address[1]
@@ -0,0 +1,52 @@
+"""합성 gold 마트 픽스처 생성 스크립트
+
+DB_CONNECTION=fixture로 앱을 실행하거나 벤치마크에 사용할 마트 파일을 생성합니다.
+레포의 fixtures/marts는 기본 인자로 생성한 것입니다.
+
+실행:
+    # 기본 규모 (지역 32 x 품목 24 x 3일)
+    uv run python -m scripts.generate_fixture_marts
+
+    # 대규모 벤치마크용
+    uv run python -m scripts.generate_fixture_marts --regions 200 --items 300 --days 90 \\
+        --format parquet --output .cache/fixtures/large
+"""
+
+import argparse
+from datetime import date
+
+from data.logger import setup_logger
+from data.synthetic_marts import generate_marts, write_marts
+
+logger = setup_logger("generate_fixture_marts")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 gold 마트 픽스처 생성")
+    parser.add_argument("--regions", type=int, default=32, help="지역 수")
+    parser.add_argument("--items", type=int, default=24, help="품목(품종) 수")
+    parser.add_argument("--days", type=int, default=3, help="일자별 마트에 포함할 일수")
+    parser.add_argument(
+        "--latest-date",
+        type=date.fromisoformat,
+        default=None,
+        help="최신 데이터 일자 YYYY-MM-DD (기본값: 오늘)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--output", default="fixtures/marts", help="저장할 디렉토리")
+    args = parser.parse_args()
+
+    marts = generate_marts(
+        regions=args.regions,
+        items=args.items,
+        days=args.days,
+        latest_date=args.latest_date,
+        seed=args.seed,
+    )
+    for path in write_marts(marts, args.output, args.format):
+        logger.info(f"생성: {path} ({len(marts[path.stem])}행)")
+
+
+if __name__ == "__main__":
+    main()
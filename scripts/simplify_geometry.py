@@ -0,0 +1,484 @@
+"""권역 지도 geometry를 확대 수준별로 단순화하는 스크립트
+
+assets/retail_regions.json의 원본 폴리곤을 지도 확대 수준(zoom)마다 미리 단순화하여
+assets/geometry/retail_regions.z{zoom}.geojson으로 저장합니다. components/choropleth.py는
+지도의 최대 확대 수준에 맞는 파일을 골라 사용합니다.
+
+인접한 권역이 같은 경계를 공유하므로, 링을 여러 권역이 만나는 지점(junction)에서 잘라
+공유 경계(arc)를 한 번씩만 단순화합니다 (TopoJSON과 같은 방식). 따라서 단순화 후에도
+이웃 권역 사이에 틈이나 겹침이 생기지 않습니다. 단순화는 해당 zoom의 Web Mercator
+픽셀 좌표에서 Douglas-Peucker로 수행하고, 좌표는 1/4 픽셀 단위로 반올림합니다.
+
+단순화 결과는 원본과 함께 같은 zoom의 픽셀 격자에 래스터화하여 비교하고(visual diff),
+권역 경계가 평균 --max-shift 픽셀보다 많이 어긋난 권역이 있으면 실패합니다.
+
+실행:
+    # 확대 수준별 GeoJSON 생성 + 크기/정점 수 보고 + visual diff 검사
+    uv run python -m scripts.simplify_geometry
+
+    # TopoJSON(양자화 좌표)도 함께 생성하고, 차이 이미지를 저장
+    uv run python -m scripts.simplify_geometry --topojson --diff-dir /tmp/geometry_diff
+"""
+
+import argparse
+import json
+import math
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image, ImageChops, ImageDraw
+
+from components.choropleth import LOD_ZOOMS, REGION_GEOJSON, lod_path
+from data.logger import setup_logger
+
+logger = setup_logger("simplify_geometry")
+
+# Douglas-Peucker 허용 오차 (해당 zoom의 픽셀 단위)
+TOLERANCE_PX = 0.5
+
+# 좌표 반올림/양자화 단위 (해당 zoom의 픽셀 단위)
+QUANTUM_PX = 0.25
+
+# visual diff 허용 기준: 권역별 평균 경계 이동 (어긋난 픽셀 수 / 경계 길이, 픽셀 단위)
+MAX_SHIFT_PX = 0.5
+
+TILE_SIZE = 256
+
+
+def project(point: tuple, zoom: int) -> tuple:
+    """경위도를 zoom 수준의 Web Mercator 픽셀 좌표로 변환합니다."""
+    lon, lat = point[0], point[1]
+    scale = TILE_SIZE * 2**zoom
+    x = (lon + 180.0) / 360.0 * scale
+    sin_lat = math.sin(math.radians(lat))
+    y = (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * scale
+    return x, y
+
+
+def coordinate_decimals(zoom: int) -> int:
+    """zoom 수준에서 QUANTUM_PX 픽셀보다 작은 경도 단위가 되는 소수점 자릿수"""
+    quantum = 360.0 / (TILE_SIZE * 2**zoom) * QUANTUM_PX
+    return max(0, math.ceil(-math.log10(quantum)))
+
+
+def feature_rings(feature: dict) -> list[list]:
+    """Feature의 폴리곤 목록을 링 목록(폴리곤별 [외곽, 구멍...])으로 반환합니다."""
+    geometry = feature["geometry"]
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    raise ValueError(f"지원하지 않는 geometry 유형: {geometry['type']}")
+
+
+def _open_ring(ring: list) -> list[tuple]:
+    """닫힌 링을 마지막 중복 점이 없는 튜플 목록으로 변환합니다."""
+    points = [tuple(point[:2]) for point in ring]
+    if len(points) > 1 and points[0] == points[-1]:
+        points = points[:-1]
+    return points
+
+
+class Topology:
+    """권역 링을 공유 경계(arc) 단위로 분해한 구조
+
+    arcs: 고유 arc 목록 (점 튜플 목록, 양 끝점 포함)
+    polygons: feature별 폴리곤 목록, 폴리곤은 링 목록, 링은 arc 참조 목록
+        (참조가 음수 ~i이면 arcs[i]를 거꾸로 사용)
+    """
+
+    def __init__(self, features: list[dict]):
+        self.arcs: list[list[tuple]] = []
+        self._arc_index: dict[tuple, int] = {}
+        rings = [
+            [[_open_ring(ring) for ring in polygon] for polygon in feature_rings(feature)]
+            for feature in features
+        ]
+        self.junctions = self._find_junctions(
+            ring for polygons in rings for polygon in polygons for ring in polygon
+        )
+        self.polygons = [
+            [[self._cut_ring(ring) for ring in polygon] for polygon in polygons]
+            for polygons in rings
+        ]
+
+    @staticmethod
+    def _find_junctions(rings) -> set[tuple]:
+        """링마다 이웃 점이 다르게 나타나는 점(경계가 갈라지는 지점)을 찾습니다."""
+        neighbors = {}
+        junctions = set()
+        for ring in rings:
+            n = len(ring)
+            for i, point in enumerate(ring):
+                pair = frozenset((ring[i - 1], ring[(i + 1) % n]))
+                seen = neighbors.setdefault(point, pair)
+                if seen != pair:
+                    junctions.add(point)
+        return junctions
+
+    def _add_arc(self, points: list[tuple]) -> int:
+        """arc를 등록하고 참조를 반환합니다 (이미 있으면 기존 arc, 역방향이면 ~index)."""
+        key = tuple(points)
+        if key in self._arc_index:
+            return self._arc_index[key]
+        reverse_key = key[::-1]
+        if reverse_key in self._arc_index:
+            return ~self._arc_index[reverse_key]
+        self._arc_index[key] = len(self.arcs)
+        self.arcs.append(points)
+        return len(self.arcs) - 1
+
+    def _cut_ring(self, ring: list[tuple]) -> list[int]:
+        """링을 junction에서 잘라 arc 참조 목록으로 변환합니다."""
+        cuts = [i for i, point in enumerate(ring) if point in self.junctions]
+        if not cuts:
+            # 다른 링과 경계가 갈라지지 않는 링은 통째로 하나의 닫힌 arc
+            # (같은 링을 공유하는 권역끼리 같은 arc가 되도록 가장 작은 점에서 시작)
+            start = ring.index(min(ring))
+            rotated = ring[start:] + ring[:start]
+            return [self._add_arc(rotated + [rotated[0]])]
+
+        rotated = ring[cuts[0]:] + ring[:cuts[0]]
+        offsets = [i - cuts[0] for i in cuts] + [len(ring)]
+        closed = rotated + [rotated[0]]
+        return [
+            self._add_arc(closed[offsets[k]:offsets[k + 1] + 1])
+            for k in range(len(offsets) - 1)
+        ]
+
+    def vertex_count(self) -> int:
+        """원본 링 기준 정점 수 (닫는 점 포함)"""
+        return sum(
+            len(self.ring_points(ring, self.arcs))
+            for polygons in self.polygons for polygon in polygons for ring in polygon
+        )
+
+    @staticmethod
+    def ring_points(ring: list[int], arcs: list[list]) -> list:
+        """arc 참조 목록을 닫힌 링 좌표로 조립합니다."""
+        points = []
+        for ref in ring:
+            arc = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+            points.extend(arc if not points else arc[1:])
+        return points
+
+
+def _segment_distance(point: tuple, start: tuple, end: tuple) -> float:
+    """점과 선분 사이의 거리 (선분 길이가 0이면 점 사이 거리)"""
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return math.hypot(point[0] - start[0], point[1] - start[1])
+    t = max(0.0, min(1.0, ((point[0] - start[0]) * dx + (point[1] - start[1]) * dy) / length_sq))
+    return math.hypot(point[0] - start[0] - t * dx, point[1] - start[1] - t * dy)
+
+
+def douglas_peucker(points: list[tuple], tolerance: float, min_points: int = 2) -> list[int]:
+    """Douglas-Peucker로 남길 점의 인덱스를 반환합니다 (양 끝점은 항상 유지).
+
+    Args:
+        points: 투영 좌표 목록
+        tolerance: 허용 오차 (투영 좌표 단위)
+        min_points: 최소로 남길 점 수 (허용 오차 안이어도 가장 먼 점부터 추가)
+
+    Returns:
+        list[int]: 남길 점의 인덱스 (오름차순)
+    """
+    last = len(points) - 1
+    keep = {0, last}
+    # (최대 거리, 구간 시작, 구간 끝, 가장 먼 점) 중 허용 오차를 넘는 구간을 계속 분할
+    pending = []
+    stack = [(0, last)]
+    while stack or (len(keep) < min_points and pending):
+        while stack:
+            first, end = stack.pop()
+            best, best_distance = None, -1.0
+            for i in range(first + 1, end):
+                distance = _segment_distance(points[i], points[first], points[end])
+                if distance > best_distance:
+                    best, best_distance = i, distance
+            if best is None:
+                continue
+            if best_distance > tolerance:
+                keep.add(best)
+                stack.append((first, best))
+                stack.append((best, end))
+            else:
+                pending.append((best_distance, first, end, best))
+        if len(keep) < min_points and pending:
+            # 닫힌 arc가 선분/점으로 줄어들지 않도록 허용 오차 안의 점도 추가
+            pending.sort()
+            _, first, end, best = pending.pop()
+            keep.add(best)
+            stack.append((first, best))
+            stack.append((best, end))
+    return sorted(keep)
+
+
+def simplify_arcs(topology: Topology, zoom: int) -> list[list[tuple]]:
+    """모든 arc를 zoom 수준에서 단순화하고 좌표를 반올림합니다.
+
+    공유 경계는 arc 단위로 한 번만 단순화되므로 이웃 권역이 같은 결과를 사용합니다.
+    단순화 후 서로 다른 점이 3개 미만이 되는 링은 그 링의 arc에 점을 더 남겨 다시
+    단순화합니다 (반올림 후에도 면적이 없는 링은 visible_rings에서 제외).
+    """
+    decimals = coordinate_decimals(zoom)
+    tolerance = TOLERANCE_PX
+    min_points = [4 if arc[0] == arc[-1] else 2 for arc in topology.arcs]
+    projected = [[project(point, zoom) for point in arc] for arc in topology.arcs]
+
+    def simplify(index: int) -> list[tuple]:
+        kept = douglas_peucker(projected[index], tolerance, min_points[index])
+        arc = topology.arcs[index]
+        rounded = [(round(arc[i][0], decimals), round(arc[i][1], decimals)) for i in kept]
+        return [point for i, point in enumerate(rounded) if i == 0 or point != rounded[i - 1]]
+
+    arcs = [simplify(i) for i in range(len(topology.arcs))]
+    for _ in range(3):
+        degenerate = [
+            ring
+            for polygons in topology.polygons for polygon in polygons for ring in polygon
+            if len(set(Topology.ring_points(ring, arcs))) < 3
+        ]
+        if not degenerate:
+            break
+        for ring in degenerate:
+            for ref in ring:
+                index = ref if ref >= 0 else ~ref
+                min_points[index] = min(min_points[index] + 1, len(topology.arcs[index]))
+                arcs[index] = simplify(index)
+    return arcs
+
+
+def visible_rings(polygon: list[list[int]], arcs: list[list[tuple]]) -> list[list[int]]:
+    """단순화 후에도 면적이 남는 링(서로 다른 점 3개 이상)만 반환합니다.
+
+    원본에는 같은 두 점을 오가는 폭 0인 링도 있어, 반올림하면 선분으로 줄어듭니다.
+    """
+    return [ring for ring in polygon if len(set(Topology.ring_points(ring, arcs))) >= 3]
+
+
+def to_geojson(source: dict, topology: Topology, arcs: list[list[tuple]]) -> dict:
+    """단순화한 arc로 원본과 같은 속성의 GeoJSON FeatureCollection을 조립합니다."""
+    features = []
+    for feature, polygons in zip(source["features"], topology.polygons):
+        coordinates = [
+            [
+                [list(point) for point in Topology.ring_points(ring, arcs)]
+                for ring in visible_rings(polygon, arcs)
+            ]
+            for polygon in polygons
+        ]
+        geometry = (
+            {"type": "Polygon", "coordinates": coordinates[0]}
+            if feature["geometry"]["type"] == "Polygon"
+            else {"type": "MultiPolygon", "coordinates": coordinates}
+        )
+        features.append({
+            "type": "Feature",
+            "properties": feature["properties"],
+            "geometry": geometry,
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+
+def to_topojson(source: dict, topology: Topology, arcs: list[list[tuple]], zoom: int) -> dict:
+    """단순화한 arc를 양자화/델타 인코딩한 TopoJSON Topology를 생성합니다."""
+    quantum = 10.0 ** -coordinate_decimals(zoom)
+    x0 = min(point[0] for arc in arcs for point in arc)
+    y0 = min(point[1] for arc in arcs for point in arc)
+
+    encoded = []
+    for arc in arcs:
+        previous = (0, 0)
+        deltas = []
+        for x, y in arc:
+            quantized = (round((x - x0) / quantum), round((y - y0) / quantum))
+            if deltas and quantized == previous:
+                continue
+            deltas.append([quantized[0] - previous[0], quantized[1] - previous[1]])
+            previous = quantized
+        if len(deltas) == 1:
+            # 양 끝점이 같은 칸으로 양자화된 arc도 점 2개로 유지
+            deltas.append([0, 0])
+        encoded.append(deltas)
+
+    geometries = []
+    for feature, polygons in zip(source["features"], topology.polygons):
+        polygons = [visible_rings(polygon, arcs) for polygon in polygons]
+        if feature["geometry"]["type"] == "Polygon":
+            geometry = {"type": "Polygon", "arcs": polygons[0]}
+        else:
+            geometry = {"type": "MultiPolygon", "arcs": polygons}
+        geometry["properties"] = feature["properties"]
+        geometries.append(geometry)
+
+    return {
+        "type": "Topology",
+        "transform": {"scale": [quantum, quantum], "translate": [x0, y0]},
+        "objects": {"regions": {"type": "GeometryCollection", "geometries": geometries}},
+        "arcs": encoded,
+    }
+
+
+def rasterize(geojson: dict, zoom: int, origin: tuple, size: tuple) -> list[Image.Image]:
+    """권역별 폴리곤을 zoom 수준의 픽셀 격자에 그린 마스크 목록을 반환합니다.
+
+    Leaflet과 같은 even-odd 규칙으로 채웁니다 (원본 데이터에는 섬이 외곽 링 뒤의
+    추가 링으로 들어 있어, 링 순서와 관계없이 링끼리 XOR해야 화면과 같아짐).
+    """
+    masks = []
+    for feature in geojson["features"]:
+        mask = Image.new("1", size, 0)
+        for polygon in feature_rings(feature):
+            for ring in polygon:
+                ring_mask = Image.new("1", size, 0)
+                pixels = [
+                    (x - origin[0], y - origin[1])
+                    for x, y in (project(point, zoom) for point in ring)
+                ]
+                ImageDraw.Draw(ring_mask).polygon(pixels, fill=255)
+                mask = ImageChops.logical_xor(mask, ring_mask)
+        masks.append(mask)
+    return masks
+
+
+def _pixel_count(mask: Image.Image) -> int:
+    """마스크에서 채워진 픽셀 수"""
+    return sum(mask.histogram()[1:])
+
+
+def visual_diff(
+    source: dict, simplified: dict, zoom: int, diff_path: Optional[Path] = None
+) -> dict[str, float]:
+    """원본과 단순화 결과를 같은 zoom으로 래스터화하여 권역별 평균 경계 이동을 계산합니다.
+
+    어긋난 픽셀 수를 원본 경계 길이(픽셀)로 나눈 값은 경계가 평균 몇 픽셀 움직였는지를
+    나타냅니다. 면적 대비 비율과 달리 작은 도시 권역도 큰 권역과 같은 기준으로 비교됩니다.
+
+    Args:
+        source: 원본 GeoJSON
+        simplified: 단순화한 GeoJSON
+        zoom: 비교할 확대 수준 (지도에서 이 LOD를 쓰는 최대 zoom)
+        diff_path: 차이 이미지 저장 경로 (회색: 일치, 빨강: 사라진 영역, 파랑: 추가된 영역)
+
+    Returns:
+        dict[str, float]: 권역 이름별 평균 경계 이동 (픽셀)
+    """
+    projected = [
+        project(point, zoom)
+        for feature in source["features"]
+        for polygon in feature_rings(feature) for ring in polygon for point in ring
+    ]
+    origin = (
+        math.floor(min(x for x, _ in projected)) - 1,
+        math.floor(min(y for _, y in projected)) - 1,
+    )
+    size = (
+        math.ceil(max(x for x, _ in projected)) - origin[0] + 2,
+        math.ceil(max(y for _, y in projected)) - origin[1] + 2,
+    )
+
+    original_masks = rasterize(source, zoom, origin, size)
+    simplified_masks = rasterize(simplified, zoom, origin, size)
+
+    shifts = {}
+    for feature, original, result in zip(source["features"], original_masks, simplified_masks):
+        perimeter = sum(
+            math.dist(project(start, zoom), project(end, zoom))
+            for polygon in feature_rings(feature) for ring in polygon
+            for start, end in zip(ring, ring[1:])
+        )
+        mismatch = _pixel_count(ImageChops.logical_xor(original, result))
+        shifts[feature["properties"]["CITY_AB_NM"]] = mismatch / perimeter if perimeter else 0.0
+
+    if diff_path:
+        original_all = Image.new("1", size, 0)
+        result_all = Image.new("1", size, 0)
+        for original, result in zip(original_masks, simplified_masks):
+            original_all = ImageChops.logical_or(original_all, original)
+            result_all = ImageChops.logical_or(result_all, result)
+        original_all, result_all = original_all.convert("L"), result_all.convert("L")
+        image = Image.new("RGB", size, "white")
+        image.paste((200, 200, 200), mask=ImageChops.darker(original_all, result_all))
+        image.paste((220, 30, 30), mask=ImageChops.subtract(original_all, result_all))
+        image.paste((30, 60, 220), mask=ImageChops.subtract(result_all, original_all))
+        diff_path.parent.mkdir(parents=True, exist_ok=True)
+        image.save(diff_path)
+        logger.info(f"차이 이미지 저장: {diff_path}")
+    return shifts
+
+
+def _dumps(data: dict) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="권역 지도 geometry 확대 수준별 단순화")
+    parser.add_argument("--topojson", action="store_true", help="TopoJSON(양자화 좌표)도 함께 생성")
+    parser.add_argument("--diff-dir", type=Path, help="visual diff 이미지를 저장할 디렉토리")
+    parser.add_argument(
+        "--max-shift",
+        type=float,
+        default=MAX_SHIFT_PX,
+        help=f"권역별 허용 평균 경계 이동, 픽셀 (기본값: {MAX_SHIFT_PX})",
+    )
+    args = parser.parse_args()
+
+    source_text = REGION_GEOJSON.read_text(encoding="utf-8")
+    source = json.loads(source_text)
+    topology = Topology(source["features"])
+    source_vertices = topology.vertex_count()
+    source_bytes = len(source_text.encode("utf-8"))
+    logger.info(
+        f"원본: 정점 {source_vertices:,}개, {source_bytes / 1024:,.0f} KB "
+        f"(공유 경계 arc {len(topology.arcs):,}개)"
+    )
+
+    failed = []
+    for zoom in LOD_ZOOMS:
+        arcs = simplify_arcs(topology, zoom)
+        simplified = to_geojson(source, topology, arcs)
+        vertices = sum(
+            len(ring) for feature in simplified["features"]
+            for polygon in feature_rings(feature) for ring in polygon
+        )
+
+        path = lod_path(zoom)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = _dumps(simplified)
+        path.write_text(text + "\n", encoding="utf-8")
+        size = len(text.encode("utf-8"))
+        message = (
+            f"z{zoom}: 정점 {source_vertices:,} -> {vertices:,}개 "
+            f"({vertices / source_vertices:.1%}), "
+            f"GeoJSON {source_bytes / 1024:,.0f} -> {size / 1024:,.0f} KB ({size / source_bytes:.1%})"
+        )
+
+        if args.topojson:
+            topo_path = path.with_suffix(".topojson")
+            topo_text = _dumps(to_topojson(source, topology, arcs, zoom))
+            topo_path.write_text(topo_text + "\n", encoding="utf-8")
+            topo_size = len(topo_text.encode("utf-8"))
+            message += f", TopoJSON {topo_size / 1024:,.0f} KB ({topo_size / source_bytes:.1%})"
+
+        diff_path = args.diff_dir / f"retail_regions.z{zoom}.png" if args.diff_dir else None
+        shifts = visual_diff(source, simplified, zoom, diff_path)
+        worst = max(shifts, key=shifts.get)
+        message += f", 경계 이동 최대 {shifts[worst]:.2f}px ({worst})"
+        logger.info(message)
+
+        over = {name: shift for name, shift in shifts.items() if shift > args.max_shift}
+        if over:
+            failed.append(zoom)
+            logger.error(
+                f"z{zoom}: 경계 이동이 기준({args.max_shift}px)을 넘는 권역: "
+                + ", ".join(f"{name} {shift:.2f}px" for name, shift in over.items())
+            )
+
+    if failed:
+        raise SystemExit(f"visual diff 검사 실패: {', '.join(f'z{zoom}' for zoom in failed)}")
+
+
+if __name__ == "__main__":
+    main()
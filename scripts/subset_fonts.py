@@ -0,0 +1,180 @@
+"""대시보드 한글 폰트를 WOFF2 서브셋으로 만드는 스크립트
+
+화면에 쓰이는 글자는 소스 코드(app.py, components/*.py, styles.css)의 문구와
+마트의 품목/품종/지역/카테고리 이름뿐입니다. 폰트마다 이 글자만 담은 서브셋과
+나머지 글자를 담은 보조 파일을 WOFF2로 만들고, 서브셋의 unicode-range와 함께
+static/fonts/subsets.json에 기록합니다. components/page_style.py는 이 매니페스트가
+있으면 원본 TTF/OTF 대신 서브셋을 사용하며, 서브셋에 없는 글자가 화면에 나올 때만
+브라우저가 보조 파일을 내려받습니다.
+
+fonttools가 필요합니다 (uv sync --extra fonts).
+
+실행:
+    # 운영 마트 이름까지 포함하여 생성
+    uv run python -m scripts.subset_fonts --source athena
+
+    # 마트 조회 없이 소스 코드 문구만으로 생성
+    uv run python -m scripts.subset_fonts --no-marts
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from components.page_style import FONT_DIR, FONT_FACES, SUBSET_MANIFEST
+from data.connection import get_database_connection
+from data.logger import setup_logger
+from data.queries.meta_queries import get_distinct_text_query
+
+logger = setup_logger("subset_fonts")
+
+BASE_PATH = Path(__file__).resolve().parent.parent
+
+# 화면 문구를 찾을 소스 파일
+SOURCE_PATTERNS = ("app.py", "components/*.py", "styles.css")
+
+# 화면에 표시되는 마트 문자열 컬럼
+TEXT_COLUMNS = {
+    "mart_price_drop_top3": ["country_nm", "item_nm", "kind_nm", "product_cls_unit"],
+    "mart_price_rise_top3": ["country_nm", "item_nm", "kind_nm", "product_cls_unit"],
+    "mart_price_region_count": ["country_nm"],
+    "mart_season_region_product": [
+        "category_nm", "item_nm", "kind_nm", "product_cls_unit", "country_nm", "season",
+    ],
+    "mart_retail_channel_comparison": ["category_nm", "item_nm", "kind_nm", "channel_type"],
+    "mart_retail_region_comparison": ["category_nm", "item_nm", "kind_nm", "country_nm"],
+    "mart_eco_price_statistics_by_category": ["item_nm", "market_category"],
+}
+
+# 항상 포함할 글자 (출력 가능한 ASCII: 숫자, 영문, 기호)
+BASE_CODEPOINTS = set(range(0x20, 0x7F))
+
+
+def _import_subset():
+    """fontTools.subset을 지연 import합니다 (설치되어 있지 않으면 안내 메시지와 함께 실패)."""
+    try:
+        from fontTools import subset
+    except ImportError as e:
+        raise ImportError(
+            "폰트 서브셋 생성에는 fonttools가 필요합니다. 'uv sync --extra fonts'로 설치하세요."
+        ) from e
+    return subset
+
+
+def collect_source_codepoints() -> set[int]:
+    """소스 파일에 등장하는 모든 글자의 코드 포인트를 반환합니다."""
+    codepoints = set()
+    for pattern in SOURCE_PATTERNS:
+        for path in sorted(BASE_PATH.glob(pattern)):
+            codepoints.update(ord(char) for char in path.read_text(encoding="utf-8"))
+    return codepoints
+
+
+def collect_mart_codepoints(source: str) -> set[int]:
+    """마트 문자열 컬럼의 고유 값에 등장하는 글자의 코드 포인트를 반환합니다."""
+    conn = get_database_connection(source)
+    df = conn.execute_query(get_distinct_text_query(TEXT_COLUMNS, conn=conn))
+    values = df["text_value"].dropna().astype(str)
+    logger.info(f"마트 문자열 {len(values):,}개 수집 ({source})")
+    return {ord(char) for value in values for char in value}
+
+
+def unicode_range(codepoints: set[int]) -> str:
+    """코드 포인트 집합을 CSS unicode-range 값으로 변환합니다 (연속 구간은 하나로 합침)."""
+    ranges = []
+    for codepoint in sorted(codepoints):
+        if ranges and codepoint == ranges[-1][1] + 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+    return ", ".join(
+        f"U+{start:X}" if start == end else f"U+{start:X}-{end:X}" for start, end in ranges
+    )
+
+
+def write_subset(path: Path, codepoints: set[int], output: Path):
+    """폰트에서 codepoints 글자만 남긴 WOFF2 파일을 생성합니다."""
+    subset = _import_subset()
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+
+    font = subset.load_font(str(path), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    subset.save_font(font, str(output), options)
+
+
+def subset_font(path: Path, needed: set[int]) -> dict:
+    """폰트 하나를 필요한 글자 서브셋과 나머지 글자 보조 파일로 나눕니다.
+
+    보조 파일은 unicode-range 없이 선언되므로 (서브셋보다 나중에 확인됨) 파일 이름만 기록합니다.
+
+    Returns:
+        dict: subset(file, unicode_range)과 rest(file) 항목 (매니페스트 항목)
+    """
+    from fontTools.ttLib import TTFont
+
+    with TTFont(str(path), lazy=True) as font:
+        supported = set(font.getBestCmap())
+
+    parts = {"subset": supported & needed, "rest": supported - needed}
+    entry = {}
+    for part, codepoints in parts.items():
+        if not codepoints:
+            continue
+        # 같은 이름의 TTF/OTF가 함께 있으므로 원본 확장자를 파일 이름에 남김
+        output = path.with_name(f"{path.stem}-{path.suffix.lstrip('.')}.{part}.woff2")
+        write_subset(path, codepoints, output)
+        entry[part] = {"file": output.name}
+        if part == "subset":
+            entry[part]["unicode_range"] = unicode_range(codepoints)
+
+    subset_size = (path.parent / entry["subset"]["file"]).stat().st_size if "subset" in entry else 0
+    logger.info(
+        f"{path.name}: {path.stat().st_size / 1024:,.0f} KB -> 서브셋 {subset_size / 1024:,.0f} KB "
+        f"({len(parts['subset']):,}자, 나머지 {len(parts['rest']):,}자는 필요할 때만 로드)"
+    )
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 폰트 WOFF2 서브셋 생성")
+    parser.add_argument(
+        "--source",
+        choices=["athena", "rds", "local", "fixture"],
+        default=os.getenv("DB_CONNECTION", "athena"),
+        help="마트 이름을 조회할 데이터베이스 (기본값: DB_CONNECTION)",
+    )
+    parser.add_argument("--no-marts", action="store_true", help="마트 이름을 조회하지 않음")
+    args = parser.parse_args()
+
+    load_dotenv()
+    _import_subset()
+    needed = BASE_CODEPOINTS | collect_source_codepoints()
+    if not args.no_marts:
+        needed |= collect_mart_codepoints(args.source)
+    logger.info(f"필요한 글자: {len(needed):,}자")
+
+    manifest = {}
+    for filename in dict.fromkeys(filename for _, filename, _ in FONT_FACES):
+        path = FONT_DIR / filename
+        if not path.exists():
+            logger.warning(f"폰트 파일 없음, 건너뜀: {filename}")
+            continue
+        manifest[filename] = subset_font(path, needed)
+
+    SUBSET_MANIFEST.write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+    logger.info(f"서브셋 매니페스트 저장: {SUBSET_MANIFEST}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""gold 마트를 로컬 DuckDB 파일로 동기화하는 스크립트
+
+mart_update_status.latest_date가 바뀌었을 때만 전체 마트를 다시 복제합니다.
+DB_CONNECTION=local로 실행 중인 대시보드는 파일이 교체되면 자동으로 새 파일을 엽니다.
+
+실행:
+    # 한 번 동기화
+    uv run python -m scripts.sync_local_marts --source athena
+
+    # 10분마다 버전을 확인하며 계속 동기화
+    uv run python -m scripts.sync_local_marts --source athena --watch 600
+"""
+
+import argparse
+import time
+
+from dotenv import load_dotenv
+
+from data.connection import get_database_connection
+from data.local_connection import sync_local_marts
+from data.logger import setup_logger
+
+logger = setup_logger("sync_local_marts")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="gold 마트를 로컬 DuckDB 파일로 동기화")
+    parser.add_argument(
+        "--source", choices=["athena", "rds"], default="athena", help="원본 데이터베이스"
+    )
+    parser.add_argument("--path", default=None, help="DuckDB 파일 경로 (기본값: LOCAL_DB_PATH)")
+    parser.add_argument("--schema", default=None, help="로컬 스키마 이름 (기본값: LOCAL_DB_SCHEMA)")
+    parser.add_argument("--force", action="store_true", help="버전이 같아도 다시 복제")
+    parser.add_argument(
+        "--watch", type=float, default=0, help="지정한 초마다 반복 실행 (0이면 한 번만)"
+    )
+    args = parser.parse_args()
+
+    load_dotenv()
+    source = get_database_connection(args.source)
+
+    force = args.force
+    while True:
+        try:
+            sync_local_marts(source, path=args.path, schema=args.schema, force=force)
+            force = False
+        except Exception as e:
+            if not args.watch:
+                raise
+            logger.error(f"로컬 마트 동기화 실패: {e!s}", exc_info=True)
+
+        if not args.watch:
+            break
+        time.sleep(args.watch)
+
+
+if __name__ == "__main__":
+    main()
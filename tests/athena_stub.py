@@ -0,0 +1,75 @@
+"""테스트용 Athena 클라이언트 대역
+
+start_query_execution 호출 인자를 기록하고, 모든 쿼리를 바로 SUCCEEDED로 끝낸 뒤
+get_query_results로 쿼리 문자열에 맞는 결과를 돌려줍니다.
+"""
+
+import itertools
+import threading
+from typing import Callable
+
+from data.athena_connection import AthenaConnection
+
+# 쿼리 문자열 -> (컬럼 이름 리스트, 행 리스트)
+ResultFactory = Callable[[str], tuple[list[str], list[list[str]]]]
+
+
+def _default_results(query: str) -> tuple[list[str], list[list[str]]]:
+    if "mart_update_status" in query:
+        return ["latest_date", "row_count", "country_count"], [["2025-01-02", "10", "3"]]
+    return ["value"], [["1"]]
+
+
+class FakeAthenaClient:
+    """start_query_execution/batch_get_query_execution/get_query_results만 흉내 내는 클라이언트"""
+
+    def __init__(self, results: ResultFactory = _default_results):
+        self._results = results
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._queries: dict[str, str] = {}
+        self.started: list[dict] = []
+
+    def start_query_execution(self, **params) -> dict:
+        with self._lock:
+            query_execution_id = f"query-{next(self._ids)}"
+            self._queries[query_execution_id] = params["QueryString"]
+            self.started.append(params)
+        return {"QueryExecutionId": query_execution_id}
+
+    def batch_get_query_execution(self, QueryExecutionIds: list[str]) -> dict:
+        return {
+            "QueryExecutions": [
+                {
+                    "QueryExecutionId": query_execution_id,
+                    "Status": {"State": "SUCCEEDED"},
+                    "StatementType": "DML",
+                    "Statistics": {"DataScannedInBytes": 0},
+                    "ResultConfiguration": {"OutputLocation": ""},
+                }
+                for query_execution_id in QueryExecutionIds
+            ]
+        }
+
+    def get_query_results(self, QueryExecutionId: str, **kwargs) -> dict:
+        columns, rows = self._results(self._queries[QueryExecutionId])
+        return {
+            "ResultSet": {
+                "Rows": [
+                    {"Data": [{"VarCharValue": name} for name in columns]},
+                    *({"Data": [{"VarCharValue": value} for value in row]} for row in rows),
+                ],
+                "ResultSetMetadata": {
+                    "ColumnInfo": [{"Name": name, "Type": "varchar"} for name in columns]
+                },
+            }
+        }
+
+
+def make_connection(client: FakeAthenaClient) -> AthenaConnection:
+    """대역 클라이언트를 쓰는 AthenaConnection (get_query_results 페이징, prepared statement 미사용)"""
+    conn = AthenaConnection()
+    conn._client = client
+    conn._fetch_mode = "api"
+    conn._use_prepared = False
+    return conn
@@ -0,0 +1,65 @@
+"""픽스처 연결 테스트 도우미
+
+테스트마다 마트 픽스처를 임시 디렉토리에 복사해 FixtureConnection을 만듭니다.
+버전 추적기와 최신 파티션은 연결 설정(경로)별로 프로세스 전역에 공유되므로,
+경로가 다른 연결을 쓰면 테스트끼리 서로 영향을 주지 않습니다.
+"""
+
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Optional
+
+from data.data_version import get_version_tracker
+from data.fixture_connection import FixtureConnection
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "marts"
+
+
+class CountingFixtureConnection(FixtureConnection):
+    """실제로 실행한 쿼리를 기록하고, 필요하면 실행을 멈추거나 실패시키는 픽스처 연결"""
+
+    def __init__(self, fixture_dir: str):
+        super().__init__(fixture_dir=fixture_dir, latency=None)
+        self.executed: list[str] = []
+        self.gate: Optional[threading.Event] = None
+        self.fail_with: Optional[Exception] = None
+        self._executed_lock = threading.Lock()
+
+    def _execute_many(self, queries: list[str]):
+        with self._executed_lock:
+            self.executed.extend(str(query) for query in queries)
+        if self.gate is not None:
+            self.gate.wait(timeout=10)
+        if self.fail_with is not None:
+            raise self.fail_with
+        return super()._execute_many(queries)
+
+    def executed_matching(self, text: str) -> list[str]:
+        """text가 들어간 실행 쿼리 목록 (버전 확인 쿼리 등을 빼고 셀 때 사용)"""
+        with self._executed_lock:
+            return [query for query in self.executed if text in query]
+
+    def publish_version(self, latest_date: str) -> str:
+        """mart_update_status.latest_date를 바꾸고 버전 추적기가 바로 감지하게 합니다."""
+        self._get_connection().execute(
+            f"UPDATE {self._schema}.mart_update_status SET latest_date = ?", [latest_date]
+        )
+        return get_version_tracker(self).refresh(self)
+
+
+class FixtureTestCase(unittest.TestCase):
+    """임시 픽스처 디렉토리와 캐시 디렉토리를 준비하는 테스트 기반 클래스"""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_path = Path(tmp_dir.name)
+        self.fixture_dir = self.tmp_path / "marts"
+        shutil.copytree(FIXTURE_DIR, self.fixture_dir)
+        self.cache_dir = self.tmp_path / "query_results"
+
+    def make_inner(self) -> CountingFixtureConnection:
+        return CountingFixtureConnection(str(self.fixture_dir))
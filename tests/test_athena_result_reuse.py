@@ -0,0 +1,59 @@
+"""Athena 결과 재사용(ResultReuseConfiguration) 요청 조건 테스트
+
+실행:
+    uv run python -m unittest discover tests
+"""
+
+import time
+import unittest
+
+from athena_stub import FakeAthenaClient, make_connection
+
+from data.data_version import DataVersionTracker
+
+
+def _reuse_config(params: dict):
+    return params.get("ResultReuseConfiguration", {}).get("ResultReuseByAgeConfiguration")
+
+
+class AthenaResultReuseTest(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeAthenaClient()
+        self.conn = make_connection(self.client)
+        self.conn._result_reuse_max_age = 1440
+
+    def test_no_reuse_before_data_version_is_confirmed(self):
+        self.conn._data_version_changed_at = None
+        self.conn.execute_query("SELECT 1")
+
+        self.assertIsNone(_reuse_config(self.client.started[-1]))
+
+    def test_reuse_window_is_bounded_by_time_since_version_change(self):
+        self.conn._data_version_changed_at = time.time() - 600 * 60
+        self.conn.execute_query("SELECT 1")
+
+        self.assertEqual(_reuse_config(self.client.started[-1])["MaxAgeInMinutes"], 600)
+
+    def test_reuse_results_false_opts_out(self):
+        self.conn._data_version_changed_at = time.time() - 600 * 60
+        self.conn.execute_many(["SELECT 1", "SELECT 2"], reuse_results=False)
+
+        self.assertEqual(len(self.client.started), 2)
+        for params in self.client.started:
+            self.assertNotIn("ResultReuseConfiguration", params)
+
+    def test_version_probe_never_requests_reuse(self):
+        self.conn._data_version_changed_at = time.time() - 600 * 60
+        tracker = DataVersionTracker(ttl=0)
+
+        self.assertEqual(tracker.refresh(self.conn), "2025-01-02")
+        self.assertEqual(tracker.get(self.conn), "2025-01-02")
+
+        probes = [p for p in self.client.started if "mart_update_status" in p["QueryString"]]
+        self.assertEqual(len(probes), 2)
+        for params in probes:
+            self.assertNotIn("ResultReuseConfiguration", params)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Athena S3 출력 CSV 결과 읽기 테스트
+
+S3 클라이언트를 botocore Stubber로 대체해 출력 CSV를 돌려주고,
+같은 결과를 get_query_results 경로로 읽었을 때와 값/타입이 같은지 확인합니다.
+
+실행:
+    uv run python -m unittest discover tests
+"""
+
+import io
+import unittest
+
+import pandas as pd
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
+from data.athena_connection import AthenaConnection
+
+OUTPUT_LOCATION = "s3://test-bucket/athena-results/query-1.csv"
+
+COLUMN_INFO = [
+    {"Name": "country_nm", "Type": "varchar"},
+    {"Name": "memo", "Type": "varchar"},
+    {"Name": "base_pr", "Type": "decimal"},
+    {"Name": "record_count", "Type": "bigint"},
+    {"Name": "base_dt", "Type": "date"},
+]
+
+# Athena 출력 형식: 값은 항상 따옴표로 감싸고, NULL은 따옴표 없는 빈 필드
+CSV_BODY = (
+    '"country_nm","memo","base_pr","record_count","base_dt"\n'
+    '"서울","","1234.5","3","2025-01-02"\n'
+    '"부산",,,,"2025-01-03"\n'
+    '"대구","a,""b""\nc","500","1",\n'
+).encode("utf-8")
+
+# 같은 결과의 get_query_results 행 (VarCharValue가 없으면 NULL)
+API_ROWS = [
+    ["서울", "", "1234.5", "3", "2025-01-02"],
+    ["부산", None, None, None, "2025-01-03"],
+    ["대구", 'a,"b"\nc', "500", "1", None],
+]
+
+
+def _api_response() -> dict:
+    header = {"Data": [{"VarCharValue": col["Name"]} for col in COLUMN_INFO]}
+    rows = [
+        {"Data": [{} if value is None else {"VarCharValue": value} for value in row]}
+        for row in API_ROWS
+    ]
+    return {
+        "ResultSet": {
+            "Rows": [header, *rows],
+            "ResultSetMetadata": {"ColumnInfo": COLUMN_INFO},
+        }
+    }
+
+
+class AthenaS3ResultTest(unittest.TestCase):
+    def setUp(self):
+        self.conn = AthenaConnection()
+        self.s3_stub = Stubber(self.conn._get_s3_client())
+        self.s3_stub.activate()
+        self.addCleanup(self.s3_stub.deactivate)
+
+    def _stub_object(self, ranges: list[tuple[int, int]] = ()):
+        self.s3_stub.add_response(
+            "head_object",
+            {"ContentLength": len(CSV_BODY)},
+            {"Bucket": "test-bucket", "Key": "athena-results/query-1.csv"},
+        )
+        for start, end in ranges or [(0, len(CSV_BODY) - 1)]:
+            chunk = CSV_BODY[start:end + 1]
+            params = {"Bucket": "test-bucket", "Key": "athena-results/query-1.csv"}
+            if ranges:
+                params["Range"] = f"bytes={start}-{end}"
+            self.s3_stub.add_response(
+                "get_object",
+                {"Body": StreamingBody(io.BytesIO(chunk), len(chunk))},
+                params,
+            )
+
+    def _fetch_from_api(self) -> pd.DataFrame:
+        client = self.conn._get_client()
+        with Stubber(client) as athena_stub:
+            athena_stub.add_response(
+                "get_query_results", _api_response(), {"QueryExecutionId": "query-1"}
+            )
+            return self.conn._fetch_results_from_api(client, "query-1")
+
+    def test_s3_csv_decodes_like_get_query_results(self):
+        self._stub_object()
+        df = self.conn._fetch_results_from_s3(OUTPUT_LOCATION, COLUMN_INFO)
+        self.s3_stub.assert_no_pending_responses()
+
+        pd.testing.assert_frame_equal(df, self._fetch_from_api())
+
+    def test_empty_string_and_null_are_distinct(self):
+        self._stub_object()
+        df = self.conn._fetch_results_from_s3(OUTPUT_LOCATION, COLUMN_INFO)
+
+        self.assertEqual(df["memo"].tolist(), ["", None, 'a,"b"\nc'])
+        self.assertEqual(str(df["record_count"].dtype), "Int64")
+        self.assertTrue(pd.isna(df.loc[1, "base_pr"]))
+        self.assertTrue(pd.isna(df.loc[2, "base_dt"]))
+
+    def test_ranged_reads_are_joined_in_order(self):
+        self.conn._s3_range_size = 16
+        self.conn._s3_max_workers = 1
+        ranges = [
+            (start, min(start + 16, len(CSV_BODY)) - 1)
+            for start in range(0, len(CSV_BODY), 16)
+        ]
+        self._stub_object(ranges)
+        df = self.conn._fetch_results_from_s3(OUTPUT_LOCATION, COLUMN_INFO)
+        self.s3_stub.assert_no_pending_responses()
+
+        pd.testing.assert_frame_equal(df, self._fetch_from_api())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""데이터 버전 기준 쿼리 결과 캐시(CachedConnection/QueryResultStore) 테스트
+
+마트 픽스처를 메모리 DuckDB로 올린 FixtureConnection을 감싸 실행합니다.
+duckdb가 필요합니다 (uv sync --extra local).
+
+실행:
+    uv run python -m unittest discover tests
+"""
+
+import unittest
+from datetime import date
+
+import pandas as pd
+from fixture_support import FixtureTestCase
+
+from data.query_cache import CachedConnection, QueryResultStore, _version_dirname
+from data.queries.region_queries import get_region_stats_query
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+TABLE = "team3_gold.mart_retail_region_comparison"
+
+
+def _category_query(category: str) -> str:
+    return (
+        f"SELECT item_nm, AVG(avg_price) AS avg_price FROM {TABLE} "
+        f"WHERE category_nm = '{category}' GROUP BY item_nm ORDER BY item_nm"
+    )
+
+
+@unittest.skipIf(duckdb is None, "duckdb가 설치되어 있지 않음")
+class QueryCacheTest(FixtureTestCase):
+    def setUp(self):
+        super().setUp()
+        self.inner = self.make_inner()
+        self.store = QueryResultStore(cache_dir=str(self.cache_dir))
+        self.conn = CachedConnection(self.inner, store=self.store, stale_while_revalidate=False)
+
+    def test_repeated_query_is_served_from_cache(self):
+        query = _category_query("과일류")
+        first = self.conn.execute_query(query)
+        second = self.conn.execute_query(query)
+
+        pd.testing.assert_frame_equal(first, second)
+        self.assertEqual(len(self.inner.executed_matching(TABLE)), 1)
+        self.assertEqual(second.attrs["data_version"], "2026-01-02")
+        self.assertEqual(self.conn.cache_stats()["hits"], 1)
+
+    def test_version_change_invalidates_cache(self):
+        query = _category_query("과일류")
+        self.conn.execute_query(query)
+        old_dir = self.cache_dir / _version_dirname("2026-01-02")
+        self.assertTrue(old_dir.is_dir())
+
+        self.assertEqual(self.inner.publish_version("2026-01-03"), "2026-01-03")
+        self.assertFalse(old_dir.exists())
+        self.assertEqual(self.store.stats()["entries"], 0)
+
+        df = self.conn.execute_query(query)
+        self.assertEqual(len(self.inner.executed_matching(TABLE)), 2)
+        self.assertEqual(df.attrs["data_version"], "2026-01-03")
+
+    def test_disk_hit_survives_process_restart(self):
+        query = _category_query("채소류")
+        expected = self.conn.execute_query(query)
+
+        # 같은 캐시 디렉토리를 쓰는 새 프로세스: 메모리 저장소와 연결을 모두 새로 생성
+        inner = self.make_inner()
+        store = QueryResultStore(cache_dir=str(self.cache_dir))
+        conn = CachedConnection(inner, store=store, stale_while_revalidate=False)
+        df = conn.execute_query(query)
+
+        pd.testing.assert_frame_equal(df, expected)
+        self.assertEqual(inner.executed_matching(TABLE), [])
+        self.assertEqual(store.stats()["disk_hits"], 1)
+
+        conn.execute_query(query)
+        self.assertEqual(store.stats()["hits"], 1)
+
+    def test_narrowed_spec_is_filtered_from_wider_result(self):
+        res_dt = date(2026, 1, 2)
+        wider = get_region_stats_query(date_filter=res_dt, conn=self.conn)
+        narrowed = get_region_stats_query(
+            date_filter=res_dt, category_filter="과일류", conn=self.conn
+        )
+        self.conn.execute_query(wider)
+
+        df = self.conn.execute_query(narrowed)
+
+        self.assertEqual(self.inner.executed_matching(TABLE), [str(wider)])
+        self.assertEqual(self.conn.cache_stats()["derived_hits"], 1)
+        direct = self.inner.execute_query(narrowed)
+        self.assertGreater(len(direct), 0)
+        pd.testing.assert_frame_equal(df, direct)
+        self.assertEqual(set(df["카테고리"]), {"과일류"})
+
+
+@unittest.skipIf(duckdb is None, "duckdb가 설치되어 있지 않음")
+class QueryResultStoreLimitTest(FixtureTestCase):
+    def setUp(self):
+        super().setUp()
+        inner = self.make_inner()
+        categories = ["과일류", "채소류", "축산물", "수산물"]
+        self.results = {
+            category: inner.execute_query(_category_query(category)) for category in categories
+        }
+
+    def _size(self, category: str) -> int:
+        return int(self.results[category].memory_usage(deep=True).sum())
+
+    def test_entry_limit_evicts_least_recently_used(self):
+        store = QueryResultStore(max_entries=2)
+        store.put("v1", "과일류", self.results["과일류"])
+        store.put("v1", "채소류", self.results["채소류"])
+        self.assertIsNotNone(store.get("v1", "과일류"))  # 과일류를 최근 사용으로 이동
+
+        store.put("v1", "축산물", self.results["축산물"])
+
+        self.assertIsNone(store.get("v1", "채소류"))
+        self.assertIsNotNone(store.get("v1", "과일류"))
+        self.assertIsNotNone(store.get("v1", "축산물"))
+        stats = store.stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["evictions"], 1)
+
+    def test_byte_limit_evicts_until_within_budget(self):
+        max_bytes = self._size("과일류") + self._size("채소류")
+        store = QueryResultStore(max_entries=100, max_bytes=max_bytes)
+        store.put("v1", "과일류", self.results["과일류"])
+        store.put("v1", "채소류", self.results["채소류"])
+        self.assertEqual(store.stats()["evictions"], 0)
+
+        store.put("v1", "축산물", self.results["축산물"])
+
+        stats = store.stats()
+        self.assertLessEqual(stats["memory_bytes"], max_bytes)
+        self.assertGreaterEqual(stats["evictions"], 1)
+        self.assertIsNone(store.get("v1", "과일류"))
+        self.assertIsNotNone(store.get("v1", "축산물"))
+
+    def test_oversized_result_is_still_kept_alone(self):
+        store = QueryResultStore(max_bytes=1)
+        store.put("v1", "과일류", self.results["과일류"])
+        store.put("v1", "채소류", self.results["채소류"])
+
+        self.assertEqual(store.stats()["entries"], 1)
+        self.assertIsNotNone(store.get("v1", "채소류"))
+
+
+if __name__ == "__main__":
+    unittest.main()
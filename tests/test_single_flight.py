@@ -0,0 +1,125 @@
+"""동일 쿼리 동시 실행 병합(SingleFlight) 테스트
+
+여러 스레드가 같은 키를 동시에 요청하도록 leader의 실행을 모든 waiter가
+합류할 때까지 붙잡아 둔 뒤 결과를 확인합니다.
+
+실행:
+    uv run python -m unittest discover tests
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from data.single_flight import SingleFlight
+
+KEY = "fixture|SELECT 1"
+
+
+class _Stop(BaseException):
+    """Streamlit StopException처럼 Exception이 아닌 실행 중단"""
+
+
+def _wait_for_waiters(flight: SingleFlight, key: str, count: int, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while flight.waiters(key) < count:
+        if time.monotonic() > deadline:
+            raise AssertionError(f"waiter {count}개가 합류하지 않음 (현재 {flight.waiters(key)}개)")
+        time.sleep(0.001)
+
+
+class SingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.flight = SingleFlight("test")
+        self.calls: list[list[str]] = []
+        self.calls_lock = threading.Lock()
+
+    def _run_concurrently(self, count: int, run) -> list:
+        """count개 스레드가 같은 키를 요청하고 결과(또는 예외)를 스레드 순서대로 반환합니다."""
+
+        def request():
+            try:
+                return self.flight.execute_many([KEY], ["SELECT 1"], run)[0]
+            except BaseException as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(request) for _ in range(count)]
+            return [future.result(timeout=10) for future in futures]
+
+    def _record(self, queries: list[str]):
+        with self.calls_lock:
+            self.calls.append(queries)
+            return len(self.calls)
+
+    def test_concurrent_identical_keys_execute_once(self):
+        count = 8
+
+        def run(queries):
+            self._record(queries)
+            _wait_for_waiters(self.flight, KEY, count - 1)
+            return [pd.DataFrame({"value": [1, 2, 3]})]
+
+        results = self._run_concurrently(count, run)
+
+        self.assertEqual(self.calls, [["SELECT 1"]])
+        for df in results:
+            pd.testing.assert_frame_equal(df, pd.DataFrame({"value": [1, 2, 3]}))
+        stats = self.flight.stats()
+        self.assertEqual(stats["executions"], 1)
+        self.assertEqual(stats["shared"], count - 1)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_abandoned_leader_is_retried_by_waiter(self):
+        def run(queries):
+            if self._record(queries) == 1:
+                _wait_for_waiters(self.flight, KEY, 1)
+                raise _Stop()
+            return [pd.DataFrame({"value": [1]})]
+
+        results = self._run_concurrently(2, run)
+
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(sum(isinstance(result, _Stop) for result in results), 1)
+        retried = [result for result in results if isinstance(result, pd.DataFrame)]
+        self.assertEqual(len(retried), 1)
+        self.assertEqual(retried[0]["value"].tolist(), [1])
+        self.assertEqual(self.flight.stats()["in_flight"], 0)
+
+    def test_leader_error_is_shared_without_retry(self):
+        def run(queries):
+            self._record(queries)
+            _wait_for_waiters(self.flight, KEY, 2)
+            raise ValueError("쿼리 실패")
+
+        results = self._run_concurrently(3, run)
+
+        self.assertEqual(len(self.calls), 1)
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+    def test_waiter_mutation_does_not_leak(self):
+        count = 4
+
+        def run(queries):
+            self._record(queries)
+            _wait_for_waiters(self.flight, KEY, count - 1)
+            return [pd.DataFrame({"value": [1, 2, 3]})]
+
+        results = self._run_concurrently(count, run)
+        self.assertEqual(len({id(df) for df in results}), count)
+
+        mutated, *others = results
+        mutated.loc[0, "value"] = 100
+        mutated["extra"] = "x"
+
+        for df in others:
+            self.assertEqual(df["value"].tolist(), [1, 2, 3])
+            self.assertNotIn("extra", df.columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
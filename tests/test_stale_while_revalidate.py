@@ -0,0 +1,138 @@
+"""CachedConnection stale-while-revalidate 모드 테스트
+
+새 데이터 버전을 게시한 뒤 이전 버전 결과를 즉시 돌려주면서 백그라운드 갱신이
+한 번만 실행되는지, 갱신 실패와 최대 stale 기간을 어떻게 처리하는지 확인합니다.
+duckdb가 필요합니다 (uv sync --extra local).
+
+실행:
+    uv run python -m unittest discover tests
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from fixture_support import FixtureTestCase
+
+from data.query_cache import CachedConnection, QueryResultStore, is_refreshing
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+TABLE = "team3_gold.mart_retail_region_comparison"
+QUERY = f"SELECT category_nm, COUNT(*) AS cnt FROM {TABLE} GROUP BY category_nm ORDER BY category_nm"
+
+
+def _wait_until(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("조건을 기다리다 시간 초과")
+        time.sleep(0.005)
+
+
+@unittest.skipIf(duckdb is None, "duckdb가 설치되어 있지 않음")
+class StaleWhileRevalidateTest(FixtureTestCase):
+    def setUp(self):
+        super().setUp()
+        self.inner = self.make_inner()
+        self.store = QueryResultStore()
+        self.conn = self._make_conn(max_stale_age=3600)
+
+        self.expected = self.conn.execute_query(QUERY)
+        self.inner.publish_version("2026-01-03")
+
+    def _make_conn(self, max_stale_age: float) -> CachedConnection:
+        return CachedConnection(
+            self.inner,
+            store=self.store,
+            stale_while_revalidate=True,
+            max_stale_age=max_stale_age,
+            stale_limits={},
+        )
+
+    def _executions(self) -> int:
+        return len(self.inner.executed_matching(TABLE))
+
+    def _wait_for_refresh(self, conn: CachedConnection):
+        _wait_until(lambda: conn.cache_stats()["refreshing"] == 0)
+
+    def test_stale_entry_served_while_single_refresh_runs(self):
+        gate = threading.Event()
+        self.inner.gate = gate
+        self.addCleanup(gate.set)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(lambda _: self.conn.execute_query(QUERY), range(6)))
+
+        for df in results:
+            self.assertTrue(is_refreshing(df))
+            self.assertEqual(df.attrs["stale_version"], "2026-01-02")
+            self.assertEqual(df["cnt"].tolist(), self.expected["cnt"].tolist())
+
+        # 갱신 쿼리 하나만 실행 중 (처음 조회 1건 + 갱신 1건)
+        _wait_until(lambda: self._executions() == 2)
+        self.assertTrue(is_refreshing(self.conn.execute_query(QUERY)))
+        self.assertEqual(self._executions(), 2)
+        self.assertEqual(self.conn.cache_stats()["refreshing"], 1)
+
+        gate.set()
+        self._wait_for_refresh(self.conn)
+
+        df = self.conn.execute_query(QUERY)
+        self.assertFalse(is_refreshing(df))
+        self.assertEqual(df.attrs["data_version"], "2026-01-03")
+        self.assertEqual(self._executions(), 2)
+        stats = self.conn.cache_stats()
+        self.assertEqual(stats["refreshes"], 1)
+        self.assertEqual(stats["refresh_failures"], 0)
+
+    def test_failed_refresh_keeps_stale_entry(self):
+        self.inner.fail_with = RuntimeError("Athena 일시 오류")
+
+        df = self.conn.execute_query(QUERY)
+        self.assertTrue(is_refreshing(df))
+        self._wait_for_refresh(self.conn)
+
+        stats = self.conn.cache_stats()
+        self.assertEqual(stats["refresh_failures"], 1)
+        self.assertEqual(stats["refreshes"], 0)
+        self.assertEqual(stats["stale_entries"], 1)
+
+        # 다음 요청도 이전 버전 결과를 받고, 갱신을 다시 시도
+        self.inner.fail_with = None
+        df = self.conn.execute_query(QUERY)
+        self.assertTrue(is_refreshing(df))
+        self._wait_for_refresh(self.conn)
+
+        df = self.conn.execute_query(QUERY)
+        self.assertFalse(is_refreshing(df))
+        self.assertEqual(df.attrs["data_version"], "2026-01-03")
+        self.assertEqual(self.conn.cache_stats()["refreshes"], 1)
+
+    def test_max_stale_age_is_enforced(self):
+        conn = self._make_conn(max_stale_age=60)
+        # 이전 버전 결과가 2분 전에 무효화된 것으로 조정
+        for key, (version, df, superseded_at) in list(self.store._stale.items()):
+            self.store._stale[key] = (version, df, superseded_at - 120)
+
+        df = conn.execute_query(QUERY)
+
+        self.assertFalse(is_refreshing(df))
+        self.assertEqual(df.attrs["data_version"], "2026-01-03")
+        self.assertEqual(self._executions(), 2)
+        self.assertEqual(conn.cache_stats()["refreshes"], 0)
+
+    def test_allow_stale_false_queries_synchronously(self):
+        df = self.conn.execute_query(QUERY, allow_stale=False)
+
+        self.assertFalse(is_refreshing(df))
+        self.assertEqual(df.attrs["data_version"], "2026-01-03")
+        self.assertEqual(self.conn.cache_stats()["refreshing"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
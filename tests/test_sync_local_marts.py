@@ -0,0 +1,59 @@
+"""로컬 DuckDB 마트 동기화 테스트
+
+Athena 대역 클라이언트에서 마트를 복제하고, 동기화 쿼리가 결과 재사용을
+요청하지 않는지 확인합니다. duckdb가 필요합니다 (uv sync --extra local).
+
+실행:
+    uv run python -m unittest discover tests
+"""
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from athena_stub import FakeAthenaClient, make_connection
+
+from data.local_connection import MART_TABLES, read_local_version, sync_local_marts
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+
+@unittest.skipIf(duckdb is None, "duckdb가 설치되어 있지 않음")
+class SyncLocalMartsTest(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeAthenaClient()
+        self.source = make_connection(self.client)
+        # 데이터 버전을 10시간 전에 확인한 프로세스 (일반 쿼리라면 재사용을 요청하는 상태)
+        self.source._result_reuse_max_age = 1440
+        self.source._data_version_changed_at = time.time() - 600 * 60
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = str(Path(tmp_dir.name) / "marts.duckdb")
+
+    def test_sync_never_requests_result_reuse(self):
+        self.assertTrue(sync_local_marts(self.source, path=self.path, schema="team3_gold"))
+
+        # 버전 확인 1건 + 마트 복제 len(MART_TABLES)건
+        self.assertEqual(len(self.client.started), 1 + len(MART_TABLES))
+        for params in self.client.started:
+            self.assertNotIn("ResultReuseConfiguration", params)
+
+        self.assertEqual(read_local_version(self.path, "team3_gold"), "2025-01-02")
+
+    def test_sync_skips_when_local_version_is_current(self):
+        sync_local_marts(self.source, path=self.path, schema="team3_gold")
+        started = len(self.client.started)
+
+        self.assertFalse(sync_local_marts(self.source, path=self.path, schema="team3_gold"))
+        # 버전 확인만 다시 실행 (재사용 없이)
+        self.assertEqual(len(self.client.started), started + 1)
+        self.assertNotIn("ResultReuseConfiguration", self.client.started[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()